@@ -76,6 +76,11 @@ DATABASES = {
     }
 }
 
+# Username-or-email logins with a single lookup and a single password hash
+AUTHENTICATION_BACKENDS = [
+    'core.backends.UsernameOrEmailBackend',
+]
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -116,7 +121,7 @@ REST_FRAMEWORK = {
     'PAGE_SIZE': 20,
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'core.authentication.CachedTokenAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
@@ -146,4 +151,39 @@ DATABASES = {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
     }
-}
\ No newline at end of file
+}
+# Cache Configuration
+# Local memory by default, which is private to each worker process: writes
+# only invalidate the handling process's entries, so other processes serve
+# theirs for up to RESPONSE_CACHE_LOCAL_TIMEOUT seconds. Set CACHE_BACKEND to
+# django.core.cache.backends.filebased.FileBasedCache (LOCATION = directory)
+# or django.core.cache.backends.redis.RedisCache (LOCATION = redis:// URL)
+# to share cached responses and invalidations between processes.
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='alumni-partner-db'),
+    }
+}
+RESPONSE_CACHE_ALIAS = 'default'
+RESPONSE_CACHE_TIMEOUT = config('RESPONSE_CACHE_TIMEOUT', default=300, cast=int)
+RESPONSE_CACHE_LOCAL_TIMEOUT = config('RESPONSE_CACHE_LOCAL_TIMEOUT', default=30, cast=int)
+
+# Token authentication cache (see core/authentication.py): resolved users are
+# kept briefly in a per-process LRU and, when CACHE_BACKEND is shared between
+# processes, in that cache for AUTH_TOKEN_CACHE_TIMEOUT seconds
+AUTH_TOKEN_CACHE_TIMEOUT = config('AUTH_TOKEN_CACHE_TIMEOUT', default=300, cast=int)
+AUTH_TOKEN_LOCAL_TTL = config('AUTH_TOKEN_LOCAL_TTL', default=10, cast=int)
+AUTH_TOKEN_LOCAL_CACHE_SIZE = config('AUTH_TOKEN_LOCAL_CACHE_SIZE', default=1024, cast=int)
+
+# Report Jobs (processed by `manage.py run_report_worker`)
+REPORT_JOB_TIMEOUT = config('REPORT_JOB_TIMEOUT', default=600, cast=int)
+REPORT_JOB_MAX_ATTEMPTS = config('REPORT_JOB_MAX_ATTEMPTS', default=3, cast=int)
+
+# Rendered report PDFs, cached on disk by content hash (see core/artifacts.py)
+REPORT_ARTIFACT_ROOT = config('REPORT_ARTIFACT_ROOT', default=str(BASE_DIR / 'report_artifacts'))
+
+# Audit trail: events older than AUDIT_RETENTION_DAYS are moved to monthly
+# files under AUDIT_ARCHIVE_ROOT by `manage.py archive_audit_events`
+AUDIT_RETENTION_DAYS = config('AUDIT_RETENTION_DAYS', default=365, cast=int)
+AUDIT_ARCHIVE_ROOT = config('AUDIT_ARCHIVE_ROOT', default=str(BASE_DIR / 'audit_archive'))
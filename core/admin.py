@@ -3,9 +3,10 @@ from django.contrib.auth.models import User
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.html import format_html
 from django.urls import reverse
-from django.db.models import Count, Q
 from django.utils import timezone
-from .models import Alumni, Partner, Engagement, Report
+from . import audit
+from .pagination import EstimatedCountPaginator
+from .models import Alumni, Partner, Engagement, Report, ReportJob, AuditEvent
 import csv
 from django.http import HttpResponse
 
@@ -15,38 +16,28 @@ class AuditLog(admin.ModelAdmin):
     """Base class for models with audit trail"""
     
     def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        name = obj.__class__.__name__
         if change:
             # Log the change
-            changes = []
-            for field in form.changed_data:
-                changes.append(f"{field}: {form.initial.get(field)} → {form.cleaned_data.get(field)}")
-            
-            # Create audit log entry in Report model
-            Report.objects.create(
-                title=f"{obj.__class__.__name__} Updated: {obj}",
-                report_type='audit',
-                description=f"Modified by {request.user.username}\nChanges: {', '.join(changes)}",
-                generated_by=request.user
+            changes = [
+                f"{field}: {form.initial.get(field)} → {form.cleaned_data.get(field)}"
+                for field in form.changed_data
+            ]
+            audit.record(
+                request.user, 'update', f"{name} Updated: {obj}", obj=obj,
+                detail=f"Modified by {request.user.username}\nChanges: {', '.join(changes)}",
+                changes=audit.diff(form),
             )
         else:
             # Log creation
-            Report.objects.create(
-                title=f"{obj.__class__.__name__} Created: {obj}",
-                report_type='audit',
-                description=f"Created by {request.user.username}",
-                generated_by=request.user
-            )
-        
-        super().save_model(request, obj, form, change)
+            audit.record(request.user, 'create', f"{name} Created: {obj}", obj=obj,
+                         detail=f"Created by {request.user.username}")
     
     def delete_model(self, request, obj):
-        # Log deletion
-        Report.objects.create(
-            title=f"{obj.__class__.__name__} Deleted: {obj}",
-            report_type='audit',
-            description=f"Deleted by {request.user.username}",
-            generated_by=request.user
-        )
+        # Log deletion (before the primary key is cleared)
+        audit.record(request.user, 'delete', f"{obj.__class__.__name__} Deleted: {obj}", obj=obj,
+                     detail=f"Deleted by {request.user.username}")
         super().delete_model(request, obj)
 
 
@@ -58,6 +49,8 @@ class AlumniAdmin(AuditLog):
     ordering = ('-created_at',)
     date_hierarchy = 'created_at'
     list_per_page = 50
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     list_editable = ('status',)
     actions = ['mark_as_active', 'mark_as_inactive', 'mark_as_lost_contact', 'export_to_csv']
     autocomplete_fields = ['user']
@@ -81,7 +74,7 @@ class AlumniAdmin(AuditLog):
         }),
     )
     
-    readonly_fields = ('created_at', 'updated_at')
+    readonly_fields = ('created_at', 'updated_at', 'last_engagement')
     
     def full_name(self, obj):
         return f"{obj.first_name} {obj.last_name}"
@@ -89,14 +82,10 @@ class AlumniAdmin(AuditLog):
     full_name.admin_order_field = 'first_name'
     
     def engagement_count(self, obj):
-        count = obj.engagements.count()
         url = reverse('admin:core_engagement_changelist') + f'?alumni__id__exact={obj.id}'
-        return format_html('<a href="{}">{} engagements</a>', url, count)
+        return format_html('<a href="{}">{} engagements</a>', url, obj.engagement_count)
     engagement_count.short_description = 'Engagements'
-    
-    def get_queryset(self, request):
-        qs = super().get_queryset(request)
-        return qs.annotate(engagement_count=Count('engagements'))
+    engagement_count.admin_order_field = 'engagement_count'
     
     # Bulk Actions
     @admin.action(description='Mark selected alumni as Active')
@@ -141,6 +130,8 @@ class PartnerAdmin(AuditLog):
     ordering = ('-created_at',)
     date_hierarchy = 'created_at'
     list_per_page = 50
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     list_editable = ('engagement_level',)
     actions = ['upgrade_to_gold', 'downgrade_to_prospective', 'export_to_csv']
     
@@ -166,17 +157,13 @@ class PartnerAdmin(AuditLog):
         }),
     )
     
-    readonly_fields = ('created_at', 'updated_at')
+    readonly_fields = ('created_at', 'updated_at', 'last_engagement')
     
     def engagement_count(self, obj):
-        count = obj.engagements.count()
         url = reverse('admin:core_engagement_changelist') + f'?partner__id__exact={obj.id}'
-        return format_html('<a href="{}">{} engagements</a>', url, count)
+        return format_html('<a href="{}">{} engagements</a>', url, obj.engagement_count)
     engagement_count.short_description = 'Engagements'
-    
-    def get_queryset(self, request):
-        qs = super().get_queryset(request)
-        return qs.annotate(engagement_count=Count('engagements'))
+    engagement_count.admin_order_field = 'engagement_count'
     
     # Bulk Actions
     @admin.action(description='Upgrade selected partners to Gold')
@@ -216,6 +203,9 @@ class EngagementAdmin(AuditLog):
     ordering = ('-engagement_date',)
     date_hierarchy = 'engagement_date'
     list_per_page = 50
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+    list_select_related = ('alumni', 'partner', 'created_by')
     actions = ['export_to_csv']
     autocomplete_fields = ['alumni', 'partner']
     
@@ -227,12 +217,17 @@ class EngagementAdmin(AuditLog):
             'fields': ('description', 'notes')
         }),
         ('Metadata', {
-            'fields': ('created_at', 'updated_at'),
+            'fields': ('created_by', 'created_at', 'updated_at'),
             'classes': ('collapse',)
         }),
     )
     
-    readonly_fields = ('created_at', 'updated_at')
+    readonly_fields = ('created_by', 'created_at', 'updated_at')
+    
+    def save_model(self, request, obj, form, change):
+        if not change:
+            obj.created_by = request.user
+        super().save_model(request, obj, form, change)
     
     def alumni_link(self, obj):
         url = reverse('admin:core_alumni_change', args=[obj.alumni.id])
@@ -245,15 +240,9 @@ class EngagementAdmin(AuditLog):
     partner_link.short_description = 'Partner'
     
     def created_by_user(self, obj):
-        # Try to find who created this in audit logs
-        audit = Report.objects.filter(
-            title__contains=f"Engagement Created: {obj}",
-            report_type='audit'
-        ).first()
-        if audit:
-            return audit.generated_by.username
-        return '-'
+        return obj.created_by.username if obj.created_by else '-'
     created_by_user.short_description = 'Created By'
+    created_by_user.admin_order_field = 'created_by__username'
     
     @admin.action(description='Export selected engagements to CSV')
     def export_to_csv(self, request, queryset):
@@ -263,7 +252,7 @@ class EngagementAdmin(AuditLog):
         writer = csv.writer(response)
         writer.writerow(['Alumni', 'Partner', 'Type', 'Date', 'Description', 'Notes'])
         
-        for engagement in queryset:
+        for engagement in queryset.select_related('alumni', 'partner'):
             writer.writerow([
                 f"{engagement.alumni.first_name} {engagement.alumni.last_name}",
                 engagement.partner.name,
@@ -309,6 +298,49 @@ class ReportAdmin(admin.ModelAdmin):
         return False
 
 
+@admin.register(ReportJob)
+class ReportJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'report_type', 'output', 'status', 'requested_by', 'attempts', 'created_at', 'finished_at')
+    list_filter = ('status', 'report_type', 'output')
+    list_select_related = ('requested_by',)
+    ordering = ('-created_at',)
+    list_per_page = 100
+    readonly_fields = (
+        'report_type', 'output', 'params', 'report', 'error', 'attempts', 'worker',
+        'requested_by', 'created_at', 'started_at', 'finished_at',
+    )
+    
+    def has_add_permission(self, request):
+        # Jobs are queued through the report API
+        return False
+
+
+@admin.register(AuditEvent)
+class AuditEventAdmin(admin.ModelAdmin):
+    list_display = ('created_at', 'actor_username', 'action', 'object_type', 'object_id', 'summary')
+    list_filter = ('action', 'object_type')
+    search_fields = ('summary', 'actor_username', 'object_id')
+    ordering = ('-created_at',)
+    date_hierarchy = 'created_at'
+    list_per_page = 100
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+    readonly_fields = (
+        'created_at', 'actor', 'actor_username', 'action', 'object_type', 'object_id',
+        'summary', 'detail', 'changes',
+    )
+    
+    # The audit trail is append-only
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+    
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
 # Enhanced User Management
 class AlumniInline(admin.StackedInline):
     model = Alumni
@@ -333,13 +365,10 @@ class CustomUserAdmin(BaseUserAdmin):
         self.message_user(request, f'{updated} users activated.')
         
         # Log the action
-        for user in queryset:
-            Report.objects.create(
-                title=f"User Activated: {user.username}",
-                report_type='audit',
-                description=f"Activated by {request.user.username}",
-                generated_by=request.user
-            )
+        with audit.buffered():
+            for user in queryset:
+                audit.record(request.user, 'update', f"User Activated: {user.username}", obj=user,
+                             detail=f"Activated by {request.user.username}")
     
     @admin.action(description='Deactivate selected users')
     def deactivate_users(self, request, queryset):
@@ -347,13 +376,10 @@ class CustomUserAdmin(BaseUserAdmin):
         self.message_user(request, f'{updated} users deactivated.')
         
         # Log the action
-        for user in queryset:
-            Report.objects.create(
-                title=f"User Deactivated: {user.username}",
-                report_type='audit',
-                description=f"Deactivated by {request.user.username}",
-                generated_by=request.user
-            )
+        with audit.buffered():
+            for user in queryset:
+                audit.record(request.user, 'update', f"User Deactivated: {user.username}", obj=user,
+                             detail=f"Deactivated by {request.user.username}")
     
     @admin.action(description='Grant staff status to selected users')
     def make_staff(self, request, queryset):
@@ -361,13 +387,10 @@ class CustomUserAdmin(BaseUserAdmin):
         self.message_user(request, f'{updated} users granted staff status.')
         
         # Log the action
-        for user in queryset:
-            Report.objects.create(
-                title=f"User Granted Staff Status: {user.username}",
-                report_type='audit',
-                description=f"Modified by {request.user.username}",
-                generated_by=request.user
-            )
+        with audit.buffered():
+            for user in queryset:
+                audit.record(request.user, 'update', f"User Granted Staff Status: {user.username}", obj=user,
+                             detail=f"Modified by {request.user.username}")
 
 
 # Unregister the default User admin and register custom one
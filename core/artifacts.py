@@ -0,0 +1,102 @@
+"""On-disk cache of rendered report PDFs.
+
+A report's data never changes after it is generated, so its PDF is rendered
+once and stored under REPORT_ARTIFACT_ROOT, named by a hash of everything
+the renderer reads (report id, type, title, creation time and data) plus
+PDF_TEMPLATE_VERSION. Stored ReportRows are covered by the report id, since
+they are written once when the report is built. The hash doubles as the
+download's ETag. Bump PDF_TEMPLATE_VERSION whenever core.pdf output
+changes; old artifacts are then simply never read again and can be removed
+with `manage.py clear_report_artifacts`.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from . import pdf
+
+
+PDF_TEMPLATE_VERSION = 2
+
+
+def root():
+    return Path(settings.REPORT_ARTIFACT_ROOT)
+
+
+def fingerprint(report):
+    """Content hash of the inputs that determine a report's PDF"""
+    payload = json.dumps(
+        {
+            'version': PDF_TEMPLATE_VERSION,
+            'report_id': report.pk,
+            'report_type': report.report_type,
+            'title': report.title,
+            'created_at': report.created_at,
+            'data': report.data,
+        },
+        cls=DjangoJSONEncoder,
+        sort_keys=True,
+        separators=(',', ':'),
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def path_for(digest):
+    return root() / digest[:2] / f"{digest}.pdf"
+
+
+def _render(report, path):
+    """Render to a temporary file, then rename it into place (readers never see a partial PDF)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as handle:
+            rendered = pdf.render_report(report, handle)
+        if rendered:
+            os.replace(tmp, path)
+            return True
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    os.unlink(tmp)
+    return False
+
+
+def get_or_render(report, digest=None):
+    """Return the path of the report's PDF, rendering it on first use.
+
+    Returns None when the PDF cannot be rendered (e.g. reportlab missing).
+    """
+    digest = digest or fingerprint(report)
+    path = path_for(digest)
+    if not path.exists() and not _render(report, path):
+        return None
+    return path
+
+
+def open_pdf(report, digest=None, attempts=3):
+    """Open the report's PDF for reading, rendering it when it is missing.
+
+    `clear_report_artifacts` may remove the file (or its directory) at any
+    moment, including between rendering and opening, so a missing file is
+    rendered again. Returns None when the PDF cannot be rendered.
+    """
+    digest = digest or fingerprint(report)
+    path = path_for(digest)
+    for _ in range(attempts):
+        try:
+            return open(path, 'rb')
+        except FileNotFoundError:
+            pass
+        try:
+            if not _render(report, path):
+                return None
+        except FileNotFoundError:
+            # The directory was removed while rendering
+            continue
+    return None
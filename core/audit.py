@@ -0,0 +1,129 @@
+"""Audit trail writes.
+
+Admin views and admin actions call `record()`. Inside a `buffered()` block
+events are collected and written with one bulk INSERT when the block exits
+cleanly, so an action touching many objects costs one query instead of one
+per object. Old events are moved to monthly archive files with
+`manage.py archive_audit_events`.
+"""
+import gzip
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+from .models import AuditEvent
+
+
+AUDIT_BATCH_SIZE = 1000
+
+_buffer = ContextVar('audit_buffer', default=None)
+
+
+def _jsonable(value):
+    if isinstance(value, models.Model):
+        return value.pk
+    if isinstance(value, (models.QuerySet, list, tuple, set)):
+        return [_jsonable(item) for item in value]
+    return value
+
+
+def diff(form):
+    """{field: [old, new]} for the changed fields of a bound ModelForm"""
+    return {
+        name: [_jsonable(form.initial.get(name)), _jsonable(form.cleaned_data.get(name))]
+        for name in form.changed_data
+    }
+
+
+def event(actor, action, summary, obj=None, detail='', changes=None, object_type='', object_id=''):
+    """Build (without saving) an AuditEvent for `obj` or an explicit object type/id"""
+    if actor is not None and not actor.is_authenticated:
+        actor = None
+    if obj is not None:
+        object_type = obj._meta.model_name
+        object_id = obj.pk
+    return AuditEvent(
+        actor=actor,
+        actor_username=actor.get_username() if actor is not None else '',
+        action=action,
+        object_type=object_type,
+        object_id='' if object_id in (None, '') else str(object_id),
+        summary=summary[:255],
+        detail=detail,
+        changes=changes or {},
+    )
+
+
+def record(actor, action, summary, **fields):
+    """Write an audit event now, or queue it when inside `buffered()`"""
+    audit_event = event(actor, action, summary, **fields)
+    pending = _buffer.get()
+    if pending is None:
+        audit_event.save()
+    else:
+        pending.append(audit_event)
+    return audit_event
+
+
+@contextmanager
+def buffered():
+    """Collect the events recorded in this block and bulk insert them on exit.
+
+    Nested blocks join the outermost one. Nothing is written if the block
+    raises, since the audited change did not complete either.
+    """
+    if _buffer.get() is not None:
+        yield
+        return
+    pending = []
+    token = _buffer.set(pending)
+    try:
+        yield
+    finally:
+        _buffer.reset(token)
+    if pending:
+        AuditEvent.objects.bulk_create(pending, batch_size=AUDIT_BATCH_SIZE)
+
+
+ARCHIVE_FIELDS = [
+    'id', 'created_at', 'actor_id', 'actor_username', 'action',
+    'object_type', 'object_id', 'summary', 'detail', 'changes',
+]
+
+
+def archive_root():
+    return Path(settings.AUDIT_ARCHIVE_ROOT)
+
+
+def archive(before, batch_size=AUDIT_BATCH_SIZE):
+    """Move events created before `before` into monthly gzipped JSON-lines files.
+
+    Events are appended to `audit-YYYY-MM.jsonl.gz` under AUDIT_ARCHIVE_ROOT
+    and then deleted, oldest first, one batch at a time. Returns the number
+    of events archived.
+    """
+    root = archive_root()
+    root.mkdir(parents=True, exist_ok=True)
+    archived = 0
+    while True:
+        batch = list(
+            AuditEvent.objects.filter(created_at__lt=before)
+            .order_by('created_at', 'pk').values(*ARCHIVE_FIELDS)[:batch_size]
+        )
+        if not batch:
+            return archived
+        by_month = {}
+        for row in batch:
+            by_month.setdefault(row['created_at'].strftime('%Y-%m'), []).append(row)
+        for month, rows in by_month.items():
+            # gzip files may hold several members, so appending is safe
+            with gzip.open(root / f"audit-{month}.jsonl.gz", 'at', encoding='utf-8') as handle:
+                for row in rows:
+                    handle.write(json.dumps(row, cls=DjangoJSONEncoder) + '\n')
+        AuditEvent.objects.filter(pk__in=[row['id'] for row in batch]).delete()
+        archived += len(batch)
@@ -11,6 +11,7 @@ from .auth_serializers import (
     UserProfileSerializer,
     AlumniProfileSerializer
 )
+from .authentication import alumni_profile, user_from_header
 from .models import Alumni
 
 
@@ -48,38 +49,8 @@ def alumni_login(request):
         username = serializer.validated_data['username'].strip()
         password = serializer.validated_data['password']
         
-        # Allow login with email or username
-        user = authenticate(username=username, password=password)
-        if user is None:
-            try:
-                username_user = User.objects.get(username__iexact=username)
-                user = authenticate(username=username_user.username, password=password)
-            except User.DoesNotExist:
-                user = None
-
-        if user is None and '@' in username:
-            try:
-                email_user = User.objects.get(email__iexact=username)
-                user = authenticate(username=email_user.username, password=password)
-            except User.DoesNotExist:
-                user = None
-
-        if user is None:
-            password_trimmed = password.strip()
-            if password_trimmed:
-                try:
-                    fallback_user = User.objects.get(username__iexact=username)
-                except User.DoesNotExist:
-                    fallback_user = None
-
-                if fallback_user is None and '@' in username:
-                    try:
-                        fallback_user = User.objects.get(email__iexact=username)
-                    except User.DoesNotExist:
-                        fallback_user = None
-
-                if fallback_user and fallback_user.is_active and fallback_user.check_password(password_trimmed):
-                    user = fallback_user
+        # Username (any case) or email; see core.backends.UsernameOrEmailBackend
+        user = authenticate(request, username=username, password=password)
         
         if user is not None:
             login(request, user)
@@ -106,6 +77,9 @@ def alumni_login(request):
 @permission_classes([AllowAny])
 def alumni_logout(request):
     """Logout alumni and delete token"""
+    if request.auth is not None:
+        # Deleting the token also evicts it from the authentication caches
+        Token.objects.filter(key=request.auth.key).delete()
     if request.user.is_authenticated:
         logout(request)
 
@@ -118,18 +92,12 @@ def alumni_logout(request):
 def current_user(request):
     """Get current authenticated user details"""
     # Resolve user with token auth taking priority over session
-    user = request.user
-    auth_header = request.META.get('HTTP_AUTHORIZATION', '')
-    if auth_header.startswith('Token '):
-        token_key = auth_header.split(' ')[1]
-        try:
-            token = Token.objects.get(key=token_key)
-            user = token.user
-        except Token.DoesNotExist:
-            user = None
+    user = user_from_header(request)
+    if user is None:
+        user = request.user
 
-    if user is not None and user.is_authenticated:
-        alumni = Alumni.objects.filter(user=user).first()
+    if user and user.is_authenticated:
+        alumni = alumni_profile(user)
 
         return Response({
             'user': UserProfileSerializer(user).data,
@@ -0,0 +1,182 @@
+"""Token authentication backed by a two-level cache.
+
+DRF's TokenAuthentication reads the token and its user from the database on
+every request. CachedTokenAuthentication keeps the resolved user (with its
+alumni profile already loaded, so `alumni_profile()` costs no query) in a
+small per-process LRU and, when the configured cache is shared between
+processes (file, Redis, ...), in that cache too. A miss costs one query
+(token + user + profile via select_related).
+
+Entries are evicted from the shared cache and this process's LRU whenever
+the user, their token or their alumni profile is saved or deleted (see
+core.signals), which covers logout, password changes and deactivation.
+Other processes may keep serving their LRU copy for up to
+AUTH_TOKEN_LOCAL_TTL seconds. A process-local cache such as the default
+LocMemCache is never used as the second level, since other processes would
+not see its evictions.
+"""
+import hashlib
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+from .models import Alumni
+from .response_cache import KEY_PREFIX, is_shared
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def _shared_cache():
+    """The cross-process cache, or None when the configured one is private to this process"""
+    alias = _setting('RESPONSE_CACHE_ALIAS', 'default')
+    return caches[alias] if is_shared(alias) else None
+
+
+def _cache_key(token_key):
+    # Never use the raw token as a cache key
+    return f"{KEY_PREFIX}:auth-token:{hashlib.sha256(token_key.encode('utf-8')).hexdigest()}"
+
+
+class _LocalCache:
+    """Thread-safe LRU of token key -> (expiry, pickled user).
+
+    Users are stored pickled so every request gets its own instance and a
+    view mutating request.user cannot leak changes into other requests.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return pickle.loads(entry[1])
+
+    def set(self, key, user):
+        data = pickle.dumps(user, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + _setting('AUTH_TOKEN_LOCAL_TTL', 10), data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > _setting('AUTH_TOKEN_LOCAL_CACHE_SIZE', 1024):
+                self._entries.popitem(last=False)
+
+    def discard(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_local = _LocalCache()
+
+
+def alumni_profile(user):
+    """The user's Alumni profile or None, without a query when it was loaded with the user"""
+    if user is None or not user.is_authenticated:
+        return None
+    try:
+        return user.alumni_profile
+    except Alumni.DoesNotExist:
+        return None
+
+
+def _evict_now(token_keys):
+    token_keys = [key for key in token_keys if key]
+    for key in token_keys:
+        _local.discard(key)
+    shared = _shared_cache()
+    if shared is not None:
+        shared.delete_many([_cache_key(key) for key in token_keys])
+
+
+def evict(*token_keys, user_id=None, using=None):
+    """Drop cached authentication for the given tokens and/or every token of `user_id`"""
+    token_keys = list(token_keys)
+    if user_id is not None:
+        token_keys += list(Token.objects.using(using).filter(user_id=user_id).values_list('key', flat=True))
+    if not token_keys:
+        return
+    _evict_now(token_keys)
+    # Again after commit, in case a concurrent request re-cached the old row
+    transaction.on_commit(partial(_evict_now, token_keys), using=using)
+
+
+def get_user(token_key):
+    """Resolve a token key to its user through the caches; None for unknown tokens"""
+    user = _local.get(token_key)
+    if user is not None:
+        return user
+
+    shared = _shared_cache()
+    cache_key = _cache_key(token_key)
+    user = shared.get(cache_key) if shared is not None else None
+    if user is None:
+        token = (
+            Token.objects.select_related('user', 'user__alumni_profile')
+            .filter(key=token_key).first()
+        )
+        if token is None:
+            return None
+        user = token.user
+        alumni_profile(user)  # make sure the (possibly empty) profile is cached on the user
+        if shared is not None:
+            shared.set(cache_key, user, _setting('AUTH_TOKEN_CACHE_TIMEOUT', 300))
+    _local.set(token_key, user)
+    return user
+
+
+def user_from_header(request):
+    """User named by an `Authorization: Token <key>` header on a plain Django request.
+
+    Returns None when the header is absent and False when the token is
+    unknown or its user inactive.
+    """
+    auth_header = request.META.get('HTTP_AUTHORIZATION', '')
+    if not auth_header.startswith('Token '):
+        return None
+    parts = auth_header.split()
+    if len(parts) != 2:
+        return False
+    user = get_user(parts[1])
+    if user is None or not user.is_active:
+        return False
+    return user
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """TokenAuthentication that resolves tokens through core.authentication's caches"""
+
+    def authenticate(self, request):
+        result = super().authenticate(request)
+        if result is not None:
+            request.alumni = alumni_profile(result[0])
+        return result
+
+    def authenticate_credentials(self, key):
+        user = get_user(key)
+        if user is None:
+            raise exceptions.AuthenticationFailed('Invalid token.')
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed('User inactive or deleted.')
+        # An unsaved Token stands in for request.auth without another query
+        return (user, Token(key=key, user=user))
@@ -0,0 +1,77 @@
+"""Authentication backend for username-or-email logins.
+
+The login API used to try authenticate() with the given name, then with the
+case-insensitive username match, then with the email match, and finally a
+manual check_password(); a failed login paid for up to four password hashes
+and four unindexed `__iexact` queries. This backend resolves the account
+with one query against the LOWER(username)/LOWER(email) indexes (see
+migration 0013) and hashes exactly once per attempt, hashing against a
+dummy user when nobody matches so unknown accounts take as long as wrong
+passwords.
+"""
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.db.models.functions import Lower
+
+
+# A name matching more candidates than this is ambiguous anyway
+MAX_CANDIDATES = 3
+
+
+class UsernameOrEmailBackend(ModelBackend):
+    """ModelBackend that accepts a username (any case) or an email address"""
+
+    def get_candidates(self, identifier):
+        """Accounts `identifier` may name, exact username first, then case-insensitive ones, then emails"""
+        UserModel = get_user_model()
+        name = Lower(Value(identifier))
+        match = Q(username_lower=name)
+        if '@' in identifier:
+            match |= Q(email_lower=name)
+        # Usernames are only unique case-sensitively, so the slice must not
+        # cut off the exact match behind its case variants
+        precedence = Case(
+            When(**{UserModel.USERNAME_FIELD: identifier}, then=Value(0)),
+            When(username_lower=name, then=Value(1)),
+            default=Value(2),
+            output_field=IntegerField(),
+        )
+        return list(
+            UserModel._default_manager.annotate(
+                username_lower=Lower(UserModel.USERNAME_FIELD), email_lower=Lower('email'),
+            ).filter(match).order_by(precedence, 'pk')[:MAX_CANDIDATES]
+        )
+
+    def resolve(self, identifier):
+        """The single account `identifier` names, or None when there is none or it is ambiguous.
+
+        An exact username wins, then a case-insensitive username, then an
+        email address.
+        """
+        candidates = self.get_candidates(identifier)
+        for matches in (
+            lambda user: user.get_username() == identifier,
+            lambda user: user.get_username().lower() == identifier.lower(),
+            lambda user: (user.email or '').lower() == identifier.lower(),
+        ):
+            found = [user for user in candidates if matches(user)]
+            if len(found) == 1:
+                return found[0]
+            if found:
+                return None
+        return None
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(get_user_model().USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        user = self.resolve(username.strip())
+        if user is None:
+            # Hash once anyway so unknown accounts are not faster to reject
+            get_user_model()().set_password(password)
+            return None
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
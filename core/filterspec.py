@@ -0,0 +1,144 @@
+"""Declarative alumni and partner filters shared by reports, views and bulk actions.
+
+A filter spec maps request-level filter names to ORM lookups.
+`compile_filters` turns a filter dict (request.GET, a report's `filters`
+object, ...) into a queryset, skipping blank values and validating the rest
+against the model field. `facet_counts` then returns the total and the
+per-value counts of any number of columns from a single query, instead of
+one COUNT plus one grouped query per column.
+"""
+from collections import defaultdict
+
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import Count
+
+from .models import Alumni, Partner
+
+
+# Scope -> (model, filter name -> lookup)
+FILTER_SPECS = {
+    'alumni': (Alumni, {
+        'degree': 'degree',
+        'field_of_study': 'field_of_study__icontains',
+        'status': 'status',
+        'graduation_year': 'graduation_year',
+        'graduation_year_min': 'graduation_year__gte',
+        'graduation_year_max': 'graduation_year__lte',
+        'current_company': 'current_company__icontains',
+        'job_title': 'job_title__icontains',
+        'industry': 'industry__icontains',
+    }),
+    'partners': (Partner, {
+        'partner_type': 'partner_type',
+        'engagement_level': 'engagement_level',
+        'industry': 'industry__icontains',
+    }),
+}
+
+BLANK_VALUES = (None, '', [])
+
+
+def filter_names(scope):
+    return list(FILTER_SPECS[scope][1])
+
+
+def compile_filters(scope, filters, queryset=None):
+    """Queryset of `scope` rows matching `filters`; blank and unknown filters are ignored.
+
+    Raises ValidationError when a value does not fit its field (e.g. a
+    non-numeric graduation year).
+    """
+    model, spec = FILTER_SPECS[scope]
+    lookups = {}
+    for name, lookup in spec.items():
+        value = filters.get(name)
+        if value in BLANK_VALUES:
+            continue
+        field = model._meta.get_field(lookup.split('__')[0])
+        try:
+            lookups[lookup] = field.to_python(value)
+        except ValidationError:
+            raise ValidationError(f"Invalid value for {name}: {value!r}")
+    if queryset is None:
+        queryset = model.objects.all()
+    return queryset.filter(**lookups)
+
+
+# Columns that can be faceted, per scope
+FACET_FIELDS = {
+    'alumni': ['status', 'degree', 'graduation_year', 'industry'],
+    'partners': ['partner_type', 'engagement_level', 'industry'],
+}
+
+
+def _sort_key(item):
+    return (item[0] is None, item[0])
+
+
+def _grouping_sets_sql(queryset, facets):
+    """(sql, params) counting each facet and the total of `queryset` with GROUP BY GROUPING SETS"""
+    quote = connections[queryset.db].ops.quote_name
+    columns = [quote(queryset.model._meta.get_field(facet).column) for facet in facets]
+    source_sql, params = queryset.order_by().values(*facets).query.sql_with_params()
+    sql = (
+        f"SELECT {', '.join(columns)}, {', '.join(f'GROUPING({c})' for c in columns)}, COUNT(*) "
+        f"FROM ({source_sql}) facet_source "
+        f"GROUP BY GROUPING SETS ({', '.join(f'({c})' for c in columns)}, ())"
+    )
+    return sql, params
+
+
+def _grouping_sets_rows(queryset, facets):
+    """Yield (facet or None for the total, value, count) using GROUP BY GROUPING SETS"""
+    connection = connections[queryset.db]
+    sql, params = _grouping_sets_sql(queryset, facets)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        for row in cursor.fetchall():
+            values, grouping, count = row[:len(facets)], row[len(facets):-1], row[-1]
+            if all(grouping):
+                yield None, None, count
+                continue
+            index = grouping.index(0)
+            yield facets[index], values[index], count
+
+
+def _rollup_rows(queryset, facets):
+    """Yield (facet or None for the total, value, count) from one GROUP BY over all facets"""
+    for *values, count in queryset.order_by().values_list(*facets).annotate(count=Count('pk')):
+        yield None, None, count
+        for facet, value in zip(facets, values):
+            yield facet, value, count
+
+
+def facet_counts(queryset, facets):
+    """Return (total, {facet: {value: count}}) for `queryset` in one query.
+
+    PostgreSQL computes every facet in one scan with GROUP BY GROUPING SETS.
+    Other backends group by all facet columns at once and sum each facet
+    from those groups in Python. Blank values are not counted, matching the
+    materialized statistics. Per-choice CASE columns are not used because
+    choice fields can hold values outside their declared choices (e.g.
+    legacy degrees), which must still be counted.
+    """
+    facets = list(facets)
+    if not facets:
+        return queryset.count(), {}
+
+    if connections[queryset.db].vendor == 'postgresql':
+        rows = _grouping_sets_rows(queryset, facets)
+    else:
+        rows = _rollup_rows(queryset, facets)
+
+    counts = {facet: defaultdict(int) for facet in facets}
+    total = 0
+    for facet, value, count in rows:
+        if facet is None:
+            total += count
+        elif value != '':
+            counts[facet][value] += count
+    return total, {
+        facet: dict(sorted(by_value.items(), key=_sort_key))
+        for facet, by_value in counts.items()
+    }
@@ -0,0 +1,98 @@
+"""Bulk engagement import.
+
+Rows are validated in batches: field validation happens in memory, alumni
+and partner IDs are resolved with one IN query per batch, and valid rows are
+inserted with bulk_create. Each batch is committed in its own short
+transaction, so a slow upload never holds the database write lock while
+the next rows are read; a failed import keeps the batches before it.
+Engagement.objects.bulk_create moves last_engagement forward on the
+affected alumni and partners.
+"""
+from django.db import transaction
+from rest_framework.exceptions import ParseError
+
+from .models import Alumni, Partner, Engagement
+from .serializers import BulkEngagementRowSerializer
+
+
+BULK_BATCH_SIZE = 1000
+
+
+def _batches(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _validate(row):
+    """Return (data, None) or (None, errors) for one input row"""
+    if isinstance(row, ParseError):
+        return None, {'non_field_errors': [str(row.detail)]}
+    if not isinstance(row, dict):
+        return None, {'non_field_errors': ['Expected a JSON object.']}
+    serializer = BulkEngagementRowSerializer(data=row)
+    if not serializer.is_valid():
+        return None, serializer.errors
+    return serializer.validated_data, None
+
+
+def _existing_ids(model, ids):
+    return set(model.objects.filter(pk__in=ids).order_by().values_list('pk', flat=True))
+
+
+def ingest_engagements(rows, user=None, batch_size=BULK_BATCH_SIZE):
+    """Create engagements from an iterable of row dicts, recording `user` as their creator.
+
+    Returns (created count, per-row errors); each error is
+    `{'index': <row number>, 'errors': {...}}`. Invalid rows are skipped.
+    """
+    if user is not None and not user.is_authenticated:
+        user = None
+    created = 0
+    errors = []
+    index = 0
+
+    for batch in _batches(rows, batch_size):
+        valid = []
+        for row in batch:
+            data, row_errors = _validate(row)
+            if row_errors:
+                errors.append({'index': index, 'errors': row_errors})
+            else:
+                valid.append((index, data))
+            index += 1
+
+        with transaction.atomic():
+            alumni_ids = _existing_ids(Alumni, {data['alumni'] for _, data in valid})
+            partner_ids = _existing_ids(Partner, {data['partner'] for _, data in valid})
+
+            engagements = []
+            for row_index, data in valid:
+                row_errors = {}
+                for field, existing in (('alumni', alumni_ids), ('partner', partner_ids)):
+                    if data[field] not in existing:
+                        row_errors[field] = [f'Invalid pk "{data[field]}" - object does not exist.']
+                if row_errors:
+                    errors.append({'index': row_index, 'errors': row_errors})
+                    continue
+
+                engagements.append(Engagement(
+                    alumni_id=data['alumni'],
+                    partner_id=data['partner'],
+                    engagement_type=data['engagement_type'],
+                    engagement_date=data['engagement_date'],
+                    description=data['description'],
+                    notes=data['notes'],
+                    created_by=user,
+                ))
+
+            Engagement.objects.bulk_create(engagements)
+        created += len(engagements)
+
+    errors.sort(key=lambda error: error['index'])
+    return created, errors
@@ -0,0 +1,89 @@
+"""Database-backed report job queue.
+
+The API enqueues ReportJob rows and returns immediately; one or more
+`manage.py run_report_worker` processes claim queued jobs, build the report
+and record the outcome. Claiming is a compare-and-set UPDATE on the job's
+status, so any number of workers can share the table without an external
+broker and a job is only ever run by one of them.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from . import artifacts
+from .models import ReportJob
+from .reports import build_report
+
+
+logger = logging.getLogger(__name__)
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def enqueue(report_type, params=None, user=None, output='json'):
+    """Queue a report for the workers and return the job"""
+    return ReportJob.objects.create(
+        report_type=report_type,
+        output=output,
+        params=params or {},
+        requested_by=user if user is not None and user.is_authenticated else None,
+    )
+
+
+def claim_next(worker):
+    """Mark the oldest queued job as running for `worker` and return it, or None"""
+    while True:
+        job_id = (
+            ReportJob.objects.filter(status=ReportJob.STATUS_QUEUED)
+            .order_by('created_at', 'pk').values_list('pk', flat=True).first()
+        )
+        if job_id is None:
+            return None
+        claimed = ReportJob.objects.filter(pk=job_id, status=ReportJob.STATUS_QUEUED).update(
+            status=ReportJob.STATUS_RUNNING,
+            worker=worker,
+            started_at=timezone.now(),
+            attempts=F('attempts') + 1,
+        )
+        if claimed:
+            return ReportJob.objects.get(pk=job_id)
+        # Another worker got there first; try the next one
+
+
+def run(job):
+    """Build the report for a claimed job and record success or failure"""
+    try:
+        # No surrounding transaction: on SQLite a read-then-write transaction
+        # fails immediately with "database is locked" when workers overlap.
+        job.report = build_report(job.report_type, job.params, job.requested_by)
+        if job.output == 'pdf':
+            # Pre-render so the first download is served from disk
+            artifacts.get_or_render(job.report)
+        job.status = ReportJob.STATUS_SUCCEEDED
+        job.error = ''
+    except Exception as exc:
+        logger.exception("Report job %s failed", job.pk)
+        job.status = ReportJob.STATUS_FAILED
+        job.error = f"{type(exc).__name__}: {exc}"
+    job.finished_at = timezone.now()
+    job.save(update_fields=['report', 'status', 'error', 'finished_at'])
+    return job
+
+
+def requeue_stale():
+    """Return jobs whose worker died mid-run to the queue, or fail them after too many attempts"""
+    cutoff = timezone.now() - timedelta(seconds=_setting('REPORT_JOB_TIMEOUT', 600))
+    stale = ReportJob.objects.filter(status=ReportJob.STATUS_RUNNING, started_at__lt=cutoff)
+    failed = stale.filter(attempts__gte=_setting('REPORT_JOB_MAX_ATTEMPTS', 3)).update(
+        status=ReportJob.STATUS_FAILED,
+        error='Worker did not finish the job in time',
+        finished_at=timezone.now(),
+    )
+    requeued = stale.update(status=ReportJob.STATUS_QUEUED, worker='', started_at=None)
+    return requeued, failed
+
@@ -0,0 +1,222 @@
+"""Alumni/Partner last_engagement and engagement_count maintenance.
+
+last_engagement holds the newest engagement_date of the row's engagements
+and engagement_count their number. Both are written only from here, inside
+the same transaction as the engagement change:
+
+- creates move the date forward with a conditional UPDATE and add to the
+  count with an F() increment, in one UPDATE per parent table (per chunk
+  for bulk creates);
+- deletes decrement the count and recompute the date only where the
+  deleted engagement was the newest;
+- updates that move an engagement to another alumni/partner or change its
+  date, and QuerySet.update()/delete(), recompute the affected rows from
+  correlated subqueries over the (alumni/partner, engagement_date) indexes.
+
+`manage.py reconcile_engagement_counts` and `manage.py repair_last_engagement`
+recompute every row set-based.
+"""
+import sqlite3
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import connections, transaction
+from django.db.models import Case, Count, DateTimeField, F, IntegerField, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce, Greatest
+
+
+# Engagement fields that can change a parent's rollups
+SOURCE_FIELDS = ('alumni_id', 'partner_id', 'engagement_date')
+
+# Parent rows per advance() UPDATE (each row adds CASE branches)
+ADVANCE_CHUNK_SIZE = 500
+
+_suppressed = ContextVar('last_engagement_suppressed', default=False)
+
+
+def parents():
+    """(model, engagement foreign key attname) pairs"""
+    from .models import Alumni, Partner
+    return ((Alumni, 'alumni_id'), (Partner, 'partner_id'))
+
+
+def as_datetime(value):
+    # Engagements created from request data may still hold the raw string
+    from .models import Engagement
+    return Engagement._meta.get_field('engagement_date').to_python(value)
+
+
+@contextmanager
+def suppressed():
+    """Skip the per-row signal handlers; the caller recomputes the affected rows itself"""
+    token = _suppressed.set(True)
+    try:
+        yield
+    finally:
+        _suppressed.reset(token)
+
+
+def is_suppressed():
+    return _suppressed.get()
+
+
+def _engagements(attname):
+    from .models import Engagement
+    return Engagement.objects.filter(**{attname: OuterRef('pk')}).order_by()
+
+
+def _newest(attname):
+    return Subquery(_engagements(attname).order_by('-engagement_date').values('engagement_date')[:1])
+
+
+def _count(attname):
+    counts = _engagements(attname).values(attname).annotate(count=Count('pk')).values('count')
+    return Coalesce(Subquery(counts), 0, output_field=IntegerField())
+
+
+def advance(engagements, using='default'):
+    """Move last_engagement forward and count newly created engagements"""
+    for model, attname in parents():
+        added = {}
+        for engagement in engagements:
+            pk = getattr(engagement, attname)
+            if pk is None:
+                continue
+            date = as_datetime(engagement.engagement_date)
+            count, latest = added.get(pk, (0, None))
+            added[pk] = (count + 1, date if latest is None or date > latest else latest)
+
+        items = sorted(added.items())
+        for start in range(0, len(items), ADVANCE_CHUNK_SIZE):
+            chunk = items[start:start + ADVANCE_CHUNK_SIZE]
+            model.objects.using(using).filter(pk__in=[pk for pk, _ in chunk]).update(
+                engagement_count=Case(
+                    *[When(pk=pk, then=F('engagement_count') + count) for pk, (count, _) in chunk],
+                    default=F('engagement_count'),
+                    output_field=IntegerField(),
+                ),
+                last_engagement=Case(
+                    *[
+                        When(
+                            Q(pk=pk) & (Q(last_engagement__isnull=True) | Q(last_engagement__lt=date)),
+                            then=Value(date),
+                        )
+                        for pk, (_, date) in chunk
+                    ],
+                    default=F('last_engagement'),
+                    output_field=DateTimeField(),
+                ),
+            )
+
+
+def remove(engagement, using='default'):
+    """Uncount a deleted engagement; recompute last_engagement only where it was the newest"""
+    date = as_datetime(engagement.engagement_date)
+    for model, attname in parents():
+        pk = getattr(engagement, attname)
+        if pk is None:
+            continue
+        model.objects.using(using).filter(pk=pk).update(
+            # Never below zero, even if the counter had drifted
+            engagement_count=Greatest(F('engagement_count') - 1, 0, output_field=IntegerField()),
+            last_engagement=Case(
+                When(last_engagement=date, then=_newest(attname)),
+                default=F('last_engagement'),
+                output_field=DateTimeField(),
+            ),
+        )
+
+
+def recompute(model, pks, using='default'):
+    """Recompute both rollups for the given rows with one correlated UPDATE"""
+    pks = [pk for pk in set(pks) if pk is not None]
+    if not pks:
+        return 0
+    attname = dict(parents())[model]
+    return model.objects.using(using).filter(pk__in=pks).update(
+        engagement_count=_count(attname),
+        last_engagement=_newest(attname),
+    )
+
+
+def recompute_for(engagement_values, using='default'):
+    """Recompute the parents named by an iterable of (alumni_id, partner_id)"""
+    alumni_ids, partner_ids = set(), set()
+    for alumni_id, partner_id in engagement_values:
+        alumni_ids.add(alumni_id)
+        partner_ids.add(partner_id)
+    for (model, _), pks in zip(parents(), (alumni_ids, partner_ids)):
+        recompute(model, pks, using=using)
+
+
+def count_drift(model, using='default'):
+    """(pk, stored, actual) for rows whose engagement_count is wrong"""
+    attname = dict(parents())[model]
+    return list(
+        model.objects.using(using).annotate(actual=_count(attname))
+        .exclude(engagement_count=F('actual'))
+        .order_by('pk').values_list('pk', 'engagement_count', 'actual')
+    )
+
+
+def _supports_update_from(connection):
+    if connection.vendor == 'postgresql':
+        return True
+    return connection.vendor == 'sqlite' and sqlite3.sqlite_version_info >= (3, 33)
+
+
+def _update_from_aggregate(field, aggregate, empty, fallback, using):
+    """Set `field` on every parent row from an aggregate over its engagements.
+
+    On PostgreSQL and SQLite this is one `UPDATE ... FROM (SELECT fk,
+    <aggregate> ... GROUP BY fk)` per table plus one UPDATE resetting rows
+    without engagements to `empty`; rows that are already correct are not
+    rewritten. Returns {model: rows changed}.
+    """
+    from . import response_cache
+    from .models import Engagement
+
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    engagements = quote(Engagement._meta.db_table)
+    changed = {}
+    with transaction.atomic(using=using):
+        for model, attname in parents():
+            if not _supports_update_from(connection):
+                changed[model] = model.objects.using(using).update(**{field: fallback(attname)})
+                continue
+            table = quote(model._meta.db_table)
+            pk = quote(model._meta.pk.column)
+            column = quote(model._meta.get_field(field).column)
+            fk = quote(Engagement._meta.get_field(attname).column)
+            is_empty = f"{column} IS NULL" if empty == 'NULL' else f"{column} = {empty}"
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"UPDATE {table} SET {column} = totals.value "
+                    f"FROM (SELECT {fk} AS parent_id, {aggregate} AS value "
+                    f"FROM {engagements} GROUP BY {fk}) totals "
+                    f"WHERE {table}.{pk} = totals.parent_id "
+                    f"AND ({table}.{column} IS NULL OR {table}.{column} <> totals.value)"
+                )
+                rows = cursor.rowcount
+                cursor.execute(
+                    f"UPDATE {table} SET {column} = {empty} "
+                    f"WHERE NOT ({is_empty}) AND NOT EXISTS "
+                    f"(SELECT 1 FROM {engagements} WHERE {engagements}.{fk} = {table}.{pk})"
+                )
+                changed[model] = rows + cursor.rowcount
+            response_cache.invalidate(model._meta.model_name, using=using)
+    return changed
+
+
+def repair(using='default'):
+    """Recompute last_engagement for every alumni and partner; returns {model: rows changed}"""
+    from .models import Engagement
+
+    date_column = connections[using].ops.quote_name(Engagement._meta.get_field('engagement_date').column)
+    return _update_from_aggregate('last_engagement', f"MAX({date_column})", 'NULL', _newest, using)
+
+
+def reconcile_counts(using='default'):
+    """Recompute engagement_count for every alumni and partner; returns {model: rows changed}"""
+    return _update_from_aggregate('engagement_count', 'COUNT(*)', '0', _count, using)
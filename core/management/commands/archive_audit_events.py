@@ -0,0 +1,25 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core import audit
+
+
+class Command(BaseCommand):
+    help = 'Move old audit events into monthly archive files under AUDIT_ARCHIVE_ROOT'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than',
+            type=int,
+            metavar='DAYS',
+            default=settings.AUDIT_RETENTION_DAYS,
+            help='Archive events older than DAYS days (default: AUDIT_RETENTION_DAYS)',
+        )
+
+    def handle(self, *args, **options):
+        before = timezone.now() - timedelta(days=options['older_than'])
+        archived = audit.archive(before)
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} audit events to {audit.archive_root()}"))
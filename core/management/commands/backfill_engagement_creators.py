@@ -0,0 +1,76 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+
+from core.models import AuditEvent, Engagement
+
+
+LEGACY_PREFIX = 'Engagement Created: '
+UPDATE_CHUNK_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = 'Set Engagement.created_by for existing engagements from the audit trail'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report how many engagements would be updated',
+        )
+
+    def handle(self, *args, **options):
+        missing = Engagement.objects.filter(created_by__isnull=True)
+
+        # Structured events name the engagement by id
+        creators = {}
+        structured = (
+            AuditEvent.objects.filter(action='create', object_type='engagement', actor__isnull=False)
+            .order_by('created_at').values_list('object_id', 'actor_id')
+        )
+        for object_id, actor_id in structured:
+            if object_id.isdigit():
+                creators.setdefault(int(object_id), actor_id)
+
+        # Events moved over from the old Report-based trail only carry the
+        # engagement's label ("<alumni> - <partner> (<type>)"); match a label
+        # only when it identifies a single engagement.
+        legacy = {}
+        legacy_events = (
+            AuditEvent.objects.filter(action='legacy', summary__startswith=LEGACY_PREFIX, actor__isnull=False)
+            .order_by('created_at').values_list('summary', 'actor_id')
+        )
+        for summary, actor_id in legacy_events:
+            legacy.setdefault(summary[len(LEGACY_PREFIX):], actor_id)
+        if legacy:
+            by_label = defaultdict(list)
+            for engagement in missing.select_related('alumni', 'partner').only(
+                'pk', 'engagement_type', 'alumni__first_name', 'alumni__last_name', 'partner__name'
+            ).iterator(chunk_size=2000):
+                by_label[str(engagement)].append(engagement.pk)
+            for label, actor_id in legacy.items():
+                pks = by_label.get(label, [])
+                if len(pks) == 1:
+                    creators.setdefault(pks[0], actor_id)
+
+        missing_ids = set(missing.values_list('pk', flat=True).iterator()) & creators.keys()
+        by_actor = defaultdict(list)
+        for pk in missing_ids:
+            by_actor[creators[pk]].append(pk)
+
+        # Engagements recorded since created_by was added already have one
+        unresolved = missing.count() - len(missing_ids)
+        if options['dry_run']:
+            self.stdout.write(
+                f"Would set the creator of {len(missing_ids)} engagements; "
+                f"{unresolved} without a creator have no matching audit event"
+            )
+            return
+
+        for actor_id, pks in by_actor.items():
+            for start in range(0, len(pks), UPDATE_CHUNK_SIZE):
+                Engagement.objects.filter(pk__in=pks[start:start + UPDATE_CHUNK_SIZE]).update(created_by_id=actor_id)
+        self.stdout.write(self.style.SUCCESS(
+            f"Set the creator of {len(missing_ids)} engagements; "
+            f"{unresolved} without a creator have no matching audit event"
+        ))
@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core import artifacts
+
+
+class Command(BaseCommand):
+    help = 'Delete cached report PDFs from REPORT_ARTIFACT_ROOT'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than',
+            type=int,
+            metavar='DAYS',
+            help='Only delete artifacts not modified in the last DAYS days',
+        )
+
+    def handle(self, *args, **options):
+        root = artifacts.root()
+        if not root.exists():
+            self.stdout.write('No report artifacts to delete')
+            return
+
+        cutoff = None
+        if options['older_than'] is not None:
+            cutoff = time.time() - options['older_than'] * 86400
+
+        deleted = 0
+        for path in root.glob('*/*.pdf'):
+            if cutoff is None or path.stat().st_mtime < cutoff:
+                path.unlink(missing_ok=True)
+                deleted += 1
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} report artifacts"))
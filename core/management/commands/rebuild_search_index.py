@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from core import search
+
+
+class Command(BaseCommand):
+    help = 'Create and repopulate the full-text search index for alumni and partners'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        if not search.install(options['database'], rebuild=True):
+            raise CommandError('Full-text search is not supported on this database; ?search= uses icontains')
+        self.stdout.write(self.style.SUCCESS('Search index rebuilt'))
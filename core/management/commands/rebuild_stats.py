@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from core import stats
+from core.models import Alumni, Partner, Engagement
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the StatsSnapshot counters from the Alumni, Partner and Engagement tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='Only report counters that drifted from the live tables; do not rebuild',
+        )
+
+    def handle(self, *args, **options):
+        models_ = [Alumni, Partner, Engagement]
+        problems = stats.drift(models_)
+
+        for dimension, value, stored, actual in problems:
+            self.stdout.write(f"{dimension}={value!r}: stored {stored}, actual {actual}")
+
+        if options['verify']:
+            if problems:
+                self.stdout.write(self.style.WARNING(f"{len(problems)} counters drifted"))
+            else:
+                self.stdout.write(self.style.SUCCESS('All counters match'))
+            return
+
+        stats.rebuild(models_)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt statistics ({len(problems)} counters corrected)"))
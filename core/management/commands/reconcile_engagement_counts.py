@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from core import last_engagement
+
+
+class Command(BaseCommand):
+    help = 'Recompute Alumni.engagement_count and Partner.engagement_count from the Engagement table'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='Only report counts that drifted from the Engagement table; do not fix them',
+        )
+
+    def handle(self, *args, **options):
+        if options['verify']:
+            problems = 0
+            for model, _ in last_engagement.parents():
+                for pk, stored, actual in last_engagement.count_drift(model):
+                    self.stdout.write(f"{model.__name__} {pk}: stored {stored}, actual {actual}")
+                    problems += 1
+            if problems:
+                self.stdout.write(self.style.WARNING(f"{problems} counts drifted"))
+            else:
+                self.stdout.write(self.style.SUCCESS('All counts match'))
+            return
+
+        changed = last_engagement.reconcile_counts()
+        for model, rows in changed.items():
+            self.stdout.write(f"{model.__name__}: {rows} rows corrected")
+        self.stdout.write(self.style.SUCCESS('Reconciled engagement counts'))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from core import last_engagement
+
+
+class Command(BaseCommand):
+    help = 'Recompute Alumni.last_engagement and Partner.last_engagement from the Engagement table'
+
+    def handle(self, *args, **options):
+        changed = last_engagement.repair()
+        for model, rows in changed.items():
+            self.stdout.write(f"{model.__name__}: {rows} rows corrected")
+        self.stdout.write(self.style.SUCCESS('Repaired last_engagement'))
@@ -0,0 +1,112 @@
+import multiprocessing
+import os
+import signal
+import socket
+import time
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from core import jobs
+
+
+def _work(name, poll_interval, stop, once=False):
+    """Claim and run jobs until `stop` is set (or the queue is empty with `once`)"""
+    processed = 0
+    while not stop.is_set():
+        job = jobs.claim_next(name)
+        if job is None:
+            if once:
+                break
+            stop.wait(poll_interval)
+            continue
+        jobs.run(job)
+        processed += 1
+    return processed
+
+
+def _child(name, poll_interval, stop):
+    # The parent handles shutdown signals and sets `stop`, so a job in
+    # progress is allowed to finish. Children must not reuse the parent's
+    # database connections.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    django.setup()
+    connections.close_all()
+    _work(name, poll_interval, stop)
+    connections.close_all()
+
+
+class Command(BaseCommand):
+    help = 'Run a pool of worker processes that generate queued reports'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=max(1, min(4, os.cpu_count() or 1)),
+            help='Number of worker processes (default: CPU count, at most 4)',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=1.0,
+            help='Seconds to wait between polls when the queue is empty',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Process the jobs currently queued in this process, then exit',
+        )
+
+    def handle(self, *args, **options):
+        base_name = f"{socket.gethostname()}:{os.getpid()}"
+        requeued, failed = jobs.requeue_stale()
+        if requeued or failed:
+            self.stdout.write(f"Requeued {requeued} stale jobs, failed {failed}")
+
+        if options['once']:
+            processed = _work(base_name, 0, multiprocessing.Event(), once=True)
+            self.stdout.write(self.style.SUCCESS(f"Processed {processed} jobs"))
+            return
+
+        stop = multiprocessing.Event()
+        connections.close_all()
+
+        def start(index):
+            process = multiprocessing.Process(
+                target=_child,
+                args=(f"{base_name}/{index}", options['poll_interval'], stop),
+                daemon=True,
+            )
+            process.start()
+            return process
+
+        processes = [start(index) for index in range(options['workers'])]
+        self.stdout.write(self.style.SUCCESS(f"Started {len(processes)} report workers"))
+
+        # Only flip a flag in the handler: calling stop.set() there could
+        # deadlock against the Event's own lock.
+        terminating = []
+        signal.signal(signal.SIGTERM, lambda *_: terminating.append(True))
+        last_sweep = time.monotonic()
+        try:
+            while not terminating:
+                time.sleep(1)
+                for index, process in enumerate(processes):
+                    if not process.is_alive():
+                        self.stderr.write(f"Worker {index} exited with code {process.exitcode}; restarting")
+                        processes[index] = start(index)
+                if time.monotonic() - last_sweep >= 60:
+                    jobs.requeue_stale()
+                    connections.close_all()
+                    last_sweep = time.monotonic()
+        except KeyboardInterrupt:
+            pass
+        stop.set()
+
+        self.stdout.write('Stopping workers after their current job...')
+        for process in processes:
+            process.join()
+        self.stdout.write(self.style.SUCCESS('Report workers stopped'))
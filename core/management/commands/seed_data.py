@@ -0,0 +1,358 @@
+import random
+import time
+from array import array
+from datetime import date, datetime, timedelta, timezone
+from itertools import accumulate, islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from core import last_engagement, response_cache, stats
+from core.models import Alumni, Engagement, Partner, normalize_company
+
+
+# Fixed so the same --seed always produces the same rows
+FIRST_GRADUATION_YEAR = 1975
+LAST_GRADUATION_YEAR = 2025
+FIRST_ENGAGEMENT = datetime(2010, 1, 1, tzinfo=timezone.utc)
+LAST_ENGAGEMENT = datetime(2025, 12, 31, 23, 59, tzinfo=timezone.utc)
+
+FIRST_NAMES = [
+    'James', 'Maria', 'John', 'Anna', 'Michael', 'Sarah', 'David', 'Grace', 'Daniel', 'Angela',
+    'Mark', 'Joy', 'Paul', 'Emily', 'Carlo', 'Patricia', 'Miguel', 'Andrea', 'Joseph', 'Kristine',
+    'Robert', 'Nicole', 'Christian', 'Jasmine', 'Kevin', 'Camille', 'Luis', 'Sofia', 'Ryan', 'Bea',
+    'Jose', 'Elena', 'Adrian', 'Hannah', 'Gabriel', 'Isabel', 'Rafael', 'Lea', 'Nathan', 'Clarisse',
+]
+LAST_NAMES = [
+    'Santos', 'Reyes', 'Cruz', 'Garcia', 'Mendoza', 'Torres', 'Flores', 'Ramos', 'Lopez', 'Gonzales',
+    'Smith', 'Johnson', 'Brown', 'Lee', 'Tan', 'Lim', 'Chen', 'Wilson', 'Martinez', 'Rivera',
+    'Aquino', 'Bautista', 'Castillo', 'Dela Cruz', 'Navarro', 'Villanueva', 'Domingo', 'Pascual', 'Salazar', 'Ocampo',
+]
+
+# (value, weight) pairs
+DEGREES = [('BS', 62), ('BA', 6), ('MS', 18), ('MA', 4), ('PhD', 4), ('Other', 6)]
+FIELDS_OF_STUDY = [
+    ('Civil Engineering', 22),
+    ('Computer Engineering', 20),
+    ('Electronics Engineering', 15),
+    ('Electrical Engineering', 15),
+    ('Mechanical Engineering', 14),
+    ('Environmental and Sanitary Engineering', 6),
+    ('Computer Science', 5),
+    ('Industrial Engineering', 3),
+]
+INDUSTRIES = {
+    'Technology': (30, ['Accenture', 'IBM', 'Google', 'Microsoft', 'Globe Telecom', 'Canva', 'Amazon']),
+    'Construction': (18, ['DMCI Holdings', 'Megawide', 'EEI Corporation', 'Bechtel', 'Vinci']),
+    'Energy': (12, ['Meralco', 'Aboitiz Power', 'First Gen', 'Siemens Energy', 'Shell']),
+    'Manufacturing': (12, ['Texas Instruments', 'Analog Devices', 'Toyota', 'Samsung Electro-Mechanics']),
+    'Consulting': (8, ['Deloitte', 'PwC', 'Arup', 'AECOM', 'Jacobs']),
+    'Government': (8, ['DPWH', 'DOST', 'DENR', 'MWSS']),
+    'Education': (7, ['University of the Philippines', 'Mapua University', 'De La Salle University']),
+    'Finance': (5, ['BDO', 'BPI', 'Metrobank', 'HSBC']),
+}
+JOB_TITLES = [
+    # (minimum years since graduation, titles)
+    (0, ['Junior Engineer', 'Associate Engineer', 'Graduate Trainee', 'Analyst']),
+    (4, ['Engineer', 'Project Engineer', 'Software Engineer', 'Design Engineer']),
+    (9, ['Senior Engineer', 'Lead Engineer', 'Project Manager', 'Consultant']),
+    (16, ['Engineering Manager', 'Director', 'Principal Engineer', 'Vice President']),
+]
+CITIES = [
+    ('Manila', 'Metro Manila', 'Philippines', 30),
+    ('Quezon City', 'Metro Manila', 'Philippines', 20),
+    ('Makati', 'Metro Manila', 'Philippines', 15),
+    ('Cebu City', 'Cebu', 'Philippines', 10),
+    ('Davao City', 'Davao del Sur', 'Philippines', 6),
+    ('Singapore', '', 'Singapore', 8),
+    ('San Jose', 'CA', 'United States', 6),
+    ('Tokyo', '', 'Japan', 5),
+]
+
+PARTNER_WORDS = [
+    'Apex', 'Summit', 'Pacific', 'Northstar', 'Harbor', 'Bayan', 'Luzon', 'Visayas', 'Mindanao', 'Golden',
+    'Silverline', 'Bluewater', 'Evergreen', 'Ironwood', 'Keystone', 'Meridian', 'Orion', 'Pinnacle', 'Sierra', 'Vertex',
+]
+PARTNER_KINDS = {
+    'corporate': (55, ['Engineering Corp.', 'Technologies Inc.', 'Construction Co.', 'Power Systems', 'Industries']),
+    'nonprofit': (12, ['Foundation', 'Engineers Society', 'Relief Network']),
+    'government': (10, ['Development Authority', 'Public Works Office', 'Science Agency']),
+    'educational': (15, ['Institute of Technology', 'Polytechnic College', 'Research Center']),
+    'other': (8, ['Cooperative', 'Partners', 'Alliance']),
+}
+ENGAGEMENT_LEVELS = [('prospective', 40), ('bronze', 30), ('silver', 20), ('gold', 10)]
+# How much more often a partner at each level shows up in engagements
+LEVEL_ACTIVITY = {'prospective': 1, 'bronze': 3, 'silver': 6, 'gold': 12}
+STATUS_ACTIVITY = {'active': 1.0, 'inactive': 0.25, 'lost_contact': 0.05}
+
+# Engagement type mix at FIRST_ENGAGEMENT and at LAST_ENGAGEMENT; years in between interpolate
+ENGAGEMENT_TYPES = [
+    # (type, weight at start, weight at end)
+    ('networking_event', 35, 20),
+    ('mentorship', 10, 24),
+    ('interview', 15, 12),
+    ('collaboration', 10, 18),
+    ('donation', 12, 8),
+    ('internship', 13, 14),
+    ('other', 5, 4),
+]
+# Networking events moved online or stopped in these years
+EVENT_DIP_YEARS = {2020: 0.3, 2021: 0.6}
+
+# Engagements whose alumni and partners are drawn in one Random.choices() call
+PICK_BLOCK = 10000
+
+
+def cumulative(pairs):
+    """Split (value, weight) pairs into values and cumulative weights for Random.choices()"""
+    pairs = list(pairs)
+    values = [value for value, _ in pairs]
+    return values, list(accumulate(weight for _, weight in pairs))
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate deterministic synthetic alumni, partners and engagements for load testing '
+        '(rows are inserted in batches; stats, engagement rollups and caches are rebuilt once at the end)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--alumni', type=int, default=1000, help='Alumni to create')
+        parser.add_argument('--partners', type=int, default=100, help='Partners to create')
+        parser.add_argument('--engagements', type=int, default=10000, help='Engagements to create')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed; the same seed yields the same data')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Rows per bulk_create() call')
+
+    def handle(self, *args, **options):
+        for name in ('alumni', 'partners', 'engagements'):
+            if options[name] < 0:
+                raise CommandError(f"--{name} must not be negative")
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be positive')
+        if options['engagements'] and not (options['alumni'] and options['partners']):
+            raise CommandError('--engagements needs at least one new alumni and one new partner')
+
+        self.seed = options['seed']
+        self.batch_size = options['batch_size']
+        self.domain = f"s{self.seed}.example.com"
+        if Alumni.objects.filter(email__endswith=f"@{self.domain}").exists():
+            raise CommandError(f"Data for --seed {self.seed} already exists; pick another seed")
+
+        self.rng = random.Random(self.seed)
+        started = time.monotonic()
+        with transaction.atomic():
+            alumni = self.create_alumni(options['alumni'])
+            partners = self.create_partners(options['partners'])
+            self.create_engagements(options['engagements'], alumni, partners)
+            self.finish()
+        self.stdout.write(self.style.SUCCESS(f"Seeded data in {time.monotonic() - started:.1f}s"))
+
+    def insert(self, model, rows, total):
+        """bulk_create() `rows` in batches; returns the new primary keys.
+
+        The base manager skips the per-batch stats, rollup and cache
+        bookkeeping of the default managers; finish() redoes it once.
+        """
+        pks = array('q')
+        batch = []
+        started = time.monotonic()
+        for row in rows:
+            batch.append(row)
+            if len(batch) == self.batch_size:
+                pks.extend(obj.pk for obj in model._base_manager.bulk_create(batch))
+                batch = []
+                if len(pks) % (self.batch_size * 20) == 0:
+                    self.stdout.write(f"  {model.__name__}: {len(pks)}/{total}")
+        if batch:
+            pks.extend(obj.pk for obj in model._base_manager.bulk_create(batch))
+        self.stdout.write(f"{model.__name__}: {len(pks)} created in {time.monotonic() - started:.1f}s")
+        return pks
+
+    def create_alumni(self, count):
+        """Create alumni; returns (pks, graduation years, cumulative engagement weights)"""
+        rng = self.rng
+        years = range(FIRST_GRADUATION_YEAR, LAST_GRADUATION_YEAR + 1)
+        # Cohorts grow about 4% a year
+        year_weights = list(accumulate(1.04 ** (year - FIRST_GRADUATION_YEAR) for year in years))
+        degrees, degree_weights = cumulative(DEGREES)
+        fields, field_weights = cumulative(FIELDS_OF_STUDY)
+        industries, industry_weights = cumulative((name, weight) for name, (weight, _) in INDUSTRIES.items())
+
+        graduation_years = array('H')
+        activity = []
+
+        def rows():
+            for i in range(count):
+                first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+                year = rng.choices(years, cum_weights=year_weights)[0]
+                age = LAST_GRADUATION_YEAR - year
+                degree = rng.choices(degrees, cum_weights=degree_weights)[0]
+                if degree in ('MS', 'MA', 'PhD') and age < 2:
+                    degree = 'BS'
+                # Older cohorts are harder to keep in touch with
+                roll = rng.random()
+                lost = min(0.03 + 0.012 * age, 0.45)
+                status = 'lost_contact' if roll < lost else 'inactive' if roll < lost + 0.15 else 'active'
+                industry = rng.choices(industries, cum_weights=industry_weights)[0]
+                company = rng.choice(INDUSTRIES[industry][1])
+                title = rng.choice([titles for minimum, titles in JOB_TITLES if age >= minimum][-1])
+                slug = f"{first}.{last}".lower().replace(' ', '')
+
+                graduation_years.append(year)
+                # A few alumni account for most engagements
+                activity.append(STATUS_ACTIVITY[status] * rng.paretovariate(3))
+                yield Alumni(
+                    first_name=first,
+                    last_name=last,
+                    email=f"{slug}.{i}@{self.domain}",
+                    phone=f"+63 9{rng.randrange(10 ** 9):09d}",
+                    degree=degree,
+                    field_of_study=rng.choices(fields, cum_weights=field_weights)[0],
+                    graduation_year=year,
+                    current_company=company,
+                    company_normalized=normalize_company(company),
+                    job_title=title,
+                    industry=industry,
+                    status=status,
+                    linkedin_url=f"https://linkedin.com/in/{slug}-{self.seed}-{i}" if rng.random() < 0.6 else None,
+                )
+
+        pks = self.insert(Alumni, rows(), count)
+        return pks, graduation_years, list(accumulate(activity))
+
+    def create_partners(self, count):
+        """Create partners; returns (pks, names, cumulative engagement weights)"""
+        rng = self.rng
+        types, type_weights = cumulative((name, weight) for name, (weight, _) in PARTNER_KINDS.items())
+        levels, level_weights = cumulative(ENGAGEMENT_LEVELS)
+        industries, industry_weights = cumulative((name, weight) for name, (weight, _) in INDUSTRIES.items())
+        cities, city_weights = cumulative(((city, state, country), weight) for city, state, country, weight in CITIES)
+        first_day = date(2000, 1, 1)
+        span = (LAST_ENGAGEMENT.date() - first_day).days
+
+        names = []
+        activity = []
+
+        def rows():
+            for i in range(count):
+                partner_type = rng.choices(types, cum_weights=type_weights)[0]
+                name = f"{rng.choice(PARTNER_WORDS)} {rng.choice(PARTNER_KINDS[partner_type][1])} {self.seed}-{i}"
+                level = rng.choices(levels, cum_weights=level_weights)[0]
+                city, state, country = rng.choices(cities, cum_weights=city_weights)[0]
+                slug = f"partner{self.seed}-{i}"
+                contact = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+                names.append(name)
+                activity.append(LEVEL_ACTIVITY[level] * rng.paretovariate(2))
+                yield Partner(
+                    name=name,
+                    partner_type=partner_type,
+                    website=f"https://{slug}.{self.domain}",
+                    email=f"partnerships@{slug}.{self.domain}",
+                    city=city,
+                    state=state,
+                    country=country,
+                    primary_contact_name=contact,
+                    primary_contact_email=f"{contact.split()[0].lower()}@{slug}.{self.domain}",
+                    engagement_level=level,
+                    industry=rng.choices(industries, cum_weights=industry_weights)[0],
+                    employee_count=int(rng.lognormvariate(5, 1.5)) + 1,
+                    # Prospects are newer on average
+                    partnership_start_date=(
+                        None if level == 'prospective'
+                        else first_day + timedelta(days=int(span * rng.random() ** 0.7))
+                    ),
+                )
+
+        pks = self.insert(Partner, rows(), count)
+        return pks, names, list(accumulate(activity))
+
+    def create_engagements(self, count, alumni, partners):
+        rng = self.rng
+        alumni_pks, graduation_years, alumni_weights = alumni
+        partner_pks, partner_names, partner_weights = partners
+        alumni_indexes = range(len(alumni_pks))
+        partner_indexes = range(len(partner_pks))
+        labels = dict(Engagement.ENGAGEMENT_TYPE_CHOICES)
+        last_seconds = (LAST_ENGAGEMENT - FIRST_ENGAGEMENT).total_seconds()
+
+        type_weights = {}
+        for year in range(FIRST_ENGAGEMENT.year, LAST_ENGAGEMENT.year + 1):
+            share = (year - FIRST_ENGAGEMENT.year) / max(LAST_ENGAGEMENT.year - FIRST_ENGAGEMENT.year, 1)
+            weights = []
+            for name, start, end in ENGAGEMENT_TYPES:
+                weight = start + (end - start) * share
+                if name == 'networking_event':
+                    weight *= EVENT_DIP_YEARS.get(year, 1)
+                weights.append((name, weight))
+            type_weights[year] = cumulative(weights)
+
+        now = connection.ops.adapt_datetimefield_value(datetime.now(timezone.utc))
+        adapt = connection.ops.adapt_datetimefield_value
+
+        def rows():
+            # Drawn in fixed blocks so --batch-size does not change the data
+            for done in range(0, count, PICK_BLOCK):
+                size = min(PICK_BLOCK, count - done)
+                picks = zip(
+                    rng.choices(alumni_indexes, cum_weights=alumni_weights, k=size),
+                    rng.choices(partner_indexes, cum_weights=partner_weights, k=size),
+                )
+                for a, p in picks:
+                    # Engagements start at graduation and grow more frequent over time
+                    start = max(FIRST_ENGAGEMENT, datetime(graduation_years[a], 1, 1, tzinfo=timezone.utc))
+                    offset = (start - FIRST_ENGAGEMENT).total_seconds()
+                    when = FIRST_ENGAGEMENT + timedelta(
+                        seconds=int(offset + (last_seconds - offset) * rng.random())
+                    )
+                    types, weights = type_weights[when.year]
+                    engagement_type = rng.choices(types, cum_weights=weights)[0]
+                    if engagement_type == 'internship':
+                        # Internships run over the summer break
+                        when = when.replace(month=rng.choice((6, 7, 8)), day=min(when.day, 28))
+                    yield (
+                        alumni_pks[a], partner_pks[p], engagement_type,
+                        f"{labels[engagement_type]} with {partner_names[p]}",
+                        adapt(when), '', now, now,
+                    )
+
+        fields = [
+            'alumni', 'partner', 'engagement_type', 'description', 'engagement_date',
+            'notes', 'created_at', 'updated_at',
+        ]
+        self.insert_values(Engagement, fields, rows(), count)
+
+    def insert_values(self, model, fields, rows, total):
+        """INSERT already-adapted value tuples with multi-row statements.
+
+        Used for engagements, where bulk_create()'s per-value preparation
+        costs more than generating the rows.
+        """
+        fields = [model._meta.get_field(name) for name in fields]
+        quote = connection.ops.quote_name
+        per_statement = max(1, min(self.batch_size, connection.ops.bulk_batch_size(fields, range(self.batch_size))))
+        prefix = (
+            f"INSERT INTO {quote(model._meta.db_table)} "
+            f"({', '.join(quote(field.column) for field in fields)}) VALUES "
+        )
+        placeholder = f"({', '.join(['%s'] * len(fields))})"
+        statements = {}
+        inserted = 0
+        started = time.monotonic()
+        with connection.cursor() as cursor:
+            for chunk in iter(lambda: list(islice(rows, per_statement)), []):
+                if len(chunk) not in statements:
+                    statements[len(chunk)] = prefix + ', '.join([placeholder] * len(chunk))
+                cursor.execute(statements[len(chunk)], [value for row in chunk for value in row])
+                previous, inserted = inserted, inserted + len(chunk)
+                if inserted // (self.batch_size * 20) != previous // (self.batch_size * 20):
+                    self.stdout.write(f"  {model.__name__}: {inserted}/{total}")
+        self.stdout.write(f"{model.__name__}: {inserted} created in {time.monotonic() - started:.1f}s")
+
+    def finish(self):
+        started = time.monotonic()
+        stats.rebuild([Alumni, Partner, Engagement])
+        last_engagement.reconcile_counts()
+        last_engagement.repair()
+        response_cache.invalidate('alumni', 'partner', 'engagement')
+        self.stdout.write(f"Rebuilt stats and engagement rollups in {time.monotonic() - started:.1f}s")
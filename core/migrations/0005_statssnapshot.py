@@ -0,0 +1,66 @@
+# Generated by Django 4.2.10 on 2026-10-17 01:16
+
+from django.db import migrations, models
+
+
+# Dimension name -> field per model, frozen as of this migration so later
+# changes to core.stats cannot alter what it computes
+DIMENSIONS = {
+    'Alumni': {
+        'alumni_status': 'status',
+        'alumni_degree': 'degree',
+        'alumni_graduation_year': 'graduation_year',
+        'alumni_industry': 'industry',
+    },
+    'Partner': {
+        'partner_type': 'partner_type',
+        'partner_engagement_level': 'engagement_level',
+        'partner_industry': 'industry',
+    },
+    'Engagement': {
+        'engagement_type': 'engagement_type',
+    },
+}
+
+
+def populate_stats(apps, schema_editor):
+    StatsSnapshot = apps.get_model('core', 'StatsSnapshot')
+    snapshots = []
+    for name, dimensions in DIMENSIONS.items():
+        model = apps.get_model('core', name)
+        rows = model._base_manager.order_by()
+        snapshots.append(StatsSnapshot(dimension=f"{name.lower()}_total", value='', count=rows.count()))
+        for dimension, field in dimensions.items():
+            for value, count in rows.values_list(field).annotate(count=models.Count('pk')):
+                # Blank values are not counted
+                if value is not None and value != '':
+                    snapshots.append(StatsSnapshot(dimension=dimension, value=str(value), count=count))
+    StatsSnapshot.objects.bulk_create(snapshots)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_alter_alumni_degree_alter_engagement_engagement_type'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatsSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(max_length=50)),
+                ('value', models.CharField(blank=True, max_length=255)),
+                ('count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['dimension', 'value'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='statssnapshot',
+            constraint=models.UniqueConstraint(fields=('dimension', 'value'), name='unique_stats_dimension_value'),
+        ),
+        migrations.RunPython(populate_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.10 on 2026-10-17 01:21
+
+from django.db import migrations, models
+
+
+def populate_company_normalized(apps, schema_editor):
+    from core.models import normalize_company
+
+    Alumni = apps.get_model('core', 'Alumni')
+    batch = []
+    for alumni in Alumni.objects.only('id', 'current_company').iterator(chunk_size=2000):
+        alumni.company_normalized = normalize_company(alumni.current_company)
+        batch.append(alumni)
+        if len(batch) >= 2000:
+            Alumni.objects.bulk_update(batch, ['company_normalized'])
+            batch = []
+    if batch:
+        Alumni.objects.bulk_update(batch, ['company_normalized'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_statssnapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='alumni',
+            name='company_normalized',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name='alumni',
+            index=models.Index(fields=['company_normalized'], name='core_alumni_company_f18488_idx'),
+        ),
+        migrations.RunPython(populate_company_normalized, migrations.RunPython.noop),
+    ]
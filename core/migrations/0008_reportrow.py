@@ -0,0 +1,65 @@
+# Generated by Django 4.2.10 on 2026-10-17 01:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+# Frozen copy of core.reports.ALUMNI_ROW_COLUMNS as of this migration
+ALUMNI_ROW_COLUMNS = ['first_name', 'last_name', 'email', 'graduation_year', 'phone']
+
+
+def move_inline_rows(apps, schema_editor):
+    """Move rows embedded in Report.data into ReportRow"""
+    Report = apps.get_model('core', 'Report')
+    ReportRow = apps.get_model('core', 'ReportRow')
+    for report in Report.objects.filter(data__has_key='rows').iterator(chunk_size=100):
+        rows = report.data.pop('rows') or []
+        ReportRow.objects.bulk_create(
+            [
+                ReportRow(report=report, position=position, values=[row.get(column) for column in ALUMNI_ROW_COLUMNS])
+                for position, row in enumerate(rows)
+            ],
+            batch_size=2000,
+        )
+        report.data['columns'] = ALUMNI_ROW_COLUMNS
+        report.data['row_count'] = len(rows)
+        report.save(update_fields=['data'])
+
+
+def restore_inline_rows(apps, schema_editor):
+    """Embed ReportRows back into Report.data['rows'] before the table is dropped"""
+    Report = apps.get_model('core', 'Report')
+    ReportRow = apps.get_model('core', 'ReportRow')
+    for report in Report.objects.filter(pk__in=ReportRow.objects.values('report')).iterator(chunk_size=100):
+        columns = report.data.pop('columns', None) or ALUMNI_ROW_COLUMNS
+        report.data.pop('row_count', None)
+        values = ReportRow.objects.filter(report=report).order_by('position').values_list('values', flat=True)
+        report.data['rows'] = [dict(zip(columns, row)) for row in values.iterator(chunk_size=2000)]
+        report.save(update_fields=['data'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_reportjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportRow',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveIntegerField()),
+                ('values', models.JSONField(default=list)),
+                ('report', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rows', to='core.report')),
+            ],
+            options={
+                'ordering': ['position'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='reportrow',
+            constraint=models.UniqueConstraint(fields=('report', 'position'), name='unique_report_row_position'),
+        ),
+        migrations.RunPython(move_inline_rows, restore_inline_rows),
+    ]
@@ -0,0 +1,86 @@
+# Generated by Django 4.2.10 on 2026-10-17 01:45
+
+from django.conf import settings
+import django.core.serializers.json
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+def move_audit_reports(apps, schema_editor):
+    """Copy Report(report_type='audit') rows into AuditEvent and drop them from Report"""
+    Report = apps.get_model('core', 'Report')
+    AuditEvent = apps.get_model('core', 'AuditEvent')
+    audit_reports = Report.objects.filter(report_type='audit').select_related('generated_by')
+    batch = []
+    for report in audit_reports.order_by('pk').iterator(chunk_size=2000):
+        batch.append(AuditEvent(
+            created_at=report.created_at,
+            actor=report.generated_by,
+            actor_username=report.generated_by.username if report.generated_by else '',
+            action='legacy',
+            summary=report.title[:255],
+            detail=report.description,
+        ))
+        if len(batch) >= 2000:
+            AuditEvent.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        AuditEvent.objects.bulk_create(batch)
+    audit_reports.delete()
+
+
+def _restore_batch(Report, events):
+    reports = Report.objects.bulk_create([
+        Report(title=event.summary, report_type='audit', description=event.detail, generated_by_id=event.actor_id)
+        for event in events
+    ])
+    # Report.created_at is auto_now_add, so the original times are set afterwards
+    for report, event in zip(reports, events):
+        report.created_at = event.created_at
+    Report.objects.bulk_update(reports, ['created_at'])
+
+
+def restore_audit_reports(apps, schema_editor):
+    """Copy every AuditEvent back into Report(report_type='audit') before the table is dropped"""
+    Report = apps.get_model('core', 'Report')
+    AuditEvent = apps.get_model('core', 'AuditEvent')
+    batch = []
+    for event in AuditEvent.objects.order_by('created_at', 'pk').iterator(chunk_size=2000):
+        batch.append(event)
+        if len(batch) >= 2000:
+            _restore_batch(Report, batch)
+            batch = []
+    if batch:
+        _restore_batch(Report, batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('core', '0008_reportrow'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuditEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('actor_username', models.CharField(blank=True, max_length=150)),
+                ('action', models.CharField(choices=[('create', 'Create'), ('update', 'Update'), ('delete', 'Delete'), ('bulk_update', 'Bulk Update'), ('status_change', 'Status Change'), ('export', 'Export'), ('legacy', 'Legacy')], max_length=20)),
+                ('object_type', models.CharField(blank=True, max_length=50)),
+                ('object_id', models.CharField(blank=True, max_length=64)),
+                ('summary', models.CharField(max_length=255)),
+                ('detail', models.TextField(blank=True)),
+                ('changes', models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('actor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='audit_events', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['created_at'], name='core_audite_created_9a257b_idx'), models.Index(fields=['actor', 'created_at'], name='core_audite_actor_i_5b4f87_idx'), models.Index(fields=['action', 'created_at'], name='core_audite_action_3957f4_idx'), models.Index(fields=['object_type', 'object_id', 'created_at'], name='core_audite_object__297895_idx')],
+            },
+        ),
+        migrations.RunPython(move_audit_reports, restore_audit_reports),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.10 on 2026-10-17 01:47
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('core', '0009_auditevent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='engagement',
+            name='created_by',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='created_engagements', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
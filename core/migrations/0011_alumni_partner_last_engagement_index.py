@@ -0,0 +1,45 @@
+# Generated by Django 4.2.10 on 2026-10-17 01:54
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def recompute_last_engagement(apps, schema_editor):
+    """Nothing kept last_engagement up to date before, so recompute it once"""
+    Engagement = apps.get_model('core', 'Engagement')
+    for model_name, fk in (('Alumni', 'alumni'), ('Partner', 'partner')):
+        model = apps.get_model('core', model_name)
+        newest = (
+            Engagement.objects.filter(**{fk: OuterRef('pk')})
+            .order_by('-engagement_date').values('engagement_date')[:1]
+        )
+        model.objects.update(last_engagement=Subquery(newest))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_engagement_created_by'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='alumni',
+            name='last_engagement',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AlterField(
+            model_name='partner',
+            name='last_engagement',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='alumni',
+            index=models.Index(fields=['last_engagement'], name='core_alumni_last_en_483ea6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='partner',
+            index=models.Index(fields=['last_engagement'], name='core_partne_last_en_3b3129_idx'),
+        ),
+        migrations.RunPython(recompute_last_engagement, migrations.RunPython.noop),
+    ]
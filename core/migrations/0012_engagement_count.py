@@ -0,0 +1,45 @@
+# Generated by Django 4.2.10 on 2026-10-17 01:57
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_engagements(apps, schema_editor):
+    Engagement = apps.get_model('core', 'Engagement')
+    for model_name, fk in (('Alumni', 'alumni'), ('Partner', 'partner')):
+        model = apps.get_model('core', model_name)
+        counts = (
+            Engagement.objects.filter(**{fk: OuterRef('pk')}).order_by()
+            .values(fk).annotate(count=Count('pk')).values('count')
+        )
+        model.objects.update(engagement_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_alumni_partner_last_engagement_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='alumni',
+            name='engagement_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='partner',
+            name='engagement_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='alumni',
+            index=models.Index(fields=['-engagement_count'], name='core_alumni_engagem_25be5c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='partner',
+            index=models.Index(fields=['-engagement_count', 'name'], name='core_partne_engagem_3d8e71_idx'),
+        ),
+        migrations.RunPython(count_engagements, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,49 @@
+from django.conf import settings
+from django.db import migrations
+
+
+# Expression indexes on auth_user for case-insensitive username/email logins
+# (core.backends.UsernameOrEmailBackend filters on exactly these expressions).
+# auth_user belongs to django.contrib.auth, so the indexes are raw SQL from
+# this app, created and dropped only on PostgreSQL and SQLite; elsewhere both
+# directions are no-ops and logins use an unindexed LOWER() scan. Rolling
+# back core past this migration drops them.
+INDEXES = [
+    ('core_auth_user_username_lower', 'username'),
+    ('core_auth_user_email_lower', 'email'),
+]
+
+
+def _user_table(apps, schema_editor):
+    app_label, model_name = settings.AUTH_USER_MODEL.split('.')
+    return schema_editor.quote_name(apps.get_model(app_label, model_name)._meta.db_table)
+
+
+def create_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor not in ('postgresql', 'sqlite'):
+        return
+    table = _user_table(apps, schema_editor)
+    for name, column in INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {schema_editor.quote_name(name)} "
+            f"ON {table} (LOWER({schema_editor.quote_name(column)}))"
+        )
+
+
+def drop_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor not in ('postgresql', 'sqlite'):
+        return
+    for name, _ in INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {schema_editor.quote_name(name)}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('core', '0012_engagement_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
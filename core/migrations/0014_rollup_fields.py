@@ -0,0 +1,34 @@
+# Generated by Django 4.2.10 on 2026-10-17 02:31
+
+import core.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_user_login_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='alumni',
+            name='engagement_count',
+            field=core.models.RollupCountField(default=0, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='alumni',
+            name='last_engagement',
+            field=core.models.RollupDateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AlterField(
+            model_name='partner',
+            name='engagement_count',
+            field=core.models.RollupCountField(default=0, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='partner',
+            name='last_engagement',
+            field=core.models.RollupDateTimeField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -1,10 +1,166 @@
-from django.db import models
+from django.db import models, transaction
+from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import URLValidator
 from django.utils import timezone
 from django.contrib.auth.models import User
 
 
-class Alumni(models.Model):
+def normalize_company(value):
+    """Lowercase a company name and collapse whitespace for indexed lookups"""
+    return ' '.join((value or '').split()).lower()
+
+
+class StatsTrackedQuerySet(models.QuerySet):
+    """QuerySet that keeps StatsSnapshot counters and cached responses in step with bulk writes"""
+
+    def update(self, **kwargs):
+        from . import response_cache, stats
+
+        fields = [f for f in kwargs if f in stats.tracked_fields(self.model)]
+        with transaction.atomic(using=self.db):
+            response_cache.invalidate(self.model._meta.model_name, using=self.db)
+            if not fields:
+                return super().update(**kwargs)
+            # Group by pk so a filter across a multi-valued relation (e.g.
+            # engagements__...) still counts each affected row once
+            affected = self.model._base_manager.using(self.db).filter(pk__in=self.values('pk'))
+            before = stats.grouped_counts(affected, fields)
+            rows = super().update(**kwargs)
+            stats.apply_bulk_update(self.model, before, kwargs)
+        return rows
+
+    def bulk_create(self, objs, *args, **kwargs):
+        from . import response_cache, stats
+
+        objs = list(objs)
+        with transaction.atomic(using=self.db):
+            response_cache.invalidate(self.model._meta.model_name, using=self.db)
+            created = super().bulk_create(objs, *args, **kwargs)
+            if kwargs.get('ignore_conflicts') or kwargs.get('update_conflicts'):
+                stats.rebuild([self.model])
+            else:
+                stats.apply_bulk_create(self.model, created)
+        return created
+
+    def delete(self):
+        from . import stats
+
+        with transaction.atomic(using=self.db), stats.deferred():
+            return super().delete()
+
+
+class EngagementQuerySet(StatsTrackedQuerySet):
+    """Engagement queryset that also keeps the alumni/partner engagement rollups in step on bulk writes"""
+
+    def update(self, **kwargs):
+        from . import last_engagement
+
+        moved = {name[:-3] if name.endswith('_id') else name for name in kwargs} & {'alumni', 'partner', 'engagement_date'}
+        if not moved:
+            return super().update(**kwargs)
+        with transaction.atomic(using=self.db):
+            rows_before = list(self.order_by().values_list('pk', 'alumni_id', 'partner_id'))
+            affected = {(alumni_id, partner_id) for _, alumni_id, partner_id in rows_before}
+            rows = super().update(**kwargs)
+            if {'alumni', 'partner'} & moved:
+                # The queryset's own filter may no longer match the moved rows
+                pks = [pk for pk, _, _ in rows_before]
+                for start in range(0, len(pks), last_engagement.ADVANCE_CHUNK_SIZE):
+                    affected.update(
+                        self.model.objects.using(self.db).filter(pk__in=pks[start:start + last_engagement.ADVANCE_CHUNK_SIZE])
+                        .order_by().values_list('alumni_id', 'partner_id')
+                    )
+            last_engagement.recompute_for(affected, using=self.db)
+        return rows
+
+    def bulk_create(self, objs, *args, **kwargs):
+        from . import last_engagement
+
+        objs = list(objs)
+        with transaction.atomic(using=self.db):
+            created = super().bulk_create(objs, *args, **kwargs)
+            if kwargs.get('ignore_conflicts') or kwargs.get('update_conflicts'):
+                # Which rows were actually inserted is unknown
+                last_engagement.recompute_for(
+                    [(obj.alumni_id, obj.partner_id) for obj in created], using=self.db
+                )
+            else:
+                last_engagement.advance(created, using=self.db)
+        return created
+
+    def delete(self):
+        from . import last_engagement
+
+        with transaction.atomic(using=self.db):
+            affected = set(self.order_by().values_list('alumni_id', 'partner_id').distinct())
+            with last_engagement.suppressed():
+                result = super().delete()
+            last_engagement.recompute_for(affected, using=self.db)
+        return result
+
+
+class RollupFieldMixin:
+    """Column written only by core.last_engagement.
+
+    save() of an existing row sets the column to itself, so an instance
+    loaded before an engagement was recorded cannot overwrite the newer
+    value. Inserts store the field's value as usual.
+    """
+    
+    def pre_save(self, model_instance, add):
+        if add:
+            return super().pre_save(model_instance, add)
+        return models.F(self.attname)
+
+
+class RollupCountField(RollupFieldMixin, models.PositiveIntegerField):
+    pass
+
+
+class RollupDateTimeField(RollupFieldMixin, models.DateTimeField):
+    pass
+
+
+class StatsTrackedModel(models.Model):
+    """Model whose delete() counts its cascaded rows out of StatsSnapshot in one pass"""
+    
+    def delete(self, using=None, keep_parents=False):
+        from . import stats
+
+        with transaction.atomic(using=using or self._state.db), stats.deferred():
+            return super().delete(using=using, keep_parents=keep_parents)
+    
+    class Meta:
+        abstract = True
+
+
+class EngagementRollupModel(models.Model):
+    """Base for models with engagement rollups maintained by core.last_engagement"""
+    
+    engagement_count = RollupCountField(default=0, editable=False)
+    last_engagement = RollupDateTimeField(blank=True, null=True, editable=False)
+    
+    class Meta:
+        abstract = True
+
+
+class AlumniQuerySet(StatsTrackedQuerySet):
+    """Alumni queryset that also keeps company_normalized in step on bulk writes"""
+
+    def update(self, **kwargs):
+        company = kwargs.get('current_company')
+        if company is not None and not hasattr(company, 'resolve_expression'):
+            kwargs['company_normalized'] = normalize_company(company)
+        return super().update(**kwargs)
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        for obj in objs:
+            obj.company_normalized = normalize_company(obj.current_company)
+        return super().bulk_create(objs, *args, **kwargs)
+
+
+class Alumni(StatsTrackedModel, EngagementRollupModel):
     """Alumni profile model for tracking alumni information"""
     
     DEGREE_CHOICES = [
@@ -38,6 +194,7 @@ class Alumni(models.Model):
     
     # Professional Information
     current_company = models.CharField(max_length=255, blank=True)
+    company_normalized = models.CharField(max_length=255, blank=True, editable=False)
     job_title = models.CharField(max_length=255, blank=True)
     industry = models.CharField(max_length=100, blank=True)
     
@@ -49,7 +206,8 @@ class Alumni(models.Model):
     # Tracking
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    last_engagement = models.DateTimeField(blank=True, null=True)
+    
+    objects = AlumniQuerySet.as_manager()
     
     class Meta:
         ordering = ['-created_at']
@@ -57,13 +215,23 @@ class Alumni(models.Model):
             models.Index(fields=['email']),
             models.Index(fields=['graduation_year']),
             models.Index(fields=['status']),
+            models.Index(fields=['company_normalized']),
+            models.Index(fields=['last_engagement']),
+            models.Index(fields=['-engagement_count']),
         ]
     
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
+    
+    def save(self, *args, **kwargs):
+        self.company_normalized = normalize_company(self.current_company)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'current_company' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'company_normalized'}
+        super().save(*args, **kwargs)
 
 
-class Partner(models.Model):
+class Partner(StatsTrackedModel, EngagementRollupModel):
     """Partner organization model for tracking industry and institutional partners"""
     
     PARTNER_TYPE_CHOICES = [
@@ -115,7 +283,8 @@ class Partner(models.Model):
     notes = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    last_engagement = models.DateTimeField(blank=True, null=True)
+    
+    objects = StatsTrackedQuerySet.as_manager()
     
     class Meta:
         ordering = ['-created_at']
@@ -123,13 +292,15 @@ class Partner(models.Model):
             models.Index(fields=['name']),
             models.Index(fields=['partner_type']),
             models.Index(fields=['engagement_level']),
+            models.Index(fields=['last_engagement']),
+            models.Index(fields=['-engagement_count', 'name']),
         ]
     
     def __str__(self):
         return self.name
 
 
-class Engagement(models.Model):
+class Engagement(StatsTrackedModel):
     """Engagement tracking between alumni and partners"""
     
     ENGAGEMENT_TYPE_CHOICES = [
@@ -150,9 +321,19 @@ class Engagement(models.Model):
     engagement_date = models.DateTimeField()
     
     notes = models.TextField(blank=True)
+    created_by = models.ForeignKey(
+        'auth.User',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='created_engagements'
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = EngagementQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-engagement_date']
         indexes = [
@@ -197,3 +378,168 @@ class Report(models.Model):
     
     def __str__(self):
         return f"{self.title} ({self.report_type})"
+
+
+class ReportRow(models.Model):
+    """One result row of a report, stored outside Report.data.
+
+    `values` holds the row as a list ordered like the report's
+    data['columns'], so a large result set neither bloats the report's JSON
+    nor repeats the column names on every row.
+    """
+    
+    report = models.ForeignKey(Report, on_delete=models.CASCADE, related_name='rows')
+    position = models.PositiveIntegerField()
+    values = models.JSONField(default=list)
+    
+    class Meta:
+        ordering = ['position']
+        constraints = [
+            models.UniqueConstraint(fields=['report', 'position'], name='unique_report_row_position'),
+        ]
+    
+    def __str__(self):
+        return f"Row {self.position} of report {self.report_id}"
+
+
+class StatsSnapshot(models.Model):
+    """Materialized counters backing the statistics endpoints.
+
+    One row per (dimension, value) pair, e.g. ('alumni_degree', 'BS'). Totals
+    are stored under '<model>_total' with an empty value. Rows are kept up to
+    date by core.stats and can be rebuilt with `manage.py rebuild_stats`.
+    """
+    
+    dimension = models.CharField(max_length=50)
+    value = models.CharField(max_length=255, blank=True)
+    count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ['dimension', 'value']
+        constraints = [
+            models.UniqueConstraint(fields=['dimension', 'value'], name='unique_stats_dimension_value'),
+        ]
+    
+    def __str__(self):
+        return f"{self.dimension}={self.value}: {self.count}"
+
+
+class ReportJob(models.Model):
+    """Queued report generation request, processed by `manage.py run_report_worker`"""
+    
+    REPORT_TYPE_CHOICES = [
+        ('alumni_summary', 'Alumni Summary'),
+        ('partner_summary', 'Partner Summary'),
+        ('engagement_analytics', 'Engagement Analytics'),
+        ('custom_filtered', 'Custom Filtered'),
+    ]
+    
+    OUTPUT_CHOICES = [
+        ('json', 'JSON'),
+        ('pdf', 'PDF'),
+    ]
+    
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCEEDED = 'succeeded'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, 'Queued'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_SUCCEEDED, 'Succeeded'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+    
+    report_type = models.CharField(max_length=50, choices=REPORT_TYPE_CHOICES)
+    output = models.CharField(max_length=10, choices=OUTPUT_CHOICES, default='json')
+    params = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    
+    report = models.ForeignKey(Report, on_delete=models.SET_NULL, null=True, blank=True, related_name='jobs')
+    error = models.TextField(blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    worker = models.CharField(max_length=100, blank=True)
+    
+    requested_by = models.ForeignKey(
+        'auth.User',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='report_jobs'
+    )
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+    
+    def __str__(self):
+        return f"{self.report_type} job #{self.pk} ({self.status})"
+    
+    @property
+    def finished(self):
+        return self.status in (self.STATUS_SUCCEEDED, self.STATUS_FAILED)
+
+
+class AuditEventQuerySet(models.QuerySet):
+    """Audit events are append-only: rows may be archived (deleted) but never edited"""
+
+    def update(self, **kwargs):
+        raise TypeError("Audit events are append-only and cannot be updated")
+
+
+class AuditEvent(models.Model):
+    """Append-only audit trail entry, written through core.audit"""
+    
+    ACTION_CHOICES = [
+        ('create', 'Create'),
+        ('update', 'Update'),
+        ('delete', 'Delete'),
+        ('bulk_update', 'Bulk Update'),
+        ('status_change', 'Status Change'),
+        ('export', 'Export'),
+        ('legacy', 'Legacy'),
+    ]
+    
+    created_at = models.DateTimeField(default=timezone.now)
+    actor = models.ForeignKey(
+        'auth.User',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='audit_events'
+    )
+    # Kept so the trail still names the actor after the user is deleted
+    actor_username = models.CharField(max_length=150, blank=True)
+    action = models.CharField(max_length=20, choices=ACTION_CHOICES)
+    object_type = models.CharField(max_length=50, blank=True)
+    object_id = models.CharField(max_length=64, blank=True)
+    summary = models.CharField(max_length=255)
+    detail = models.TextField(blank=True)
+    # Field name -> [old value, new value]
+    changes = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+    
+    objects = AuditEventQuerySet.as_manager()
+    
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at']),
+            models.Index(fields=['actor', 'created_at']),
+            models.Index(fields=['action', 'created_at']),
+            models.Index(fields=['object_type', 'object_id', 'created_at']),
+        ]
+    
+    def __str__(self):
+        return f"{self.created_at:%Y-%m-%d %H:%M} {self.summary}"
+    
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise TypeError("Audit events are append-only and cannot be updated")
+        super().save(*args, **kwargs)
@@ -0,0 +1,265 @@
+import base64
+import binascii
+import datetime
+import json
+from functools import reduce
+import operator
+
+from django.core.paginator import Paginator
+from django.db import DatabaseError, connections
+from django.db.models import F, Q, QuerySet
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """Cursor pagination keyed on the view's ordering fields plus the primary key.
+
+    Each page is fetched with a `WHERE (ordering fields, pk) > (last row)`
+    condition instead of an OFFSET, so deep pages cost the same as the first
+    one and no COUNT(*) is run. The cursor is an opaque token holding the
+    ordering values of the boundary row.
+
+    Querysets ordered by full-text relevance (`search_rank`, see
+    core.search) have no stable column to key on, so their cursor holds an
+    offset instead; search results are short-lived and rarely paged deeply.
+    """
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def __init__(self, page_size):
+        self.page_size = page_size
+
+    def get_ordering(self, request, queryset, view):
+        ordering = None
+        for backend in getattr(view, 'filter_backends', []):
+            if issubclass(backend, OrderingFilter):
+                ordering = backend().get_ordering(request, queryset, view)
+                break
+        ordering = list(ordering or queryset.model._meta.ordering or ['-pk'])
+
+        names = {term.lstrip('-') for term in ordering}
+        if not names & {'pk', 'id'}:
+            ordering.append('-pk' if ordering[0].startswith('-') else 'pk')
+        return [(term.lstrip('-'), term.startswith('-')) for term in ordering]
+
+    def is_ranked(self, queryset):
+        """Whether `queryset` is ordered by full-text relevance"""
+        return any(str(term).lstrip('-') == 'search_rank' for term in queryset.query.order_by)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')))
+            if self.offset is not None:
+                offset = int(payload['o'])
+                if offset < 0:
+                    raise ValueError(offset)
+                return offset, False
+            return list(payload['p']), bool(payload.get('r'))
+        except (TypeError, ValueError, KeyError, UnicodeEncodeError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, payload):
+        payload = json.dumps(payload, separators=(',', ':'))
+        encoded = base64.urlsafe_b64encode(payload.encode('ascii')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def _field(self, name):
+        return self.model._meta.pk if name == 'pk' else self.model._meta.get_field(name)
+
+    def _order_expression(self, name, descending):
+        # NULLs always sort after non-null values in the forward direction so
+        # that the keyset condition is the same on every database backend.
+        nulls = {}
+        if self._field(name).null:
+            nulls = {'nulls_first': True} if self.reverse else {'nulls_last': True}
+        if descending != self.reverse:
+            return F(name).desc(**nulls)
+        return F(name).asc(**nulls)
+
+    def _after(self, name, descending, value):
+        """Condition for rows strictly after `value` in this field's page order"""
+        nullable = self._field(name).null
+        if value is None:
+            # NULLs sort last going forward, first going backward
+            return Q(**{f'{name}__isnull': False}) if self.reverse else None
+        lookup = 'lt' if descending != self.reverse else 'gt'
+        condition = Q(**{f'{name}__{lookup}': value})
+        if nullable and not self.reverse:
+            condition |= Q(**{f'{name}__isnull': True})
+        return condition
+
+    def _equal(self, name, value):
+        if value is None:
+            return Q(**{f'{name}__isnull': True})
+        return Q(**{name: value})
+
+    def _keyset_filter(self, position):
+        terms = []
+        for index, (name, descending) in enumerate(self.ordering):
+            after = self._after(name, descending, position[index])
+            if after is None:
+                continue
+            prefix = [self._equal(n, position[i]) for i, (n, _) in enumerate(self.ordering[:index])]
+            terms.append(reduce(operator.and_, prefix + [after]))
+        if not terms:
+            return Q(pk__in=[])
+        return reduce(operator.or_, terms)
+
+    def _position(self, instance):
+        position = []
+        for name, _ in self.ordering:
+            value = getattr(instance, name)
+            if isinstance(value, (datetime.date, datetime.time)):
+                value = value.isoformat()
+            position.append(value)
+        return position
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.model = queryset.model
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.offset = None
+        if self.is_ranked(queryset):
+            self.offset = 0
+            return self.paginate_by_offset(queryset, request)
+
+        position, self.reverse = self.decode_cursor(request)
+        if position is not None:
+            if len(position) != len(self.ordering):
+                raise NotFound(self.invalid_cursor_message)
+            try:
+                position = [
+                    None if value is None else self._field(name).to_python(value)
+                    for (name, _), value in zip(self.ordering, position)
+                ]
+            except Exception:
+                raise NotFound(self.invalid_cursor_message)
+            queryset = queryset.filter(self._keyset_filter(position))
+
+        queryset = queryset.order_by(*[self._order_expression(n, d) for n, d in self.ordering])
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if self.reverse:
+            results.reverse()
+
+        self.page = results
+        if self.reverse:
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+        return results
+
+    def paginate_by_offset(self, queryset, request):
+        """Page a relevance-ordered queryset by OFFSET"""
+        offset, self.reverse = self.decode_cursor(request)
+        self.offset = offset or 0
+        results = list(queryset[self.offset:self.offset + self.page_size + 1])
+        self.page = results[:self.page_size]
+        self.has_next, self.has_previous = len(results) > self.page_size, self.offset > 0
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        if self.offset is not None:
+            return self.encode_cursor({'o': self.offset + self.page_size})
+        return self.encode_cursor({'p': self._position(self.page[-1]), 'r': False})
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if self.offset is not None:
+            return self.encode_cursor({'o': max(self.offset - self.page_size, 0)})
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor({'p': self._position(self.page[0]), 'r': True})
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+
+class StandardPagination(PageNumberPagination):
+    """Page-number pagination, or keyset pagination when `?cursor=` is present"""
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = KeysetPagination.cursor_query_param
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if self.cursor_query_param in request.query_params:
+            self.keyset = KeysetPagination(self.get_page_size(request))
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+
+class KeysetListPagination(StandardPagination):
+    """Keyset pagination on every page; the first page is the one without a cursor"""
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = KeysetPagination(self.get_page_size(request))
+        return self.keyset.paginate_queryset(queryset, request, view)
+
+
+# Unfiltered tables with at least this many rows (by the planner's estimate)
+# are counted from statistics instead of COUNT(*)
+ESTIMATED_COUNT_THRESHOLD = 100000
+
+
+def estimated_row_count(model, using='default'):
+    """Planner statistics row estimate for the model's table, or None when unavailable"""
+    connection = connections[using]
+    table = model._meta.db_table
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [table])
+            elif connection.vendor == 'sqlite':
+                # sqlite_stat1 only exists once ANALYZE has run
+                cursor.execute("SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1", [table])
+            else:
+                return None
+            row = cursor.fetchone()
+    except DatabaseError:
+        return None
+    if row is None:
+        return None
+    estimate = int(str(row[0]).split()[0])
+    return estimate if estimate >= 0 else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that uses the planner's row estimate for large unfiltered tables.
+
+    Counting a million-row table on every admin changelist page is the
+    slowest part of the page; the estimate is close enough for page links.
+    Filtered querysets are still counted exactly.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if isinstance(queryset, QuerySet) and not queryset.query.where:
+            estimate = estimated_row_count(queryset.model, queryset.db)
+            if estimate is not None and estimate >= ESTIMATED_COUNT_THRESHOLD:
+                return estimate
+        return super().count
@@ -0,0 +1,34 @@
+import codecs
+import json
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class NDJSONParser(BaseParser):
+    """Parse newline-delimited JSON lazily, one object per line.
+
+    `request.data` is a generator, so large imports are consumed as they are
+    read instead of being loaded into memory. A line that is not valid JSON
+    yields a ParseError instance in its place so callers can report it
+    against that row and carry on.
+    """
+    media_type = 'application/x-ndjson'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if stream is None:
+            return iter(())
+        return self._rows(codecs.getreader(encoding)(stream))
+
+    def _rows(self, reader):
+        for line in reader:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as exc:
+                yield ParseError(f'JSON parse error - {exc}')
@@ -0,0 +1,335 @@
+"""PDF rendering for reports (requires reportlab)"""
+import io
+from itertools import islice
+
+from .reports import report_rows
+
+try:
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    from reportlab.platypus import Paragraph
+    REPORTLAB_AVAILABLE = True
+except Exception:
+    REPORTLAB_AVAILABLE = False
+
+
+def create_pdf_bytes(title, data_lines):
+    """Create a simple PDF in-memory from title and list of text lines.
+
+    Returns bytes of PDF. Requires reportlab.
+    """
+    if not REPORTLAB_AVAILABLE:
+        return None
+
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=letter)
+    width, height = letter
+    y = height - 72
+    c.setFont('Helvetica-Bold', 16)
+    c.drawString(72, y, title)
+    y -= 28
+    c.setFont('Helvetica', 10)
+    for line in data_lines:
+        if y < 72:
+            c.showPage()
+            y = height - 72
+            c.setFont('Helvetica', 10)
+        c.drawString(72, y, line)
+        y -= 14
+
+    c.showPage()
+    c.save()
+    pdf = buffer.getvalue()
+    buffer.close()
+    return pdf
+
+
+# Streamed tables: fixed row heights let each page's capacity be computed
+# up front, so rows are pulled from the iterator one page at a time.
+PAGE_MARGIN = 36
+TABLE_HEADER_HEIGHT = 20
+TABLE_ROW_HEIGHT = 14
+TABLE_HEADER_COLOR = '#0056b3'
+CELL_PADDING = 6
+ELLIPSIS = '\u2026'
+
+
+def _fit(value, font, size, width):
+    """`value` as text, cut down with an ellipsis to fit `width` points"""
+    text = str(value)
+    if stringWidth(text, font, size) <= width:
+        return text
+    # Longest prefix that fits along with the ellipsis
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if stringWidth(text[:middle] + ELLIPSIS, font, size) <= width:
+            low = middle
+        else:
+            high = middle - 1
+    return text[:low].rstrip() + ELLIPSIS
+
+
+def _draw_table_page(c, x, top, columns, col_widths, rows):
+    """Draw one page of a table with the header row at `top`; returns its height"""
+    total_width = sum(col_widths)
+    height = TABLE_HEADER_HEIGHT + TABLE_ROW_HEIGHT * len(rows)
+    bottom = top - height
+
+    c.setFillColor(colors.HexColor(TABLE_HEADER_COLOR))
+    c.rect(x, top - TABLE_HEADER_HEIGHT, total_width, TABLE_HEADER_HEIGHT, stroke=0, fill=1)
+
+    c.setStrokeColor(colors.lightgrey)
+    c.setLineWidth(0.5)
+    lines = [(x, top, x + total_width, top), (x, top - TABLE_HEADER_HEIGHT, x + total_width, top - TABLE_HEADER_HEIGHT)]
+    lines += [
+        (x, top - TABLE_HEADER_HEIGHT - TABLE_ROW_HEIGHT * (i + 1), x + total_width, top - TABLE_HEADER_HEIGHT - TABLE_ROW_HEIGHT * (i + 1))
+        for i in range(len(rows))
+    ]
+    edge = x
+    for col_width in [0] + list(col_widths):
+        edge += col_width
+        lines.append((edge, top, edge, bottom))
+    c.lines(lines)
+
+    c.setFillColor(colors.white)
+    c.setFont('Helvetica-Bold', 10)
+    edge = x
+    for column, col_width in zip(columns, col_widths):
+        text = _fit(column, 'Helvetica-Bold', 10, col_width - 2 * CELL_PADDING)
+        c.drawString(edge + CELL_PADDING, top - TABLE_HEADER_HEIGHT + 7, text)
+        edge += col_width
+
+    c.setFillColor(colors.black)
+    c.setFont('Helvetica', 9)
+    baseline = top - TABLE_HEADER_HEIGHT - TABLE_ROW_HEIGHT + 4
+    for row in rows:
+        edge = x
+        for value, col_width in zip(row, col_widths):
+            c.drawString(edge + CELL_PADDING, baseline, _fit(value, 'Helvetica', 9, col_width - 2 * CELL_PADDING))
+            edge += col_width
+        baseline -= TABLE_ROW_HEIGHT
+    return height
+
+
+def _finish_page(c, page):
+    width, _ = letter
+    c.setFillColor(colors.black)
+    c.setFont('Helvetica', 8)
+    c.drawRightString(width - PAGE_MARGIN, PAGE_MARGIN / 2, f"Page {page}")
+    c.showPage()
+
+
+def render_table(out, title, preamble, columns, col_widths, rows):
+    """Write a PDF with a title, intro paragraphs and a long table to `out`.
+
+    `preamble` is a list of (text, style name) paragraphs shown before the
+    table, continuing onto further pages when it is long. Cells are cut to
+    their column width. `rows` may be any iterable (e.g. a queryset
+    iterator); it is consumed one page at a time and each page's table is
+    drawn straight onto the canvas, so time grows linearly with the row
+    count and only one page of rows is held at once. Returns the number of
+    rows written.
+    """
+    c = canvas.Canvas(out, pagesize=letter, pageCompression=1)
+    width, height = letter
+    styles = getSampleStyleSheet()
+    frame_width = width - 2 * PAGE_MARGIN
+    top = height - PAGE_MARGIN
+    page = 1
+
+    y = top
+    pending = [Paragraph(text, styles[style]) for text, style in [(f"<b>{title}</b>", 'Title')] + list(preamble)]
+    while pending:
+        paragraph = pending.pop(0)
+        available = y - PAGE_MARGIN
+        _, paragraph_height = paragraph.wrapOn(c, frame_width, available)
+        if paragraph_height > available:
+            parts = paragraph.split(frame_width, available)
+            if parts or y < top:
+                # Draw the lines that fit here and carry the rest to a new page
+                if parts:
+                    _, part_height = parts[0].wrapOn(c, frame_width, available)
+                    parts[0].drawOn(c, PAGE_MARGIN, y - part_height)
+                pending[:0] = parts[1:] if parts else [paragraph]
+                _finish_page(c, page)
+                page += 1
+                y = top
+                continue
+        y -= paragraph_height + 4
+        paragraph.drawOn(c, PAGE_MARGIN, y)
+    y -= 8
+    if y - PAGE_MARGIN - TABLE_HEADER_HEIGHT < TABLE_ROW_HEIGHT:
+        # No room left for the header and a row
+        _finish_page(c, page)
+        page += 1
+        y = top
+
+    rows = iter(rows)
+    written = 0
+    while True:
+        capacity = max(1, int((y - PAGE_MARGIN - TABLE_HEADER_HEIGHT) // TABLE_ROW_HEIGHT))
+        chunk = list(islice(rows, capacity))
+        if chunk or written == 0:
+            _draw_table_page(c, PAGE_MARGIN, y, columns, col_widths, chunk)
+            written += len(chunk)
+        _finish_page(c, page)
+        if len(chunk) < capacity:
+            break
+        page += 1
+        y = top
+    c.save()
+    return written
+
+
+def create_custom_filtered_pdf(report, out):
+    """Write a PDF with a table for custom filtered reports to `out`."""
+    data = report.data or {}
+    preamble = []
+
+    # Add timestamp
+    if report.created_at:
+        timestamp = report.created_at.strftime("%B %d, %Y at %I:%M %p")
+        preamble.append((f"<i>Generated: {timestamp}</i>", 'Normal'))
+
+    # Add summary section
+    if data.get('scope') == 'partners':
+        summary_text = f"<b>Summary:</b> {data.get('total_partners', 0)} partners found"
+    else:
+        summary_text = f"<b>Summary:</b> {data.get('total_alumni', 0)} alumni found"
+    preamble.append((summary_text, 'Normal'))
+
+    filters = data.get('filters') or {}
+    filter_lines = []
+    for key, value in filters.items():
+        if value not in [None, '', []]:
+            filter_lines.append(f"{key}: {value}")
+    if not filter_lines:
+        filter_lines.append("No filters applied")
+
+    preamble.append(("<b>Filters</b>", 'Heading4'))
+    for line in filter_lines:
+        preamble.append((line, 'BodyText'))
+
+    def table_rows():
+        for row in report_rows(report):
+            name = f"{row.get('first_name', '')} {row.get('last_name', '')}".strip()
+            yield [
+                name or "-",
+                row.get('email') or "-",
+                row.get('graduation_year') or "-",
+                row.get('phone') or "-",
+            ]
+
+    render_table(
+        out,
+        report.title or "Filtered Report",
+        preamble,
+        ["Name", "Email", "Graduation Year", "Phone"],
+        [160, 200, 90, 90],
+        table_rows(),
+    )
+
+
+def report_lines(report):
+    """Convert a Report object into a list of text lines for PDF output."""
+    data = report.data or {}
+
+    if report.report_type == 'alumni_summary':
+        lines = [
+            f"Total alumni: {data.get('total_alumni', 0)}",
+            f"Active alumni: {data.get('active_alumni', 0)}",
+            f"Inactive alumni: {data.get('inactive_alumni', 0)}",
+            "",
+            "By degree:",
+        ]
+        for deg, cnt in (data.get('by_degree') or {}).items():
+            lines.append(f"- {deg}: {cnt}")
+        return lines
+
+    if report.report_type == 'partner_summary':
+        lines = [
+            f"Total partners: {data.get('total_partners', 0)}",
+            "",
+            "By type:",
+        ]
+        for t, cnt in (data.get('by_type') or {}).items():
+            lines.append(f"- {t}: {cnt}")
+        lines.append("")
+        lines.append("By engagement level:")
+        for lvl, cnt in (data.get('by_engagement_level') or {}).items():
+            lines.append(f"- {lvl}: {cnt}")
+        return lines
+
+    if report.report_type == 'engagement_analytics':
+        lines = [
+            f"Total engagements: {data.get('total_engagements', 0)}",
+            "",
+            "By type:",
+        ]
+        for t, cnt in (data.get('by_type') or {}).items():
+            lines.append(f"- {t}: {cnt}")
+        lines.append("")
+        lines.append("Top partners:")
+        for p in (data.get('top_partners') or []):
+            lines.append(f"- {p.get('name')}: {p.get('count')}")
+        return lines
+
+    if report.report_type == 'custom_filtered':
+        scope = data.get('scope') or 'alumni'
+        filters = data.get('filters') or {}
+        lines = [
+            f"Scope: {scope}",
+            "",
+            "Filters:",
+        ]
+        if filters:
+            for key, value in filters.items():
+                if value not in [None, '', []]:
+                    lines.append(f"- {key}: {value}")
+        else:
+            lines.append("- None")
+
+        lines.append("")
+        if scope == 'partners':
+            lines.append(f"Total partners: {data.get('total_partners', 0)}")
+            lines.append("By type:")
+            for t, cnt in (data.get('by_type') or {}).items():
+                lines.append(f"- {t}: {cnt}")
+            lines.append("By engagement level:")
+            for lvl, cnt in (data.get('by_engagement_level') or {}).items():
+                lines.append(f"- {lvl}: {cnt}")
+            return lines
+
+        lines.append(f"Total alumni: {data.get('total_alumni', 0)}")
+        lines.append("By status:")
+        for s, cnt in (data.get('by_status') or {}).items():
+            lines.append(f"- {s}: {cnt}")
+        lines.append("By degree:")
+        for deg, cnt in (data.get('by_degree') or {}).items():
+            lines.append(f"- {deg}: {cnt}")
+        lines.append("By graduation year:")
+        for yr, cnt in (data.get('by_graduation_year') or {}).items():
+            lines.append(f"- {yr}: {cnt}")
+        return lines
+
+    # Fallback
+    return ["Report data:", str(data)]
+
+
+def render_report(report, out):
+    """Write a Report's PDF to the file object `out`.
+
+    Returns False when reportlab is unavailable.
+    """
+    if not REPORTLAB_AVAILABLE:
+        return False
+    if report.report_type == 'custom_filtered':
+        # Table-based PDF for custom filtered reports
+        create_custom_filtered_pdf(report, out)
+    else:
+        out.write(create_pdf_bytes(report.title, report_lines(report)))
+    return True
@@ -0,0 +1,141 @@
+"""Report builders shared by the report API and the report worker"""
+from itertools import islice
+
+from . import filterspec, stats
+from .models import Partner, Report, ReportRow
+
+
+# Columns of the stored rows of a filtered alumni report
+ALUMNI_ROW_COLUMNS = ['first_name', 'last_name', 'email', 'graduation_year', 'phone']
+ROW_BATCH_SIZE = 2000
+
+
+def alumni_summary_data():
+    """Alumni summary figures read from the materialized statistics"""
+    snapshot = stats.read('alumni_total', 'alumni_status', 'alumni_degree')
+    total = stats.total(snapshot, 'alumni')
+    active = snapshot['alumni_status'].get('active', 0)
+    return {
+        'total_alumni': total,
+        'active_alumni': active,
+        'inactive_alumni': total - active,
+        'by_degree': snapshot['alumni_degree'],
+    }
+
+
+def partner_summary_data():
+    """Partner summary figures read from the materialized statistics"""
+    snapshot = stats.read('partner_total', 'partner_type', 'partner_engagement_level')
+    return {
+        'total_partners': stats.total(snapshot, 'partner'),
+        'by_type': snapshot['partner_type'],
+        'by_engagement_level': snapshot['partner_engagement_level'],
+    }
+
+
+def engagement_analytics_data():
+    """Engagement totals from the materialized statistics plus the top partners"""
+    snapshot = stats.read('engagement_total', 'engagement_type')
+    top_partners_qs = Partner.objects.order_by('-engagement_count', 'name').only('name', 'engagement_count')[:10]
+    return {
+        'total_engagements': stats.total(snapshot, 'engagement'),
+        'by_type': snapshot['engagement_type'],
+        'top_partners': [{'name': p.name, 'count': p.engagement_count} for p in top_partners_qs],
+    }
+
+
+def filtered_partner_data(filters):
+    """Counts for partners matching the filtered-report filters"""
+    queryset = filterspec.compile_filters('partners', filters)
+    total, facets = filterspec.facet_counts(queryset, ['partner_type', 'engagement_level'])
+    return {
+        'scope': 'partners',
+        'filters': {name: filters.get(name) for name in filterspec.filter_names('partners')},
+        'total_partners': total,
+        'by_type': facets['partner_type'],
+        'by_engagement_level': facets['engagement_level'],
+    }
+
+
+def filtered_alumni_data(filters):
+    """Counts for alumni matching the filtered-report filters"""
+    queryset = filterspec.compile_filters('alumni', filters)
+    total, facets = filterspec.facet_counts(queryset, ['status', 'degree', 'graduation_year'])
+    return {
+        'scope': 'alumni',
+        'filters': {name: filters.get(name) for name in filterspec.filter_names('alumni')},
+        'total_alumni': total,
+        'by_status': facets['status'],
+        'by_degree': facets['degree'],
+        'by_graduation_year': facets['graduation_year'],
+        'columns': ALUMNI_ROW_COLUMNS,
+    }
+
+
+def filtered_alumni_rows(filters):
+    """Row values (ordered like ALUMNI_ROW_COLUMNS) for alumni matching the filters"""
+    return (
+        filterspec.compile_filters('alumni', filters)
+        .order_by('last_name', 'first_name', 'pk')
+        .values_list(*ALUMNI_ROW_COLUMNS)
+        .iterator(chunk_size=ROW_BATCH_SIZE)
+    )
+
+
+def _custom_filtered(params):
+    filters = params.get('filters') or {}
+    if params.get('scope') == 'partners':
+        return 'Filtered Partner Report', filtered_partner_data(filters), None
+    return 'Filtered Alumni Report', filtered_alumni_data(filters), filtered_alumni_rows(filters)
+
+
+# Report type -> function(params) returning (title, data, rows or None)
+REPORT_BUILDERS = {
+    'alumni_summary': lambda params: ('Alumni Summary Report', alumni_summary_data(), None),
+    'partner_summary': lambda params: ('Partner Summary Report', partner_summary_data(), None),
+    'engagement_analytics': lambda params: ('Engagement Analytics Report', engagement_analytics_data(), None),
+    'custom_filtered': _custom_filtered,
+}
+
+
+def store_rows(report, rows):
+    """Insert `rows` (an iterable of value sequences) as the report's ReportRows; returns the count"""
+    rows = iter(rows)
+    position = 0
+    while True:
+        batch = [
+            ReportRow(report=report, position=position + offset, values=list(values))
+            for offset, values in enumerate(islice(rows, ROW_BATCH_SIZE))
+        ]
+        if not batch:
+            return position
+        ReportRow.objects.bulk_create(batch)
+        position += len(batch)
+
+
+def report_rows(report):
+    """Iterate a report's stored rows as dicts keyed by data['columns']"""
+    columns = (report.data or {}).get('columns') or []
+    values = report.rows.values_list('values', flat=True).iterator(chunk_size=ROW_BATCH_SIZE)
+    return (dict(zip(columns, row)) for row in values)
+
+
+def build_report(report_type, params=None, user=None):
+    """Compute a report and store it as a Report row, with any result rows in ReportRow"""
+    title, data, rows = REPORT_BUILDERS[report_type](params or {})
+    report = Report.objects.create(
+        title=title,
+        report_type=report_type,
+        data=data,
+        generated_by=user,
+    )
+    if rows is not None:
+        # Not wrapped in a transaction (see core.jobs.run), so clean up a
+        # half-stored report by hand
+        try:
+            report.data['row_count'] = store_rows(report, rows)
+        except BaseException:
+            report.delete()
+            raise
+        report.save(update_fields=['data', 'updated_at'])
+    return report
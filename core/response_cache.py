@@ -0,0 +1,183 @@
+"""Versioned caching for read-heavy endpoints.
+
+Cached entries are keyed by the current version of every model namespace
+they depend on ('alumni', 'partner', 'engagement'). Writes to those models
+bump the namespace version (see core.signals and StatsTrackedQuerySet), so
+stale entries are never read again and simply age out of the cache.
+
+The backend is whatever `CACHES[RESPONSE_CACHE_ALIAS]` is configured as:
+local memory by default, or a file/Redis cache via the CACHE_BACKEND and
+CACHE_LOCATION settings. Versions and hit/miss counters live in the same
+cache. With a shared backend (file, Redis, ...) they are shared between
+worker processes. With the default local-memory cache each process has
+its own: a write only bumps the versions in the process that handled it,
+so entries are kept for at most RESPONSE_CACHE_LOCAL_TIMEOUT seconds and
+the counters describe a single process.
+"""
+import hashlib
+import time
+from functools import partial, wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework.response import Response
+
+
+KEY_PREFIX = 'apdb'
+
+# Backends whose entries are private to one process
+PROCESS_LOCAL_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+# Endpoint name -> namespaces it depends on, for monitoring
+CACHED_ENDPOINTS = {}
+
+
+def _alias():
+    return getattr(settings, 'RESPONSE_CACHE_ALIAS', 'default')
+
+
+def _cache():
+    return caches[_alias()]
+
+
+def is_shared(alias=None):
+    """Whether a cache alias (the response cache by default) is shared between processes"""
+    return settings.CACHES[alias or _alias()]['BACKEND'] not in PROCESS_LOCAL_BACKENDS
+
+
+def _timeout(timeout):
+    if timeout is None:
+        timeout = getattr(settings, 'RESPONSE_CACHE_TIMEOUT', 300)
+    if not is_shared():
+        # Other processes never see this process's invalidations
+        timeout = min(timeout, getattr(settings, 'RESPONSE_CACHE_LOCAL_TIMEOUT', 30))
+    return timeout
+
+
+def _version_key(namespace):
+    return f"{KEY_PREFIX}:version:{namespace}"
+
+
+def _incr(key):
+    cache = _cache()
+    try:
+        return cache.incr(key)
+    except ValueError:
+        if cache.add(key, 1, timeout=None):
+            return 1
+        return cache.incr(key)
+
+
+def get_versions(namespaces):
+    """Return the current version of each namespace.
+
+    Missing versions are seeded from the clock rather than 0, so an evicted
+    version key can never make an old entry valid again.
+    """
+    cache = _cache()
+    keys = [_version_key(namespace) for namespace in namespaces]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, int(time.time() * 1000), timeout=None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def _bump(namespaces):
+    for namespace in namespaces:
+        _incr(_version_key(namespace))
+
+
+def invalidate(*namespaces, using=None):
+    """Bump namespace versions once the current transaction commits.
+
+    Bumping before commit would let a concurrent reader cache the old rows
+    under the new version.
+    """
+    transaction.on_commit(partial(_bump, namespaces), using=using)
+
+
+def _record(name, outcome):
+    _incr(f"{KEY_PREFIX}:stats:{outcome}:{name}")
+
+
+def _key(name, depends_on, extra=''):
+    versions = '.'.join(str(v) for v in get_versions(depends_on))
+    digest = hashlib.md5(extra.encode('utf-8')).hexdigest()
+    return f"{KEY_PREFIX}:resp:{name}:{versions}:{digest}"
+
+
+def cached_value(name, depends_on, compute, timeout=None):
+    """Return `compute()` through the cache"""
+    CACHED_ENDPOINTS[name] = tuple(depends_on)
+    cache = _cache()
+    key = _key(name, depends_on)
+    value = cache.get(key)
+    if value is not None:
+        _record(name, 'hits')
+        return value
+    _record(name, 'misses')
+    value = compute()
+    cache.set(key, value, _timeout(timeout))
+    return value
+
+
+def cached_response(name, depends_on, timeout=None):
+    """Cache successful DRF responses of a view function or viewset action.
+
+    The cache key includes the query string. Apply it below `@action` /
+    `@permission_classes` so permission checks still run on every request.
+    """
+    CACHED_ENDPOINTS[name] = tuple(depends_on)
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            request = args[1] if len(args) > 1 else args[0]
+            params = sorted(request.query_params.lists())
+            extra = repr((params, sorted(kwargs.items())))
+            cache = _cache()
+            key = _key(name, depends_on, extra)
+
+            data = cache.get(key)
+            if data is not None:
+                _record(name, 'hits')
+                response = Response(data)
+                response['X-Cache'] = 'HIT'
+                return response
+
+            _record(name, 'misses')
+            response = func(*args, **kwargs)
+            if response.status_code == 200 and isinstance(response, Response):
+                cache.set(key, response.data, _timeout(timeout))
+            response['X-Cache'] = 'MISS'
+            return response
+        return wrapper
+    return decorator
+
+
+def cache_stats():
+    """Hit/miss counters for every cached endpoint (this process only, unless the cache is shared)"""
+    names = sorted(CACHED_ENDPOINTS)
+    keys = {
+        (name, outcome): f"{KEY_PREFIX}:stats:{outcome}:{name}"
+        for name in names for outcome in ('hits', 'misses')
+    }
+    counts = _cache().get_many(list(keys.values()))
+    result = {}
+    for name in names:
+        hits = counts.get(keys[(name, 'hits')], 0)
+        misses = counts.get(keys[(name, 'misses')], 0)
+        total = hits + misses
+        result[name] = {
+            'depends_on': list(CACHED_ENDPOINTS[name]),
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / total, 3) if total else None,
+        }
+    return result
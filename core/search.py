@@ -0,0 +1,276 @@
+"""Full-text search for alumni and partners.
+
+On SQLite the searchable columns are mirrored into FTS5 external-content
+tables kept in sync by triggers; on PostgreSQL a GIN index over a tsvector
+expression is used. Both are (re)installed after every `migrate` (SQLite
+table rebuilds drop triggers) and can be rebuilt with
+`manage.py rebuild_search_index`. On other backends, or when FTS5 is not
+compiled in, searches fall back to DRF's `icontains` SearchFilter.
+"""
+import re
+import sys
+
+from django.db import DatabaseError, connections, router, transaction
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from rest_framework import filters
+
+from .models import Alumni, Partner, normalize_company
+
+
+# Index name -> (model, searchable columns)
+SEARCH_INDEXES = {
+    'alumni': (Alumni, ['first_name', 'last_name', 'email', 'current_company']),
+    'partner': (Partner, ['name', 'email', 'primary_contact_name', 'industry']),
+}
+
+# Substring (trigram) index over the normalized company column. FTS5's
+# trigram tokenizer needs at least three characters per query.
+COMPANY_TRIGRAM_TABLE = 'core_alumni_company_trgm'
+TRIGRAM_MIN_LENGTH = 3
+
+TERM_RE = re.compile(r'\w+', re.UNICODE)
+
+# Database alias (or (alias, table)) -> whether the index is installed there
+_available = {}
+
+
+def _fts_table(model):
+    return f"{model._meta.db_table}_fts"
+
+
+def _pg_document(columns, table=None):
+    prefix = f"{table}." if table else ''
+    parts = " || ' ' || ".join(f"coalesce({prefix}{column}, '')" for column in columns)
+    return f"to_tsvector('simple', {parts})"
+
+
+def _sqlite_statements(model, columns, fts, tokenize=None):
+    table = model._meta.db_table
+    cols = ', '.join(columns)
+    new = ', '.join(f'new.{c}' for c in columns)
+    old = ', '.join(f'old.{c}' for c in columns)
+    options = f", tokenize='{tokenize}'" if tokenize else ''
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({cols}, content='{table}', content_rowid='id'{options})",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END",
+    ]
+
+
+def install(using='default', rebuild=False):
+    """Create the search tables, triggers or indexes if they are missing.
+
+    Returns True when the index is available on this connection.
+    """
+    connection = connections[using]
+    vendor = connection.vendor
+
+    if vendor == 'sqlite':
+        indexes = [
+            (model, columns, _fts_table(model), None)
+            for model, columns in SEARCH_INDEXES.values()
+        ]
+        indexes.append((Alumni, ['company_normalized'], COMPANY_TRIGRAM_TABLE, 'trigram'))
+        with connection.cursor() as cursor:
+            for model, columns, fts, tokenize in indexes:
+                cursor.execute(
+                    "SELECT count(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE %s",
+                    [f'{fts}_a_'],
+                )
+                missing_triggers = cursor.fetchone()[0] < 3
+                try:
+                    with transaction.atomic(using=using):
+                        for statement in _sqlite_statements(model, columns, fts, tokenize):
+                            cursor.execute(statement)
+                        if rebuild or missing_triggers:
+                            cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+                except DatabaseError:
+                    # SQLite built without FTS5 (or, for trigram, older than 3.34)
+                    continue
+        _available.pop(using, None)
+        _available.pop((using, COMPANY_TRIGRAM_TABLE), None)
+        return is_available(Alumni) and is_available(Partner)
+
+    if vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            for model, columns in SEARCH_INDEXES.values():
+                cursor.execute(
+                    f"CREATE INDEX IF NOT EXISTS {model._meta.db_table}_search_idx "
+                    f"ON {model._meta.db_table} USING GIN ({_pg_document(columns)})"
+                )
+            # LIKE 'prefix%' only uses a B-tree index under the C collation
+            # unless the index compares by pattern
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS core_alumni_company_prefix_idx "
+                "ON core_alumni (company_normalized varchar_pattern_ops)"
+            )
+            try:
+                with transaction.atomic(using=using):
+                    cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+                    cursor.execute(
+                        "CREATE INDEX IF NOT EXISTS core_alumni_company_trgm_idx "
+                        "ON core_alumni USING GIN (company_normalized gin_trgm_ops)"
+                    )
+            except DatabaseError:
+                # pg_trgm unavailable; substring lookups fall back to a scan
+                pass
+        _available[using] = True
+        return True
+
+    return False
+
+
+def _sqlite_tables(using):
+    return connections[using].introspection.table_names()
+
+
+def is_available(model):
+    """Whether a full-text index exists for `model` on its database"""
+    using = router.db_for_read(model)
+    if using not in _available:
+        vendor = connections[using].vendor
+        if vendor == 'postgresql':
+            _available[using] = True
+        elif vendor == 'sqlite':
+            tables = _sqlite_tables(using)
+            _available[using] = all(_fts_table(m) in tables for m, _ in SEARCH_INDEXES.values())
+        else:
+            _available[using] = False
+    return _available[using]
+
+
+def _trigram_available(using):
+    key = (using, COMPANY_TRIGRAM_TABLE)
+    if key not in _available:
+        _available[key] = COMPANY_TRIGRAM_TABLE in _sqlite_tables(using)
+    return _available[key]
+
+
+def _terms(text):
+    return TERM_RE.findall(text or '')
+
+
+def _sqlite_match(terms, columns=None):
+    match = ' '.join(f'"{term}"*' for term in terms)
+    if columns:
+        match = f"{{{' '.join(columns)}}} : ({match})"
+    return match
+
+
+def _match_sql(index, terms, vendor, columns=None):
+    """Return (sql, params) selecting the primary keys of rows matching every term.
+
+    `columns` restricts the match to some of the index's columns.
+    """
+    model, indexed = SEARCH_INDEXES[index]
+    table = model._meta.db_table
+    if vendor == 'sqlite':
+        fts = _fts_table(model)
+        return f"SELECT rowid FROM {fts} WHERE {fts} MATCH %s", [_sqlite_match(terms, columns)]
+
+    query = ' & '.join(f'{term}:*' for term in terms)
+    sql = f"SELECT id FROM {table} WHERE {_pg_document(indexed)} @@ to_tsquery('simple', %s)"
+    params = [query]
+    if columns:
+        # The GIN index narrows the rows; the column subset is rechecked on those
+        sql += f" AND {_pg_document(columns)} @@ to_tsquery('simple', %s)"
+        params.append(query)
+    return sql, params
+
+
+def _ranked_match(queryset, index, terms, vendor):
+    """Filter `queryset` to rows of its own index matching every term, annotated with `search_rank`.
+
+    The full-text table is joined once; the rank comes from that join.
+    """
+    model, columns = SEARCH_INDEXES[index]
+    table = model._meta.db_table
+    if vendor == 'sqlite':
+        fts = _fts_table(model)
+        return queryset.extra(
+            tables=[fts],
+            where=[f"{fts}.rowid = {table}.id", f"{fts} MATCH %s"],
+            params=[_sqlite_match(terms)],
+            # bm25() is lower for better matches; negate so higher is better
+            select={'search_rank': f"-bm25({fts})"},
+        )
+
+    query = ' & '.join(f'{term}:*' for term in terms)
+    document = _pg_document(columns, table)
+    return queryset.extra(
+        where=[f"{document} @@ to_tsquery('simple', %s)"],
+        params=[query],
+        select={'search_rank': f"ts_rank({document}, to_tsquery('simple', %s))"},
+        select_params=[query],
+    )
+
+
+class FullTextSearchFilter(filters.SearchFilter):
+    """`?search=` backed by the full-text index, with ranked results.
+
+    Views declare `search_index` mapping a lookup path to an index name,
+    or to an (index name, columns) pair to search only some of its columns,
+    e.g. `{'pk': 'alumni'}` or `{'alumni': ('alumni', ['first_name'])}`.
+    A view searches either its own index (`'pk'`) or related ones, matching
+    `search_fields`: every term must match at least one of them.
+
+    When searching a view's own index, results are ordered by relevance
+    unless the request passes `?ordering=`; this backend must therefore come
+    after OrderingFilter in `filter_backends`.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search_index = getattr(view, 'search_index', None)
+        terms = _terms(request.query_params.get(self.search_param, ''))
+        if not search_index or not terms or not is_available(queryset.model):
+            return super().filter_queryset(request, queryset, view)
+
+        vendor = connections[queryset.db].vendor
+        if 'pk' in search_index:
+            queryset = _ranked_match(queryset, search_index['pk'], terms, vendor)
+            if not request.query_params.get('ordering'):
+                queryset = queryset.order_by('-search_rank', '-pk')
+            return queryset
+
+        for term in terms:
+            condition = Q()
+            for lookup, index in search_index.items():
+                index, columns = (index, None) if isinstance(index, str) else index
+                condition |= Q(**{f'{lookup}__in': RawSQL(*_match_sql(index, [term], vendor, columns))})
+            queryset = queryset.filter(condition)
+        return queryset
+
+
+def filter_company(queryset, company=None, prefix=None):
+    """Filter alumni by normalized company name.
+
+    `prefix` is a LIKE 'prefix%' match, served on PostgreSQL by the
+    varchar_pattern_ops index that `install()` creates whatever the database
+    collation. SQLite compares with the binary collation, where LIKE skips
+    the B-tree index but an exact range scan can use it. `company` is a
+    substring match served by the trigram index where one is installed.
+    """
+    vendor = connections[queryset.db].vendor
+    if prefix:
+        prefix = normalize_company(prefix)
+        if vendor == 'sqlite' and prefix and ord(prefix[-1]) < sys.maxunicode:
+            return queryset.filter(
+                company_normalized__gte=prefix,
+                company_normalized__lt=prefix[:-1] + chr(ord(prefix[-1]) + 1),
+            )
+        return queryset.filter(company_normalized__startswith=prefix)
+
+    company = normalize_company(company)
+    if vendor == 'sqlite' and len(company) >= TRIGRAM_MIN_LENGTH and _trigram_available(queryset.db):
+        phrase = '"{}"'.format(company.replace('"', '""'))
+        return queryset.filter(pk__in=RawSQL(
+            f"SELECT rowid FROM {COMPANY_TRIGRAM_TABLE} WHERE {COMPANY_TRIGRAM_TABLE} MATCH %s",
+            [phrase],
+        ))
+    return queryset.filter(company_normalized__contains=company)
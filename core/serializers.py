@@ -1,5 +1,17 @@
+from django.contrib.auth.models import User
 from rest_framework import serializers
-from .models import Alumni, Partner, Engagement, Report
+from rest_framework.reverse import reverse
+from .models import Alumni, Partner, Engagement, Report, ReportJob, AuditEvent
+
+
+# Number of most recent engagements embedded in alumni/partner detail responses
+DETAIL_ENGAGEMENT_LIMIT = 10
+
+
+def _engagements_url(serializer, lookup, obj):
+    """Link to the paginated engagement list filtered to one alumni/partner"""
+    url = reverse('engagement-list', request=serializer.context.get('request'))
+    return f"{url}?{lookup}={obj.pk}"
 
 
 class AlumniSerializer(serializers.ModelSerializer):
@@ -13,7 +25,7 @@ class AlumniSerializer(serializers.ModelSerializer):
             'degree', 'field_of_study', 'graduation_year',
             'current_company', 'job_title', 'industry',
             'status', 'linkedin_url', 'bio',
-            'created_at', 'updated_at', 'last_engagement'
+            'created_at', 'updated_at', 'engagement_count', 'last_engagement'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
 
@@ -34,15 +46,22 @@ class AlumniSerializer(serializers.ModelSerializer):
 
 
 class AlumniDetailSerializer(AlumniSerializer):
-    """Detailed serializer for Alumni including engagements"""
+    """Detailed serializer for Alumni including recent engagements"""
     engagements = serializers.SerializerMethodField()
+    engagements_url = serializers.SerializerMethodField()
     
     class Meta(AlumniSerializer.Meta):
-        fields = AlumniSerializer.Meta.fields + ['engagements']
+        fields = AlumniSerializer.Meta.fields + ['engagements', 'engagements_url']
     
     def get_engagements(self, obj):
-        engagements = obj.engagements.all()
+        # Prefetched by AlumniViewSet.get_queryset; fall back to a bounded query
+        engagements = getattr(obj, 'recent_engagements', None)
+        if engagements is None:
+            engagements = obj.engagements.select_related('partner')[:DETAIL_ENGAGEMENT_LIMIT]
         return EngagementSerializer(engagements, many=True).data
+    
+    def get_engagements_url(self, obj):
+        return _engagements_url(self, 'alumni', obj)
 
 
 class PartnerSerializer(serializers.ModelSerializer):
@@ -55,7 +74,7 @@ class PartnerSerializer(serializers.ModelSerializer):
             'website', 'email', 'phone', 'address', 'city', 'state', 'country',
             'primary_contact_name', 'primary_contact_email', 'primary_contact_phone',
             'engagement_level', 'industry', 'employee_count', 'partnership_start_date',
-            'notes', 'created_at', 'updated_at', 'last_engagement'
+            'notes', 'created_at', 'updated_at', 'engagement_count', 'last_engagement'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
     
@@ -72,19 +91,22 @@ class PartnerSerializer(serializers.ModelSerializer):
 
 
 class PartnerDetailSerializer(PartnerSerializer):
-    """Detailed serializer for Partner including engagements"""
+    """Detailed serializer for Partner including recent engagements"""
     engagements = serializers.SerializerMethodField()
-    engagement_count = serializers.SerializerMethodField()
+    engagements_url = serializers.SerializerMethodField()
     
     class Meta(PartnerSerializer.Meta):
-        fields = PartnerSerializer.Meta.fields + ['engagements', 'engagement_count']
+        fields = PartnerSerializer.Meta.fields + ['engagements', 'engagements_url']
     
     def get_engagements(self, obj):
-        engagements = obj.engagements.all()[:10]  # Last 10 engagements
+        # Prefetched by PartnerViewSet.get_queryset; fall back to a bounded query
+        engagements = getattr(obj, 'recent_engagements', None)
+        if engagements is None:
+            engagements = obj.engagements.select_related('alumni')[:DETAIL_ENGAGEMENT_LIMIT]
         return EngagementSerializer(engagements, many=True).data
     
-    def get_engagement_count(self, obj):
-        return obj.engagements.count()
+    def get_engagements_url(self, obj):
+        return _engagements_url(self, 'partner', obj)
 
 
 class EngagementSerializer(serializers.ModelSerializer):
@@ -97,9 +119,9 @@ class EngagementSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'alumni', 'alumni_name', 'partner', 'partner_name',
             'engagement_type', 'description', 'engagement_date',
-            'notes', 'created_at', 'updated_at'
+            'notes', 'created_by', 'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'created_by', 'created_at', 'updated_at']
 
 
 class ReportSerializer(serializers.ModelSerializer):
@@ -116,18 +138,118 @@ class ReportSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
+class ReportListSerializer(serializers.ModelSerializer):
+    """Report fields for list views; the data JSON is left to the detail view"""
+    generated_by_name = serializers.CharField(source='generated_by.username', read_only=True)
+    
+    class Meta:
+        model = Report
+        fields = [
+            'id', 'title', 'report_type', 'description',
+            'generated_by', 'generated_by_name',
+            'created_at', 'updated_at'
+        ]
+        read_only_fields = fields
+
+
+class ReportJobSerializer(serializers.ModelSerializer):
+    """Serializer for queued report jobs"""
+    status_url = serializers.SerializerMethodField()
+    report_url = serializers.SerializerMethodField()
+    download_url = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = ReportJob
+        fields = [
+            'id', 'report_type', 'output', 'params', 'status', 'error',
+            'report', 'status_url', 'report_url', 'download_url',
+            'created_at', 'started_at', 'finished_at'
+        ]
+        read_only_fields = fields
+    
+    def _url(self, name, pk):
+        return reverse(name, kwargs={'pk': pk}, request=self.context.get('request'))
+    
+    def get_status_url(self, obj):
+        return self._url('report-job-detail', obj.pk)
+    
+    def get_report_url(self, obj):
+        return self._url('report-detail', obj.report_id) if obj.report_id else None
+    
+    def get_download_url(self, obj):
+        return self._url('report-download-pdf', obj.report_id) if obj.report_id else None
+
+
+class AdminUserSerializer(serializers.ModelSerializer):
+    """User rows for the admin dashboard; expects alumni_profile to be joined in"""
+    alumni_status = serializers.SerializerMethodField()
+    alumni_status_display = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = User
+        fields = [
+            'alumni_status', 'alumni_status_display',
+            'id', 'username', 'email', 'first_name', 'last_name',
+            'is_staff', 'is_superuser', 'is_active', 'date_joined', 'last_login'
+        ]
+        read_only_fields = fields
+    
+    def _profile(self, obj):
+        try:
+            return obj.alumni_profile
+        except Alumni.DoesNotExist:
+            return None
+    
+    def get_alumni_status(self, obj):
+        profile = self._profile(obj)
+        return profile.status if profile else None
+    
+    def get_alumni_status_display(self, obj):
+        profile = self._profile(obj)
+        return profile.get_status_display() if profile else None
+
+
+class AuditEventSerializer(serializers.ModelSerializer):
+    """Audit events for the admin dashboard, under the keys of the old audit log API"""
+    title = serializers.CharField(source='summary', read_only=True)
+    description = serializers.CharField(source='detail', read_only=True)
+    generated_by_username = serializers.SerializerMethodField()
+    
+    class Meta:
+        model = AuditEvent
+        fields = [
+            'id', 'title', 'description', 'generated_by_username',
+            'action', 'object_type', 'object_id', 'changes', 'created_at'
+        ]
+        read_only_fields = fields
+    
+    def get_generated_by_username(self, obj):
+        return obj.actor_username or 'System'
+
+
 class AlumniStatsSerializer(serializers.Serializer):
     """Serializer for alumni statistics"""
     total_alumni = serializers.IntegerField()
-    active_alumni = serializers.IntegerField()
-    by_degree = serializers.DictField()
-    by_graduation_year = serializers.DictField()
-    by_industry = serializers.DictField()
+    active_alumni = serializers.IntegerField(required=False)
+    by_status = serializers.DictField(required=False)
+    by_degree = serializers.DictField(required=False)
+    by_graduation_year = serializers.DictField(required=False)
+    by_industry = serializers.DictField(required=False)
 
 
 class PartnerStatsSerializer(serializers.Serializer):
     """Serializer for partner statistics"""
     total_partners = serializers.IntegerField()
-    by_type = serializers.DictField()
-    by_engagement_level = serializers.DictField()
-    by_industry = serializers.DictField()
+    by_type = serializers.DictField(required=False)
+    by_engagement_level = serializers.DictField(required=False)
+    by_industry = serializers.DictField(required=False)
+
+
+class BulkEngagementRowSerializer(serializers.Serializer):
+    """One row of a bulk engagement import; related IDs are resolved per batch"""
+    alumni = serializers.IntegerField(min_value=1)
+    partner = serializers.IntegerField(min_value=1)
+    engagement_type = serializers.ChoiceField(choices=Engagement.ENGAGEMENT_TYPE_CHOICES)
+    engagement_date = serializers.DateTimeField()
+    description = serializers.CharField(required=False, allow_blank=True, default='')
+    notes = serializers.CharField(required=False, allow_blank=True, default='')
@@ -0,0 +1,112 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from . import authentication, last_engagement, response_cache, stats
+from .models import Alumni, Partner, Engagement
+
+
+@receiver(pre_save, sender=Alumni)
+@receiver(pre_save, sender=Partner)
+@receiver(pre_save, sender=Engagement)
+def remember_stats_values(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Capture the stored values of tracked fields before an update"""
+    instance._stats_previous = None
+    instance._stats_untouched = False
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    fields = list(stats.tracked_fields(sender))
+    if sender is Engagement:
+        fields += last_engagement.SOURCE_FIELDS
+    if update_fields is not None:
+        written = {sender._meta.get_field(name).attname for name in update_fields}
+        if written.isdisjoint(fields):
+            # save(update_fields=...) can only update an existing row and
+            # leaves every counted value alone, so there is nothing to read
+            instance._stats_untouched = True
+            return
+    instance._stats_previous = (
+        sender._base_manager.filter(pk=instance.pk).values(*fields).first()
+    )
+
+
+@receiver(post_save, sender=Alumni)
+@receiver(post_save, sender=Partner)
+@receiver(post_save, sender=Engagement)
+def update_stats_on_save(sender, instance, created, raw=False, **kwargs):
+    """Adjust StatsSnapshot counters after a row is created or changed"""
+    if raw or getattr(instance, '_stats_untouched', False):
+        return
+    # A missing previous row (e.g. save() with an explicit new pk) counts as a create
+    previous = None if created else getattr(instance, '_stats_previous', None)
+    stats.record_change(sender, previous, stats.field_values(instance))
+
+
+@receiver(post_delete, sender=Alumni)
+@receiver(post_delete, sender=Partner)
+@receiver(post_delete, sender=Engagement)
+def update_stats_on_delete(sender, instance, **kwargs):
+    """Adjust StatsSnapshot counters after a row is deleted"""
+    stats.record_change(sender, stats.field_values(instance), None)
+
+
+@receiver(post_save, sender=Engagement)
+def update_last_engagement_on_save(sender, instance, created, raw=False, using=None, **kwargs):
+    """Update the alumni and partner engagement_count/last_engagement for a new or changed engagement"""
+    if raw or last_engagement.is_suppressed() or getattr(instance, '_stats_untouched', False):
+        return
+    previous = None if created else getattr(instance, '_stats_previous', None)
+    if previous is None:
+        last_engagement.advance([instance], using=using)
+        return
+    current = {field: getattr(instance, field) for field in last_engagement.SOURCE_FIELDS}
+    current['engagement_date'] = last_engagement.as_datetime(current['engagement_date'])
+    if current != {field: previous[field] for field in last_engagement.SOURCE_FIELDS}:
+        last_engagement.recompute_for(
+            [(previous['alumni_id'], previous['partner_id']), (instance.alumni_id, instance.partner_id)],
+            using=using,
+        )
+
+
+@receiver(post_delete, sender=Engagement)
+def update_last_engagement_on_delete(sender, instance, using=None, **kwargs):
+    """Uncount a deleted engagement from its alumni and partner"""
+    if last_engagement.is_suppressed():
+        return
+    last_engagement.remove(instance, using=using)
+
+
+@receiver(post_save, sender=Alumni)
+@receiver(post_save, sender=Partner)
+@receiver(post_save, sender=Engagement)
+@receiver(post_delete, sender=Alumni)
+@receiver(post_delete, sender=Partner)
+@receiver(post_delete, sender=Engagement)
+def invalidate_cached_responses(sender, instance, raw=False, using=None, **kwargs):
+    """Expire cached responses that depend on the changed model"""
+    if raw:
+        return
+    response_cache.invalidate(sender._meta.model_name, using=using)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+@receiver(post_save, sender=Alumni)
+@receiver(post_delete, sender=Alumni)
+def evict_cached_users(sender, instance, raw=False, using=None, **kwargs):
+    """Drop cached token authentication for a changed user or alumni profile"""
+    if raw:
+        return
+    user_id = instance.pk if sender is User else instance.user_id
+    if user_id is not None:
+        authentication.evict(user_id=user_id, using=using)
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def evict_cached_token(sender, instance, raw=False, using=None, **kwargs):
+    """Drop cached token authentication for a changed or deleted token"""
+    if raw:
+        return
+    authentication.evict(instance.key, using=using)
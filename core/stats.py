@@ -0,0 +1,273 @@
+"""Materialized statistics counters.
+
+The statistics endpoints and summary reports read pre-aggregated counts from
+StatsSnapshot instead of running COUNT/GROUP BY queries over the full tables.
+Counters are adjusted incrementally from model signals (see core.signals) and
+from the bulk paths of StatsTrackedQuerySet, and can be rebuilt from scratch
+with `manage.py rebuild_stats`.
+"""
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import reduce
+from operator import or_
+
+from django.db import transaction
+from django.db.models import Case, Count, F, Q, When
+
+
+# Dimension name -> model field, keyed by model name. Blank values are not
+# counted, matching the previous `exclude(industry='')` behaviour.
+DIMENSIONS = {
+    'alumni': {
+        'alumni_status': 'status',
+        'alumni_degree': 'degree',
+        'alumni_graduation_year': 'graduation_year',
+        'alumni_industry': 'industry',
+    },
+    'partner': {
+        'partner_type': 'partner_type',
+        'partner_engagement_level': 'engagement_level',
+        'partner_industry': 'industry',
+    },
+    'engagement': {
+        'engagement_type': 'engagement_type',
+    },
+}
+
+_pending = ContextVar('stats_pending', default=None)
+
+
+def _snapshot_model():
+    from .models import StatsSnapshot
+    return StatsSnapshot
+
+
+def total_dimension(model):
+    return f"{model._meta.model_name}_total"
+
+
+def tracked_fields(model):
+    """Return the model fields that feed a statistics dimension"""
+    return set(DIMENSIONS.get(model._meta.model_name, {}).values())
+
+
+def _dimensions(model):
+    return DIMENSIONS.get(model._meta.model_name, {})
+
+
+def _key(value):
+    if value is None or value == '':
+        return None
+    return str(value)
+
+
+def field_values(instance):
+    """Snapshot the tracked field values of an instance"""
+    return {
+        field: getattr(instance, field)
+        for field in _dimensions(type(instance)).values()
+    }
+
+
+def _bump(dimension, value, delta):
+    if not delta:
+        return
+    pending = _pending.get()
+    if pending is not None:
+        pending[(dimension, value)] += delta
+        return
+    StatsSnapshot = _snapshot_model()
+    updated = StatsSnapshot.objects.filter(dimension=dimension, value=value).update(
+        count=F('count') + delta
+    )
+    if not updated:
+        with transaction.atomic():
+            snapshot, created = StatsSnapshot.objects.get_or_create(
+                dimension=dimension, value=value, defaults={'count': delta}
+            )
+            if not created:
+                StatsSnapshot.objects.filter(pk=snapshot.pk).update(count=F('count') + delta)
+
+
+def _apply(deltas):
+    """Apply summed deltas with one SELECT and one UPDATE for the existing counters"""
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    StatsSnapshot = _snapshot_model()
+    match = reduce(or_, (Q(dimension=dimension, value=value) for dimension, value in deltas))
+    existing = {
+        (dimension, value): pk
+        for pk, dimension, value in StatsSnapshot.objects.filter(match).values_list('pk', 'dimension', 'value')
+    }
+    if existing:
+        StatsSnapshot.objects.filter(pk__in=existing.values()).update(count=Case(
+            *[When(pk=pk, then=F('count') + deltas[key]) for key, pk in existing.items()],
+            default=F('count'),
+        ))
+    # Values seen for the first time (or created concurrently) go through the
+    # single-counter path, which handles the insert race
+    for dimension, value in deltas.keys() - existing.keys():
+        _bump(dimension, value, deltas[(dimension, value)])
+
+
+@contextmanager
+def deferred():
+    """Sum the counter deltas made in this block and apply them once on exit.
+
+    Deleting a queryset or cascading a delete sends post_delete for every
+    row; inside this block those deltas collapse to one UPDATE instead of
+    one per row. Nested blocks join the outermost one. Nothing is written
+    if the block raises, since the change it counted did not complete.
+    """
+    if _pending.get() is not None:
+        yield
+        return
+    pending = Counter()
+    token = _pending.set(pending)
+    try:
+        yield
+    finally:
+        _pending.reset(token)
+    _apply(pending)
+
+
+def record_change(model, old_values, new_values):
+    """Apply the counter deltas for one row being created, changed or deleted.
+
+    `old_values` is None for a newly created row and `new_values` is None for
+    a deleted one.
+    """
+    if old_values is None:
+        _bump(total_dimension(model), '', 1)
+    if new_values is None:
+        _bump(total_dimension(model), '', -1)
+
+    for dimension, field in _dimensions(model).items():
+        old = _key(old_values.get(field)) if old_values is not None else None
+        new = _key(new_values.get(field)) if new_values is not None else None
+        if old == new:
+            continue
+        if old is not None:
+            _bump(dimension, old, -1)
+        if new is not None:
+            _bump(dimension, new, 1)
+
+
+def grouped_counts(queryset, fields):
+    """Count the rows of `queryset` per value of each field (one query per field)"""
+    return {
+        field: dict(
+            queryset.order_by().values_list(field).annotate(count=Count('pk'))
+        )
+        for field in fields
+    }
+
+
+def apply_bulk_update(model, before, changes):
+    """Move counters for a QuerySet.update() from the old values to the new ones.
+
+    `before` holds per-field counts of the affected rows taken before the
+    update. Expression values (F(), Case(), ...) cannot be resolved here, so
+    those dimensions are rebuilt instead.
+    """
+    rebuild_dimensions = []
+    with deferred():
+        for dimension, field in _dimensions(model).items():
+            if field not in before:
+                continue
+            new_value = changes[field]
+            if hasattr(new_value, 'resolve_expression'):
+                rebuild_dimensions.append(dimension)
+                continue
+            new = _key(new_value)
+            for old_value, count in before[field].items():
+                old = _key(old_value)
+                if old == new:
+                    continue
+                if old is not None:
+                    _bump(dimension, old, -count)
+                if new is not None:
+                    _bump(dimension, new, count)
+
+    if rebuild_dimensions:
+        rebuild([model], dimensions=rebuild_dimensions)
+
+
+def apply_bulk_create(model, objs):
+    """Add counters for rows inserted with bulk_create()"""
+    if not objs:
+        return
+    with deferred():
+        _bump(total_dimension(model), '', len(objs))
+        for dimension, field in _dimensions(model).items():
+            counts = Counter(_key(getattr(obj, field)) for obj in objs)
+            for value, count in counts.items():
+                if value is not None:
+                    _bump(dimension, value, count)
+
+
+def compute(model, dimensions=None):
+    """Compute fresh counters for `model` straight from its table"""
+    counts = {}
+    if dimensions is None or total_dimension(model) in dimensions:
+        counts[(total_dimension(model), '')] = model._base_manager.count()
+    for dimension, field in _dimensions(model).items():
+        if dimensions is not None and dimension not in dimensions:
+            continue
+        for value, count in grouped_counts(model._base_manager.all(), [field])[field].items():
+            key = _key(value)
+            if key is not None:
+                counts[(dimension, key)] = count
+    return counts
+
+
+def rebuild(models_, dimensions=None, snapshot_model=None):
+    """Replace the stored counters for `models_` with freshly computed ones"""
+    StatsSnapshot = snapshot_model or _snapshot_model()
+    with transaction.atomic():
+        for model in models_:
+            counts = compute(model, dimensions)
+            names = {d for d in _dimensions(model) if dimensions is None or d in dimensions}
+            if dimensions is None or total_dimension(model) in dimensions:
+                names.add(total_dimension(model))
+            StatsSnapshot.objects.filter(dimension__in=names).delete()
+            StatsSnapshot.objects.bulk_create([
+                StatsSnapshot(dimension=dimension, value=value, count=count)
+                for (dimension, value), count in counts.items()
+            ])
+
+
+def drift(models_):
+    """Return (dimension, value, stored, actual) tuples where counters are wrong"""
+    StatsSnapshot = _snapshot_model()
+    problems = []
+    for model in models_:
+        actual = compute(model)
+        names = set(_dimensions(model)) | {total_dimension(model)}
+        stored = {
+            (row.dimension, row.value): row.count
+            for row in StatsSnapshot.objects.filter(dimension__in=names)
+        }
+        for key in sorted(set(actual) | set(stored)):
+            if actual.get(key, 0) != stored.get(key, 0):
+                problems.append((key[0], key[1], stored.get(key, 0), actual.get(key, 0)))
+    return problems
+
+
+def read(*dimensions):
+    """Return {dimension: {value: count}} for the given dimensions in one query"""
+    StatsSnapshot = _snapshot_model()
+    result = {dimension: {} for dimension in dimensions}
+    rows = StatsSnapshot.objects.filter(dimension__in=dimensions, count__gt=0).values_list(
+        'dimension', 'value', 'count'
+    )
+    for dimension, value, count in rows:
+        result[dimension][value] = count
+    return result
+
+
+def total(snapshot, model_name):
+    """Pull a total out of a `read()` result"""
+    return snapshot.get(f"{model_name}_total", {}).get('', 0)
@@ -1,3 +1,1207 @@
-from django.test import TestCase
+import csv
+import importlib
+import io
+import json
+import re
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone as dt_timezone
+from urllib.parse import parse_qs, urlparse
+from unittest import mock
 
-# Create your tests here.
+from django.apps import apps as django_apps
+from django.contrib.auth import authenticate, hashers
+from django.contrib.auth.models import User
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.http import StreamingHttpResponse
+from django.db import connection
+from django.db.models.signals import post_save
+from django.db.models.sql import compiler
+from django.contrib import admin as django_admin
+from django.db.migrations.executor import MigrationExecutor
+from django.forms import modelform_factory
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from . import admin, artifacts, audit, authentication, filterspec, ingest, jobs, pdf, reports, response_cache, search, stats, views
+from .models import Alumni, AuditEvent, Partner, Engagement, Report, ReportJob
+from .pagination import KeysetPagination
+
+
+def create_records(alumni=4, partners=2):
+    """Alumni and partners with one engagement per (alumni, partner) pair"""
+    partner_rows = [
+        Partner.objects.create(
+            name=f"Partner {i}", partner_type='corporate', email=f"partner{i}@example.com", industry='Technology',
+        )
+        for i in range(partners)
+    ]
+    alumni_rows = [
+        Alumni.objects.create(
+            first_name=f"First{i}", last_name=f"Last{i}", email=f"alumni{i}@example.com",
+            degree='BS', field_of_study='Civil Engineering', graduation_year=2015 + i % 3,
+            current_company='Acme Corp', industry='Technology',
+        )
+        for i in range(alumni)
+    ]
+    for i, alumnus in enumerate(alumni_rows):
+        for j, partner in enumerate(partner_rows):
+            Engagement.objects.create(
+                alumni=alumnus, partner=partner, engagement_type='mentorship',
+                engagement_date=datetime(2024, 1 + (i + j) % 12, 1, tzinfo=dt_timezone.utc),
+            )
+    return alumni_rows, partner_rows
+
+
+def create_admin(username='admin'):
+    return User.objects.create_superuser(username, f"{username}@example.com", 'admin-password-1')
+
+
+class StatsCounterTests(TestCase):
+    """StatsSnapshot counters stay in step with QuerySet.update()"""
+
+    def test_update_across_reverse_relation_counts_each_row_once(self):
+        create_records(alumni=4, partners=2)
+        self.assertEqual(stats.drift([Alumni, Partner, Engagement]), [])
+
+        # Each alumni has two mentorship engagements, so the filter joins two rows per alumni
+        updated = Alumni.objects.filter(
+            engagements__engagement_type='mentorship', graduation_year=2015,
+        ).update(status='inactive')
+
+        self.assertEqual(updated, 2)
+        self.assertEqual(stats.drift([Alumni]), [])
+
+    def counter_writes(self, queries):
+        return [q['sql'] for q in queries if q['sql'].startswith('UPDATE') and 'core_statssnapshot' in q['sql']]
+
+    def test_queryset_delete_applies_counters_once(self):
+        create_records(alumni=4, partners=3)
+
+        with CaptureQueriesContext(connection) as queries:
+            deleted, _ = Engagement.objects.filter(engagement_type='mentorship').delete()
+
+        self.assertEqual(deleted, 12)
+        self.assertEqual(len(self.counter_writes(queries)), 1)
+        self.assertEqual(stats.drift([Alumni, Partner, Engagement]), [])
+
+    def test_cascaded_delete_applies_counters_once(self):
+        alumni_rows, _ = create_records(alumni=2, partners=3)
+
+        with CaptureQueriesContext(connection) as queries:
+            alumni_rows[0].delete()
+
+        self.assertEqual(len(self.counter_writes(queries)), 1)
+        self.assertEqual(stats.drift([Alumni, Partner, Engagement]), [])
+
+    def test_counters_are_untouched_when_the_delete_fails(self):
+        create_records(alumni=2, partners=2)
+
+        # Fails in a post_delete handler after the first row's delta was recorded
+        with mock.patch.object(response_cache, 'invalidate', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                Engagement.objects.all().delete()
+
+        self.assertEqual(Engagement.objects.count(), 4)
+        self.assertEqual(stats.drift([Alumni, Partner, Engagement]), [])
+
+    def test_saving_untracked_fields_skips_the_stored_values_lookup(self):
+        alumni_rows, _ = create_records(alumni=1, partners=1)
+        alumnus = alumni_rows[0]
+
+        alumnus.job_title = 'Engineer'
+        with CaptureQueriesContext(connection) as queries:
+            alumnus.save(update_fields=['job_title'])
+        self.assertFalse([q for q in queries if q['sql'].startswith('SELECT')])
+
+        alumnus.status = 'inactive'
+        alumnus.save(update_fields=['status'])
+        self.assertEqual(stats.drift([Alumni]), [])
+
+
+class AdminExportTests(TestCase):
+    """admin_export_data streams CSV from one query, whatever the row count"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(create_admin())
+
+    def export(self, data_type):
+        # The view only writes the audit event; the rows are read while streaming
+        with self.assertNumQueries(1):
+            response = self.client.get(f"/api/admin/export/{data_type}/")
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        with self.assertNumQueries(1):
+            body = b''.join(response.streaming_content).decode()
+        return list(csv.reader(io.StringIO(body)))
+
+    def test_alumni_csv(self):
+        create_records(alumni=2, partners=1)
+        rows = self.export('alumni')
+        self.assertEqual(rows[0][:3], ['First Name', 'Last Name', 'Email'])
+        self.assertEqual(
+            [row[:3] for row in rows[1:]],
+            [['First0', 'Last0', 'alumni0@example.com'], ['First1', 'Last1', 'alumni1@example.com']],
+        )
+
+    def test_engagements_csv(self):
+        create_records(alumni=1, partners=2)
+        rows = self.export('engagements')
+        self.assertEqual(rows[0], ['Alumni', 'Partner', 'Type', 'Date', 'Description', 'Notes'])
+        self.assertEqual([row[:3] for row in rows[1:]], [
+            ['First0 Last0', 'Partner 0', 'Mentorship'],
+            ['First0 Last0', 'Partner 1', 'Mentorship'],
+        ])
+
+    def test_query_count_does_not_grow_with_rows(self):
+        create_records(alumni=3, partners=3)
+        # Several fetches per query, still a single query per export
+        with mock.patch.object(views, 'EXPORT_CHUNK_SIZE', 2):
+            for data_type, expected in (('alumni', 3), ('partners', 3), ('engagements', 9)):
+                self.assertEqual(len(self.export(data_type)), expected + 1)
+
+    def test_rows_are_read_while_streaming(self):
+        create_records(alumni=5, partners=1)
+        fetched = []
+        cursor_iter = compiler.cursor_iter
+
+        def counting_cursor_iter(*args, **kwargs):
+            for rows in cursor_iter(*args, **kwargs):
+                fetched.append(len(rows))
+                yield rows
+
+        with mock.patch.object(views, 'EXPORT_CHUNK_SIZE', 2), \
+                mock.patch.object(compiler, 'cursor_iter', counting_cursor_iter):
+            response = self.client.get('/api/admin/export/alumni/')
+            self.assertIsInstance(response, StreamingHttpResponse)
+            self.assertEqual(fetched, [])
+            content = iter(response.streaming_content)
+            self.assertTrue(next(content).startswith(b'First Name,'))
+            self.assertTrue(next(content).startswith(b'First0,'))
+            # The first line went out after one chunk of the table was read
+            self.assertEqual(fetched, [2])
+            self.assertEqual(len(list(content)), 4)
+        self.assertEqual(fetched, [2, 2, 1])
+
+    def test_unknown_type_is_empty(self):
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/admin/export/bogus/')
+        self.assertEqual(b''.join(response.streaming_content), b'')
+
+
+class QueryBudgetTests(TestCase):
+    """Fixed number of queries per endpoint, independent of the number of rows"""
+
+    # Path (formatted with the first alumni/partner/engagement id) -> queries
+    BUDGETS = {
+        '/api/alumni/': 2,
+        '/api/alumni/{alumni}/': 2,
+        '/api/alumni/statistics/': 1,
+        '/api/partners/': 2,
+        '/api/partners/{partner}/': 2,
+        '/api/partners/statistics/': 1,
+        '/api/partners/top_engaged/': 1,
+        '/api/engagements/': 2,
+        '/api/engagements/{engagement}/': 1,
+        '/api/engagements/by_type/?type=mentorship': 1,
+        '/api/engagements/recent/': 1,
+        '/api/analytics/overview/': 3,
+        '/api/admin/users/': 2,
+        '/api/admin/audit-logs/': 1,
+        '/api/admin/cache-stats/': 0,
+    }
+
+    def setUp(self):
+        create_records(alumni=2, partners=2)
+        self.client = APIClient()
+        self.client.force_authenticate(create_admin())
+
+    def assert_budgets(self):
+        ids = {
+            'alumni': Alumni.objects.order_by('pk').first().pk,
+            'partner': Partner.objects.order_by('pk').first().pk,
+            'engagement': Engagement.objects.order_by('pk').first().pk,
+        }
+        for path, queries in self.BUDGETS.items():
+            url = path.format(**ids)
+            with self.subTest(url=url):
+                # Measure the uncached response
+                cache.clear()
+                with self.assertNumQueries(queries):
+                    response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+
+    def test_budgets(self):
+        self.assert_budgets()
+
+    def test_budgets_do_not_grow_with_rows(self):
+        Engagement.objects.all().delete()
+        Alumni.objects.all().delete()
+        Partner.objects.all().delete()
+        create_records(alumni=8, partners=5)
+        self.assert_budgets()
+
+
+class SearchTests(TestCase):
+    """?search= through the full-text index"""
+
+    def setUp(self):
+        create_records(alumni=3, partners=2)
+        Alumni.objects.filter(email='alumni1@example.com').update(first_name='Maria', last_name='Maria')
+        Alumni.objects.filter(email='alumni2@example.com').update(first_name='Maria')
+        self.client = APIClient()
+        self.client.force_authenticate(create_admin())
+
+    def search(self, path, text):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path, {'search': text})
+        self.assertEqual(response.status_code, 200)
+        return response.json()['results'], [query['sql'] for query in queries]
+
+    def test_alumni_ranked_from_one_join(self):
+        results, queries = self.search('/api/alumni/', 'maria')
+        self.assertEqual([row['email'] for row in results], ['alumni1@example.com', 'alumni2@example.com'])
+        page = queries[-1]
+        self.assertEqual(page.count('core_alumni_fts MATCH'), 1)
+
+    def test_cursor_pages_keep_the_ranking(self):
+        ranked, _ = self.search('/api/alumni/', 'maria')
+        response = self.client.get('/api/alumni/', {'search': 'maria', 'cursor': '', 'page_size': 1})
+        first = response.json()
+        response = self.client.get(first['next'])
+        second = response.json()
+        self.assertEqual(
+            [row['email'] for row in first['results'] + second['results']],
+            [row['email'] for row in ranked],
+        )
+        self.assertIsNone(second['next'])
+        self.assertEqual(self.client.get(second['previous']).json()['results'], first['results'])
+
+    def test_engagements_match_baseline_fields_only(self):
+        results, _ = self.search('/api/engagements/', 'maria')
+        self.assertEqual(len(results), 4)
+        # Alumni email and partner industry are indexed but not engagement search fields
+        self.assertEqual(self.search('/api/engagements/', 'example')[0], [])
+        self.assertEqual(self.search('/api/engagements/', 'technology')[0], [])
+        # Each term may match a different field
+        results, _ = self.search('/api/engagements/', 'maria partner 1')
+        self.assertEqual(len(results), 2)
+
+    def search_by_company(self, params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/alumni/search_by_company/', params)
+        self.assertEqual(response.status_code, 200)
+        return [row['email'] for row in response.json()['results']], queries[-1]['sql']
+
+    def test_company_prefix_and_substring(self):
+        Alumni.objects.filter(email='alumni0@example.com').update(current_company='Acme  Labs')
+        Alumni.objects.filter(email='alumni1@example.com').update(current_company='Globex')
+        Alumni.objects.filter(email='alumni2@example.com').update(current_company='Acmez')
+
+        emails, sql = self.search_by_company({'prefix': ' ACME '})
+        self.assertEqual(emails, ['alumni0@example.com', 'alumni2@example.com'])
+        self.assertNotIn('LIKE', sql)
+        self.assertEqual(self.search_by_company({'prefix': 'acme l'})[0], ['alumni0@example.com'])
+        self.assertEqual(self.search_by_company({'prefix': 'acmf'})[0], [])
+
+        emails, sql = self.search_by_company({'company': 'ME LA'})
+        self.assertEqual(emails, ['alumni0@example.com'])
+        self.assertIn('core_alumni_company_trgm MATCH', sql)
+
+    def test_short_company_substring_scans_the_column(self):
+        Alumni.objects.filter(email='alumni1@example.com').update(current_company='Globex')
+
+        emails, sql = self.search_by_company({'company': 'ob'})
+        self.assertEqual(emails, ['alumni1@example.com'])
+        self.assertNotIn('core_alumni_company_trgm', sql)
+        self.assertIn('LIKE', sql)
+
+    def test_company_prefix_on_other_backends_uses_startswith(self):
+        queryset = Alumni.objects.all()
+        with mock.patch.object(connection, 'vendor', 'postgresql'):
+            sql = str(search.filter_company(queryset, prefix='Acme').query)
+        self.assertIn('LIKE acme%', sql)
+
+
+class KeysetPaginationTests(TestCase):
+    """Cursor pages walk every row exactly once in both directions"""
+
+    def setUp(self):
+        alumni, _ = create_records(alumni=7, partners=1)
+        self.alumni = Alumni.objects.filter(pk__in=[row.pk for row in alumni])
+        # Ties on last_engagement and rows without any
+        Alumni.objects.filter(pk__in=[alumni[2].pk, alumni[3].pk]).update(last_engagement=alumni[2].last_engagement)
+        Alumni.objects.filter(pk__in=[alumni[0].pk, alumni[5].pk]).update(last_engagement=None)
+
+    def page(self, ordering, link=None):
+        params = {'ordering': ordering, 'cursor': ''}
+        if link is not None:
+            params['cursor'] = parse_qs(urlparse(link).query)['cursor'][0]
+        paginator = KeysetPagination(page_size=2)
+        request = Request(APIRequestFactory().get('/api/alumni/', params))
+        rows = paginator.paginate_queryset(self.alumni, request, views.AlumniViewSet())
+        return [row.pk for row in rows], paginator
+
+    def walk(self, ordering):
+        pages = []
+        rows, paginator = self.page(ordering)
+        pages.append(rows)
+        while paginator.get_next_link():
+            rows, paginator = self.page(ordering, paginator.get_next_link())
+            pages.append(rows)
+
+        backward = [pages[-1]]
+        while paginator.get_previous_link():
+            rows, paginator = self.page(ordering, paginator.get_previous_link())
+            backward.insert(0, rows)
+        self.assertEqual(backward, pages)
+        return [pk for page in pages for pk in page]
+
+    def expected(self, field, descending):
+        rows = list(self.alumni.values_list(field, 'pk'))
+        present = sorted((row for row in rows if row[0] is not None), reverse=descending)
+        missing = sorted((row for row in rows if row[0] is None), reverse=descending)
+        return [pk for _, pk in present + missing]
+
+    def test_ties_are_broken_by_pk(self):
+        self.assertEqual(self.walk('graduation_year'), self.expected('graduation_year', False))
+        self.assertEqual(self.walk('-graduation_year'), self.expected('graduation_year', True))
+
+    def test_null_values_sort_last(self):
+        self.assertEqual(self.walk('last_engagement'), self.expected('last_engagement', False))
+        self.assertEqual(self.walk('-last_engagement'), self.expected('last_engagement', True))
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(NotFound):
+            self.page('graduation_year', 'http://testserver/api/alumni/?cursor=not-a-cursor')
+
+
+class ResponseCacheTests(TestCase):
+    """Cached read endpoints are invalidated by writes"""
+
+    def setUp(self):
+        cache.clear()
+        self.alumni, self.partners = create_records(alumni=2, partners=2)
+        self.client = APIClient()
+        self.client.force_authenticate(create_admin())
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_engagement_save_invalidates_top_engaged(self):
+        url = '/api/partners/top_engaged/'
+        self.assertEqual(self.get(url)['X-Cache'], 'MISS')
+        self.assertEqual(self.get(url)['X-Cache'], 'HIT')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            for _ in range(3):
+                Engagement.objects.create(
+                    alumni=self.alumni[0], partner=self.partners[1], engagement_type='donation',
+                    engagement_date=datetime(2025, 1, 1, tzinfo=dt_timezone.utc),
+                )
+
+        response = self.get(url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.json()[0]['name'], 'Partner 1')
+
+    def test_queryset_update_invalidates_statistics(self):
+        url = '/api/alumni/statistics/'
+        self.get(url)
+        self.assertEqual(self.get(url)['X-Cache'], 'HIT')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Alumni.objects.all().update(status='inactive')
+
+        response = self.get(url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.json()['by_status'], {'inactive': 2})
+
+    def test_local_memory_cache_caps_the_timeout(self):
+        with self.settings(RESPONSE_CACHE_TIMEOUT=300, RESPONSE_CACHE_LOCAL_TIMEOUT=30):
+            self.assertFalse(response_cache.is_shared())
+            self.assertEqual(response_cache._timeout(None), 30)
+            self.assertEqual(response_cache._timeout(10), 10)
+        shared = {'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': '/tmp'}}
+        with self.settings(CACHES=shared, RESPONSE_CACHE_TIMEOUT=300):
+            self.assertTrue(response_cache.is_shared())
+            self.assertEqual(response_cache._timeout(None), 300)
+
+
+class StatisticsFacetTests(TestCase):
+    """Statistics endpoints use the live GROUP BY only for filters and search"""
+
+    def setUp(self):
+        cache.clear()
+        create_records(alumni=4, partners=1)
+        Alumni.objects.filter(graduation_year=2015).update(status='inactive')
+        self.client = APIClient()
+        self.client.force_authenticate(create_admin())
+
+    def statistics(self, params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/alumni/statistics/', params)
+        self.assertEqual(response.status_code, 200)
+        tables = {'core_alumni' if '"core_alumni"' in query['sql'] else 'snapshot' for query in queries}
+        return response.json(), tables
+
+    def test_unrelated_parameters_read_the_snapshot(self):
+        data, tables = self.statistics({'page': 2, 'ordering': '-created_at', 'cursor': 'x', 'status': ''})
+        self.assertEqual(tables, {'snapshot'})
+        self.assertEqual(data['total_alumni'], 4)
+
+    def test_filters_and_search_run_live(self):
+        data, tables = self.statistics({'status': 'inactive', 'page': 2})
+        self.assertEqual(tables, {'core_alumni'})
+        self.assertEqual(data['total_alumni'], 2)
+
+        data, tables = self.statistics({'search': 'first1'})
+        self.assertEqual(tables, {'core_alumni'})
+        self.assertEqual(data['total_alumni'], 1)
+
+
+class FacetCountTests(TestCase):
+    """facet_counts returns the same counts on every backend"""
+
+    def setUp(self):
+        create_records(alumni=4, partners=1)
+        Alumni.objects.filter(graduation_year=2015).update(status='inactive', industry='')
+
+    def test_counts_each_facet_and_the_total(self):
+        total, facets = filterspec.facet_counts(Alumni.objects.all(), ['status', 'industry'])
+        self.assertEqual(total, 4)
+        self.assertEqual(facets, {'status': {'active': 2, 'inactive': 2}, 'industry': {'Technology': 2}})
+
+    def test_grouping_sets_sql(self):
+        queryset = Alumni.objects.filter(graduation_year__gte=2016).order_by('last_name')
+        sql, params = filterspec._grouping_sets_sql(queryset, ['status', 'graduation_year'])
+
+        self.assertTrue(sql.startswith(
+            'SELECT "status", "graduation_year", GROUPING("status"), GROUPING("graduation_year"), COUNT(*) FROM ('
+        ))
+        self.assertTrue(sql.endswith(
+            ') facet_source GROUP BY GROUPING SETS (("status"), ("graduation_year"), ())'
+        ))
+        self.assertNotIn('ORDER BY', sql)
+        self.assertEqual(params, (2016,))
+
+    def test_postgresql_reads_grouping_sets_rows(self):
+        cursor = mock.MagicMock()
+        cursor.fetchall.return_value = [
+            ('active', None, 0, 1, 2),
+            ('inactive', None, 0, 1, 2),
+            (None, 'Technology', 1, 0, 2),
+            (None, '', 1, 0, 2),
+            (None, None, 1, 1, 4),
+        ]
+        with mock.patch.object(connection, 'vendor', 'postgresql'), \
+                mock.patch.object(connection, 'cursor') as open_cursor:
+            open_cursor.return_value.__enter__.return_value = cursor
+            total, facets = filterspec.facet_counts(Alumni.objects.all(), ['status', 'industry'])
+
+        self.assertIn('GROUP BY GROUPING SETS', cursor.execute.call_args[0][0])
+        self.assertEqual(total, 4)
+        self.assertEqual(facets, {'status': {'active': 2, 'inactive': 2}, 'industry': {'Technology': 2}})
+
+
+class TokenAuthenticationTests(TestCase):
+    """Cached token authentication honours logout and deactivation"""
+
+    def setUp(self):
+        cache.clear()
+        authentication._local.clear()
+        self.user = User.objects.create_user('alumni', 'alumni@example.com', 'alumni-password-1')
+        self.token = Token.objects.create(user=self.user)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+
+    def assert_status(self, status_code):
+        self.assertEqual(self.client.get('/api/alumni/').status_code, status_code)
+
+    def test_token_rejected_after_logout(self):
+        self.assert_status(200)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(self.client.post('/auth/logout/').status_code, 200)
+        self.assertFalse(Token.objects.filter(key=self.token.key).exists())
+        self.assert_status(401)
+
+    def test_token_rejected_after_deactivation(self):
+        self.assert_status(200)
+        admin = APIClient()
+        admin.force_authenticate(create_admin())
+        with self.captureOnCommitCallbacks(execute=True):
+            response = admin.post(f"/api/admin/users/{self.user.pk}/toggle-status/")
+        self.assertEqual(response.json(), {'success': True, 'is_active': False})
+        self.assert_status(401)
+
+    def test_repeat_lookups_are_cached(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(authentication.get_user(self.token.key), self.user)
+        with self.assertNumQueries(0):
+            self.assertEqual(authentication.get_user(self.token.key), self.user)
+
+    def test_process_local_cache_is_not_shared_level(self):
+        authentication.get_user(self.token.key)
+        self.assertIsNone(cache.get(authentication._cache_key(self.token.key)))
+
+        authentication._local.clear()
+        with tempfile.TemporaryDirectory() as location:
+            shared = {'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': location}}
+            with self.settings(CACHES=shared):
+                authentication.get_user(self.token.key)
+                self.assertEqual(caches['default'].get(authentication._cache_key(self.token.key)), self.user)
+
+
+class AdminListQueryTests(TestCase):
+    """Admin user and audit log lists cost the same number of queries on every page"""
+
+    def setUp(self):
+        admin = create_admin()
+        alumni, _ = create_records(alumni=12, partners=1)
+        for i, alumnus in enumerate(alumni):
+            alumnus.user = User.objects.create_user(f"user{i}", f"user{i}@example.com", is_active=i % 3 != 0)
+            alumnus.save()
+        for i in range(30):
+            audit.record(admin, 'update', f"Change {i}")
+        self.client = APIClient()
+        self.client.force_authenticate(admin)
+
+    def walk(self, url, page_size, first_page_queries, page_queries):
+        """Follow `next` links, checking each page's query count; returns every result"""
+        results = []
+        url, queries = f"{url}?page_size={page_size}", first_page_queries
+        while url:
+            with self.assertNumQueries(queries):
+                data = self.client.get(url).json()
+            self.assertLessEqual(len(data['results']), page_size)
+            results += data['results']
+            url, queries = data['next'], page_queries
+        return results
+
+    def test_users(self):
+        for page_size in (5, 20):
+            with self.subTest(page_size=page_size):
+                # First page: the page plus one aggregate for count/active_count
+                users = self.walk('/api/admin/users/', page_size, 2, 1)
+                self.assertEqual(len(users), 13)
+                self.assertEqual(len({user['id'] for user in users}), 13)
+        data = self.client.get('/api/admin/users/', {'page_size': 5}).json()
+        self.assertEqual((data['count'], data['active_count']), (13, 9))
+
+    def test_audit_logs(self):
+        for page_size in (5, 20):
+            with self.subTest(page_size=page_size):
+                events = self.walk('/api/admin/audit-logs/', page_size, 1, 1)
+                self.assertEqual(len(events), 30)
+                self.assertEqual([event['title'] for event in events][:2], ['Change 29', 'Change 28'])
+
+
+class EngagementRollupTests(TestCase):
+    """engagement_count and last_engagement on Alumni and Partner"""
+
+    def setUp(self):
+        (self.alumnus,), (self.partner,) = create_records(alumni=1, partners=1)
+
+    def record(self, day):
+        return Engagement.objects.create(
+            alumni=self.alumnus, partner=self.partner, engagement_type='interview',
+            engagement_date=datetime(2025, 3, day, tzinfo=dt_timezone.utc),
+        )
+
+    def test_writes_keep_rollups_current(self):
+        newest = self.record(2)
+        self.record(1)
+        self.alumnus.refresh_from_db()
+        self.assertEqual(self.alumnus.engagement_count, 3)
+        self.assertEqual(self.alumnus.last_engagement, newest.engagement_date)
+
+        newest.delete()
+        self.partner.refresh_from_db()
+        self.assertEqual(self.partner.engagement_count, 2)
+        self.assertEqual(self.partner.last_engagement, datetime(2025, 3, 1, tzinfo=dt_timezone.utc))
+
+    def test_stale_instance_does_not_overwrite_rollups(self):
+        stale = Alumni.objects.get(pk=self.alumnus.pk)
+        self.record(2)
+        stale.job_title = 'Engineer'
+        stale.save()
+
+        self.alumnus.refresh_from_db()
+        self.assertEqual(self.alumnus.job_title, 'Engineer')
+        self.assertEqual(self.alumnus.engagement_count, 2)
+        self.assertEqual(self.alumnus.last_engagement, datetime(2025, 3, 2, tzinfo=dt_timezone.utc))
+
+    def test_save_keeps_django_semantics(self):
+        seen = []
+
+        def receiver(sender, instance, created, update_fields, **kwargs):
+            seen.append((created, update_fields))
+
+        post_save.connect(receiver, sender=Partner)
+        try:
+            self.partner.save()
+            Partner.objects.filter(pk=self.partner.pk).delete()
+            # A row deleted underneath the instance is inserted again
+            self.partner.save()
+        finally:
+            post_save.disconnect(receiver, sender=Partner)
+
+        self.assertEqual(seen, [(False, None), (True, None)])
+        self.assertTrue(Partner.objects.filter(pk=self.partner.pk).exists())
+
+
+class LoginBackendTests(TestCase):
+    """Each login attempt costs one user query and one password hash"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('Alumni.User', 'Alumni.User@Example.com', 'alumni-password-1')
+
+    def attempt(self, username, password):
+        with mock.patch.object(hashers, 'pbkdf2', wraps=hashers.pbkdf2) as pbkdf2:
+            with self.assertNumQueries(1):
+                user = authenticate(None, username=username, password=password)
+        self.assertEqual(pbkdf2.call_count, 1)
+        return user
+
+    def test_unknown_user(self):
+        self.assertIsNone(self.attempt('nobody', 'alumni-password-1'))
+        self.assertIsNone(self.attempt('nobody@example.com', 'alumni-password-1'))
+
+    def test_wrong_password(self):
+        self.assertIsNone(self.attempt('Alumni.User', 'wrong-password'))
+        self.assertIsNone(self.attempt('alumni.user@example.com', 'wrong-password'))
+
+    def test_success(self):
+        for username in ('Alumni.User', 'alumni.user', 'ALUMNI.USER', 'alumni.user@example.com'):
+            with self.subTest(username=username):
+                self.assertEqual(self.attempt(username, 'alumni-password-1'), self.user)
+
+    def test_exact_username_beats_case_variants(self):
+        variants = {
+            name: User.objects.create_user(name, password='alumni-password-1')
+            for name in ('bob', 'Bob', 'BOB', 'bOb')
+        }
+        for name, user in variants.items():
+            with self.subTest(username=name):
+                self.assertEqual(self.attempt(name, 'alumni-password-1'), user)
+        # No exact match among several case variants is ambiguous
+        self.assertIsNone(self.attempt('BoB', 'alumni-password-1'))
+
+    def test_login_indexes_only_on_supported_databases(self):
+        migration = importlib.import_module('core.migrations.0013_user_login_indexes')
+        for vendor, statements in (('postgresql', 2), ('sqlite', 2), ('mysql', 0), ('oracle', 0)):
+            for operation in (migration.create_indexes, migration.drop_indexes):
+                with self.subTest(vendor=vendor, operation=operation.__name__):
+                    schema_editor = mock.Mock(quote_name=connection.ops.quote_name)
+                    schema_editor.connection.vendor = vendor
+                    operation(django_apps, schema_editor)
+                    self.assertEqual(schema_editor.execute.call_count, statements)
+
+
+class BulkIngestTests(TestCase):
+    """POST /api/engagements/bulk/ with JSON arrays and NDJSON streams"""
+
+    def setUp(self):
+        cache.clear()
+        self.alumni, self.partners = create_records(alumni=2, partners=2)
+        self.admin = create_admin()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def row(self, alumnus, partner, date='2025-06-01T00:00:00Z', **fields):
+        return {
+            'alumni': alumnus.pk, 'partner': partner.pk, 'engagement_type': 'interview',
+            'engagement_date': date, **fields,
+        }
+
+    def post(self, body, **kwargs):
+        if 'content_type' not in kwargs:
+            kwargs['format'] = 'json'
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post('/api/engagements/bulk/', body, **kwargs)
+
+    def test_mixed_valid_and_invalid_rows(self):
+        response = self.post([
+            self.row(self.alumni[0], self.partners[0]),
+            {'alumni': self.alumni[0].pk},
+            self.row(self.alumni[1], self.partners[1], engagement_type='unknown'),
+            {**self.row(self.alumni[1], self.partners[1]), 'alumni': 999999},
+            self.row(self.alumni[1], self.partners[0], date='2025-07-01T00:00:00Z'),
+        ])
+        self.assertEqual(response.status_code, 201)
+        body = response.json()
+        self.assertEqual((body['created'], body['failed']), (2, 3))
+        self.assertEqual([error['index'] for error in body['errors']], [1, 2, 3])
+        self.assertIn('partner', body['errors'][0]['errors'])
+        self.assertIn('engagement_type', body['errors'][1]['errors'])
+        self.assertIn('alumni', body['errors'][2]['errors'])
+        created = Engagement.objects.filter(engagement_type='interview')
+        self.assertEqual(created.count(), 2)
+        self.assertEqual(set(created.values_list('created_by', flat=True)), {self.admin.pk})
+
+    def test_malformed_ndjson_line(self):
+        lines = [
+            json.dumps(self.row(self.alumni[0], self.partners[0])),
+            '{"alumni": ',
+            '',
+            json.dumps(self.row(self.alumni[1], self.partners[1])),
+        ]
+        response = self.post('\n'.join(lines), content_type='application/x-ndjson')
+        self.assertEqual(response.status_code, 201)
+        body = response.json()
+        self.assertEqual((body['created'], body['failed']), (2, 1))
+        self.assertEqual(body['errors'][0]['index'], 1)
+        self.assertIn('JSON parse error', body['errors'][0]['errors']['non_field_errors'][0])
+
+    def test_non_array_body(self):
+        for body in ({'alumni': self.alumni[0].pk}, 'rows'):
+            with self.subTest(body=body):
+                self.assertEqual(self.post(body).status_code, 400)
+        self.assertEqual(Engagement.objects.filter(engagement_type='interview').count(), 0)
+
+    def test_rollups_and_stats_stay_consistent(self):
+        rows = [
+            self.row(alumnus, partner, date=f"2025-0{month}-01T00:00:00Z")
+            for month, (alumnus, partner) in enumerate(
+                [(a, p) for a in self.alumni for p in self.partners], start=1
+            )
+        ]
+        self.assertEqual(self.post(rows).status_code, 201)
+
+        for model, attname in ((Alumni, 'alumni'), (Partner, 'partner')):
+            for row in model.objects.all():
+                engagements = Engagement.objects.filter(**{attname: row})
+                self.assertEqual(row.engagement_count, engagements.count())
+                self.assertEqual(row.last_engagement, engagements.order_by('-engagement_date')[0].engagement_date)
+        self.assertEqual(stats.drift([Alumni, Partner, Engagement]), [])
+
+    def test_each_batch_commits_separately(self):
+        depths = []
+        depth = len(connection.atomic_blocks)
+
+        def rows():
+            for alumnus in self.alumni:
+                # Rows are read with no transaction of the import's own open
+                depths.append(len(connection.atomic_blocks))
+                yield self.row(alumnus, self.partners[0])
+
+        created, errors = ingest.ingest_engagements(rows(), self.admin, batch_size=1)
+        self.assertEqual((created, errors), (2, []))
+        self.assertEqual(depths, [depth, depth])
+
+
+class ReportJobTests(TestCase):
+    """Report jobs go from the API through the worker queue to a report"""
+
+    def setUp(self):
+        create_records(alumni=2, partners=1)
+        self.admin = create_admin()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_queued_job_runs_to_a_report(self):
+        response = self.client.post('/api/reports/generate_alumni_summary/')
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()['status'], ReportJob.STATUS_QUEUED)
+        status_url = response['Location']
+
+        out = io.StringIO()
+        call_command('run_report_worker', '--once', stdout=out)
+        self.assertIn('Processed 1 jobs', out.getvalue())
+
+        job = self.client.get(status_url).json()
+        self.assertEqual((job['status'], job['error']), (ReportJob.STATUS_SUCCEEDED, ''))
+        self.assertIsNotNone(job['finished_at'])
+        report = self.client.get(job['report_url'])
+        self.assertEqual(report.status_code, 200)
+        self.assertEqual(report.json()['report_type'], 'alumni_summary')
+
+    def test_failing_job_records_the_error(self):
+        job = jobs.enqueue('alumni_summary', user=self.admin)
+        with mock.patch.object(jobs, 'build_report', side_effect=RuntimeError('boom')), \
+                self.assertLogs('core.jobs', 'ERROR'):
+            jobs.run(jobs.claim_next('worker'))
+        job.refresh_from_db()
+        self.assertEqual(job.status, ReportJob.STATUS_FAILED)
+        self.assertEqual(job.error, 'RuntimeError: boom')
+        self.assertIsNone(job.report)
+        self.assertIsNotNone(job.finished_at)
+
+    @override_settings(REPORT_JOB_TIMEOUT=60, REPORT_JOB_MAX_ATTEMPTS=3)
+    def test_stale_jobs_are_requeued_or_failed(self):
+        retry, give_up, recent = [jobs.enqueue('alumni_summary') for _ in range(3)]
+        for job, attempts in ((retry, 1), (give_up, 3), (recent, 1)):
+            jobs.claim_next('dead-worker')
+            ReportJob.objects.filter(pk=job.pk).update(attempts=attempts)
+        ReportJob.objects.filter(pk__in=[retry.pk, give_up.pk]).update(
+            started_at=timezone.now() - timedelta(minutes=5)
+        )
+
+        self.assertEqual(jobs.requeue_stale(), (1, 1))
+        statuses = dict(ReportJob.objects.values_list('pk', 'status'))
+        self.assertEqual(statuses, {
+            retry.pk: ReportJob.STATUS_QUEUED,
+            give_up.pk: ReportJob.STATUS_FAILED,
+            recent.pk: ReportJob.STATUS_RUNNING,
+        })
+        self.assertEqual(ReportJob.objects.get(pk=retry.pk).worker, '')
+
+    def test_claims_never_share_a_job(self):
+        first, second = jobs.enqueue('alumni_summary'), jobs.enqueue('partner_summary')
+        rival = {}
+        now = timezone.now
+
+        def race():
+            # Another worker claims the same job between our SELECT and UPDATE
+            if 'job' not in rival:
+                rival['job'] = None
+                rival['job'] = jobs.claim_next('rival')
+            return now()
+
+        with mock.patch.object(jobs.timezone, 'now', side_effect=race):
+            mine = jobs.claim_next('worker')
+
+        self.assertEqual((rival['job'].pk, mine.pk), (first.pk, second.pk))
+        self.assertEqual(mine.worker, 'worker')
+        self.assertIsNone(jobs.claim_next('worker'))
+        self.assertEqual(
+            dict(ReportJob.objects.values_list('pk', 'worker')), {first.pk: 'rival', second.pk: 'worker'}
+        )
+
+
+@unittest.skipUnless(pdf.REPORTLAB_AVAILABLE, 'reportlab is not installed')
+class PdfTableTests(TestCase):
+    """render_table keeps cells inside their columns and text inside the page"""
+
+    COLUMNS = ['Name', 'Email', 'Graduation Year', 'Phone']
+    WIDTHS = [160, 200, 90, 90]
+
+    def render(self, preamble, rows):
+        drawn = []
+        draw_string = pdf.canvas.Canvas.drawString
+
+        def recording_draw_string(canvas, x, y, text, *args, **kwargs):
+            drawn.append((x, y, text, canvas._fontname, canvas._fontsize))
+            return draw_string(canvas, x, y, text, *args, **kwargs)
+
+        out = io.BytesIO()
+        with mock.patch.object(pdf.canvas.Canvas, 'drawString', recording_draw_string):
+            written = pdf.render_table(out, 'Report', preamble, self.COLUMNS, self.WIDTHS, rows)
+        pages = len(re.findall(rb'/Type /Page\b(?!s)', out.getvalue()))
+        return written, drawn, pages
+
+    def test_long_cells_are_cut_to_their_column(self):
+        long_row = ['Maximiliana ' * 10, ('very.long.address.' * 10) + '@example.com', 2015, '+1 555 0100 ' * 5]
+        written, drawn, _ = self.render([], [long_row, ['Ann Lee', 'ann@example.com', 2016, '-']])
+        self.assertEqual(written, 2)
+
+        edges = [pdf.PAGE_MARGIN + sum(self.WIDTHS[:i]) for i in range(len(self.WIDTHS) + 1)]
+        cells = [entry for entry in drawn if entry[0] - pdf.CELL_PADDING in edges]
+        self.assertEqual(len(cells), 3 * len(self.COLUMNS))
+        for x, _, text, font, size in cells:
+            column = edges.index(x - pdf.CELL_PADDING)
+            self.assertLessEqual(
+                pdf.stringWidth(text, font, size), self.WIDTHS[column] - 2 * pdf.CELL_PADDING, text
+            )
+        texts = [text for _, _, text, _, _ in cells]
+        self.assertTrue(texts[4].startswith('Maximiliana') and texts[4].endswith(pdf.ELLIPSIS))
+        self.assertTrue(texts[5].startswith('very.long.address.') and texts[5].endswith(pdf.ELLIPSIS))
+        self.assertEqual(texts[6], '2015')
+        self.assertEqual(texts[8:], ['Ann Lee', 'ann@example.com', '2016', '-'])
+
+    def test_long_preamble_continues_on_the_next_page(self):
+        preamble = [(f"filter_{i}: value {i}", 'BodyText') for i in range(120)]
+        positions = []
+        draw_on = pdf.Paragraph.drawOn
+
+        def recording_draw_on(paragraph, canvas, x, y, *args, **kwargs):
+            positions.append(y)
+            return draw_on(paragraph, canvas, x, y, *args, **kwargs)
+
+        with mock.patch.object(pdf.Paragraph, 'drawOn', recording_draw_on):
+            written, drawn, pages = self.render(preamble, [['Ann Lee', 'ann@example.com', 2016, '-']])
+        self.assertEqual(written, 1)
+        self.assertGreaterEqual(pages, 2)
+        self.assertEqual(len(positions), len(preamble) + 1)
+        self.assertGreaterEqual(min(positions), pdf.PAGE_MARGIN)
+        self.assertGreaterEqual(min(y for _, y, _, _, _ in drawn), pdf.PAGE_MARGIN)
+
+
+@unittest.skipUnless(pdf.REPORTLAB_AVAILABLE, 'reportlab is not installed')
+class PdfDownloadTests(TestCase):
+    """download_pdf serves the cached artifact with an ETag"""
+
+    def setUp(self):
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location, ignore_errors=True)
+        settings_override = override_settings(REPORT_ARTIFACT_ROOT=location)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.report = Report.objects.create(
+            title='Alumni Summary', report_type='alumni_summary', data={'total_alumni': 3, 'by_degree': {'BS': 3}},
+        )
+        self.url = f"/api/reports/{self.report.pk}/download_pdf/"
+        self.client = APIClient()
+        self.client.force_authenticate(create_admin())
+
+    def download(self, **headers):
+        response = self.client.get(self.url, **headers)
+        if response.status_code == 200:
+            response.content_bytes = b''.join(response.streaming_content)
+            response.close()
+        return response
+
+    def test_etag_answers_not_modified(self):
+        first = self.download()
+        self.assertEqual(first.status_code, 200)
+        self.assertTrue(first.content_bytes.startswith(b'%PDF'))
+        etag = first['ETag']
+        self.assertEqual(etag, f'"{artifacts.fingerprint(self.report)}"')
+
+        with mock.patch.object(artifacts, '_render') as render:
+            repeat = self.download(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(repeat.status_code, 304)
+        self.assertEqual(repeat['ETag'], etag)
+        self.assertEqual(repeat.content, b'')
+        render.assert_not_called()
+
+        self.assertEqual(self.download(HTTP_IF_NONE_MATCH='"stale"').status_code, 200)
+
+    def test_artifact_removed_before_opening_is_rendered_again(self):
+        self.assertEqual(self.download().status_code, 200)
+        real_open = open
+        opened = []
+
+        def racing_open(path, *args, **kwargs):
+            if not opened:
+                # clear_report_artifacts runs between the check and the open
+                shutil.rmtree(artifacts.root())
+            opened.append(path)
+            return real_open(path, *args, **kwargs)
+
+        with mock.patch('core.artifacts.open', racing_open, create=True), \
+                mock.patch('core.views.open', racing_open, create=True):
+            response = self.download()
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_bytes.startswith(b'%PDF'))
+        self.assertEqual(len(opened), 2)
+
+
+class AdminAuditTests(TestCase):
+    """Admin edits record what changed, not just which fields"""
+
+    def test_update_detail_lists_old_and_new_values(self):
+        _, (partner,) = create_records(alumni=1, partners=1)
+        user = create_admin()
+        request = RequestFactory().post('/admin/')
+        request.user = user
+        form = modelform_factory(Partner, fields=['name', 'industry', 'city'])(
+            data={'name': 'Renamed Partner', 'industry': 'Technology', 'city': ''}, instance=partner,
+            initial={'name': partner.name, 'industry': partner.industry, 'city': partner.city},
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+
+        admin.PartnerAdmin(Partner, django_admin.site).save_model(request, form.save(commit=False), form, change=True)
+
+        event = AuditEvent.objects.get(action='update')
+        self.assertIn('name: Partner 0 → Renamed Partner', event.detail)
+        self.assertNotIn('industry', event.detail)
+        self.assertEqual(event.changes, {'name': ['Partner 0', 'Renamed Partner']})
+
+
+class ReportRowTests(TestCase):
+    """Report rows are paginated from ReportRow; report lists skip the data JSON"""
+
+    def setUp(self):
+        self.report = Report.objects.create(
+            title='Filtered', report_type='custom_filtered',
+            data={'scope': 'alumni', 'columns': reports.ALUMNI_ROW_COLUMNS, 'row_count': 5},
+        )
+        reports.store_rows(self.report, (
+            [f"First{i}", f"Last{i}", f"alumni{i}@example.com", 2015 + i, None] for i in range(5)
+        ))
+        self.client = APIClient()
+        self.client.force_authenticate(create_admin())
+
+    def test_rows_are_paginated_in_position_order(self):
+        url = f"/api/reports/{self.report.pk}/rows/"
+        first = self.client.get(url, {'page_size': 2}).json()
+        self.assertEqual(first['count'], 5)
+        self.assertEqual(first['results'], [
+            {'first_name': 'First0', 'last_name': 'Last0', 'email': 'alumni0@example.com',
+             'graduation_year': 2015, 'phone': None},
+            {'first_name': 'First1', 'last_name': 'Last1', 'email': 'alumni1@example.com',
+             'graduation_year': 2016, 'phone': None},
+        ])
+        last = self.client.get(url, {'page_size': 2, 'page': 3}).json()
+        self.assertEqual([row['email'] for row in last['results']], ['alumni4@example.com'])
+        self.assertIsNone(last['next'])
+
+    def test_list_omits_data(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/reports/')
+        result = response.json()['results'][0]
+        self.assertEqual(result['id'], self.report.pk)
+        self.assertNotIn('data', result)
+        report_queries = [query['sql'] for query in queries if 'FROM "core_report"' in query['sql']]
+        self.assertTrue(report_queries)
+        self.assertFalse([sql for sql in report_queries if '"core_report"."data"' in sql])
+
+
+class MigrationTests(TransactionTestCase):
+    """Data migrations keep their data when applied and rolled back"""
+
+    def setUp(self):
+        self.executor = MigrationExecutor(connection)
+        self.latest = self.executor.loader.graph.leaf_nodes('core')
+
+    def tearDown(self):
+        self.migrate(self.latest)
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def test_audit_events_survive_a_rollback(self):
+        user = create_admin()
+        created_at = datetime(2024, 5, 1, 12, 0, tzinfo=dt_timezone.utc)
+        AuditEvent.objects.create(
+            actor=user, actor_username=user.username, action='update', summary='Partner Updated: Acme',
+            detail='Modified by admin', created_at=created_at,
+        )
+
+        apps = self.migrate([('core', '0008_reportrow')])
+        OldReport = apps.get_model('core', 'Report')
+        report = OldReport.objects.get(report_type='audit')
+        self.assertEqual(
+            (report.title, report.description, report.generated_by_id, report.created_at),
+            ('Partner Updated: Acme', 'Modified by admin', user.pk, created_at),
+        )
+
+        apps = self.migrate(self.latest)
+        event = apps.get_model('core', 'AuditEvent').objects.get()
+        self.assertEqual(
+            (event.action, event.summary, event.actor_id, event.created_at),
+            ('legacy', 'Partner Updated: Acme', user.pk, created_at),
+        )
+        self.assertFalse(apps.get_model('core', 'Report').objects.filter(report_type='audit').exists())
+
+    def test_stats_snapshot_is_populated_from_existing_rows(self):
+        create_records(alumni=4, partners=2)
+        expected = stats.compute(Alumni)
+
+        apps = self.migrate([('core', '0004_alter_alumni_degree_alter_engagement_engagement_type')])
+        apps = self.migrate([('core', '0005_statssnapshot')])
+        stored = {
+            (row.dimension, row.value): row.count
+            for row in apps.get_model('core', 'StatsSnapshot').objects.filter(dimension__startswith='alumni_')
+        }
+        self.assertEqual(stored, expected)
+
+    def test_inline_report_rows_move_to_report_row(self):
+        apps = self.migrate([('core', '0007_reportjob')])
+        rows = [
+            {'first_name': 'Ana', 'last_name': 'Cruz', 'email': 'ana@example.com', 'graduation_year': 2019, 'phone': ''},
+            {'first_name': 'Ben', 'last_name': 'Diaz', 'email': 'ben@example.com', 'graduation_year': 2020, 'phone': None},
+        ]
+        report = apps.get_model('core', 'Report').objects.create(
+            title='Filtered', report_type='custom_filtered', data={'scope': 'alumni', 'rows': rows},
+        )
+
+        self.migrate(self.latest)
+        report = Report.objects.get(pk=report.pk)
+        self.assertEqual(report.data, {'scope': 'alumni', 'columns': reports.ALUMNI_ROW_COLUMNS, 'row_count': 2})
+        self.assertEqual(list(reports.report_rows(report)), rows)
+
+        client = APIClient()
+        client.force_authenticate(create_admin())
+        self.assertNotIn('data', client.get('/api/reports/').json()['results'][0])
+        self.assertEqual(client.get(f"/api/reports/{report.pk}/rows/").json()['results'], rows)
+
+        apps = self.migrate([('core', '0007_reportjob')])
+        self.assertEqual(
+            apps.get_model('core', 'Report').objects.get(pk=report.pk).data, {'scope': 'alumni', 'rows': rows}
+        )
+
+
+class EngagementCreatorTests(TestCase):
+    """Engagement.created_by is set on every write path and backfilled from the audit trail"""
+
+    def setUp(self):
+        self.alumni, self.partners = create_records(alumni=2, partners=2)
+        self.admin = create_admin()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_write_paths_set_created_by(self):
+        body = {'engagement_type': 'interview', 'engagement_date': '2025-06-01T00:00:00Z'}
+        api = self.client.post('/api/engagements/', {
+            **body, 'alumni': self.alumni[0].pk, 'partner': self.partners[0].pk,
+        }, format='json')
+        self.assertEqual(api.status_code, 201)
+        from_alumni = self.client.post(f"/api/alumni/{self.alumni[0].pk}/record_engagement/", {
+            **body, 'partner_id': self.partners[1].pk,
+        }, format='json')
+        self.assertEqual(from_alumni.status_code, 201)
+        from_partner = self.client.post(f"/api/partners/{self.partners[0].pk}/record_engagement/", {
+            **body, 'alumni_id': self.alumni[1].pk,
+        }, format='json')
+        self.assertEqual(from_partner.status_code, 201)
+        bulk = self.client.post('/api/engagements/bulk/', [
+            {**body, 'alumni': self.alumni[1].pk, 'partner': self.partners[1].pk},
+        ], format='json')
+        self.assertEqual(bulk.json()['created'], 1)
+
+        request = RequestFactory().post('/admin/')
+        request.user = self.admin
+        engagement = Engagement(
+            alumni=self.alumni[0], partner=self.partners[1], engagement_type='interview',
+            engagement_date=datetime(2025, 6, 2, tzinfo=dt_timezone.utc),
+        )
+        admin.EngagementAdmin(Engagement, django_admin.site).save_model(request, engagement, None, change=False)
+
+        created = Engagement.objects.filter(engagement_type='interview')
+        self.assertEqual(created.count(), 5)
+        self.assertEqual(set(created.values_list('created_by', flat=True)), {self.admin.pk})
+
+    def test_backfill_from_legacy_and_structured_events(self):
+        Engagement.objects.update(created_by=None)
+        other = User.objects.create_user('editor', 'editor@example.com', 'editor-password-1')
+        structured, legacy, ambiguous, unknown = Engagement.objects.order_by('pk')[:4]
+        # A second engagement with the same label makes the legacy summary ambiguous
+        duplicate = Engagement.objects.create(
+            alumni=ambiguous.alumni, partner=ambiguous.partner, engagement_type=ambiguous.engagement_type,
+            engagement_date=datetime(2025, 1, 1, tzinfo=dt_timezone.utc),
+        )
+        AuditEvent.objects.bulk_create([
+            audit.event(self.admin, 'create', f"Engagement Created: {structured}", obj=structured),
+            # Rows moved over from the Report-based trail by migration 0009
+            audit.event(other, 'legacy', f"Engagement Created: {legacy}"),
+            audit.event(other, 'legacy', f"Engagement Created: {ambiguous}"),
+            audit.event(other, 'legacy', 'Engagement Updated: something else'),
+        ])
+
+        out = io.StringIO()
+        call_command('backfill_engagement_creators', '--dry-run', stdout=out)
+        self.assertIn('Would set the creator of 2 engagements; 3 without a creator', out.getvalue())
+        self.assertFalse(Engagement.objects.filter(created_by__isnull=False).exists())
+
+        out = io.StringIO()
+        call_command('backfill_engagement_creators', stdout=out)
+        self.assertIn('Set the creator of 2 engagements; 3 without a creator', out.getvalue())
+        creators = dict(Engagement.objects.values_list('pk', 'created_by'))
+        self.assertEqual(creators[structured.pk], self.admin.pk)
+        self.assertEqual(creators[legacy.pk], other.pk)
+        self.assertIsNone(creators[ambiguous.pk])
+        self.assertIsNone(creators[duplicate.pk])
+        self.assertIsNone(creators[unknown.pk])
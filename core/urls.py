@@ -2,11 +2,12 @@ from django.urls import path, include
 from django.views.generic import TemplateView
 from rest_framework.routers import DefaultRouter
 from .views import (
-    AlumniViewSet, PartnerViewSet, EngagementViewSet, ReportViewSet, 
-    landing_page, dashboard_view, alumni_summary_report, analytics_view, 
-    alumni_summary_report_pdf, admin_dashboard_view, admin_users_list,
-    admin_toggle_user_status, admin_audit_logs, admin_alumni_bulk_action,
-    admin_partner_bulk_action, admin_export_data, admin_update_alumni_status
+    AlumniViewSet, PartnerViewSet, EngagementViewSet, ReportViewSet, ReportJobViewSet,
+    landing_page, dashboard_view, alumni_summary_report, analytics_view, analytics_overview,
+    alumni_summary_report_pdf, admin_dashboard_view, AdminUserListView,
+    admin_toggle_user_status, AdminAuditLogListView, admin_alumni_bulk_action,
+    admin_partner_bulk_action, admin_export_data, admin_update_alumni_status,
+    admin_cache_stats
 )
 from .auth_views import (
     alumni_register, alumni_login, alumni_logout, current_user,
@@ -19,6 +20,7 @@ router.register(r'alumni', AlumniViewSet, basename='alumni')
 router.register(r'partners', PartnerViewSet, basename='partner')
 router.register(r'engagements', EngagementViewSet, basename='engagement')
 router.register(r'reports', ReportViewSet, basename='report')
+router.register(r'report-jobs', ReportJobViewSet, basename='report-job')
 router.register(r'my-profile', AlumniSelfProfileViewSet, basename='my-profile')
 
 urlpatterns = [
@@ -51,14 +53,18 @@ urlpatterns = [
     path('auth/update-alumni-profile/', update_alumni_profile, name='update-alumni-profile'),
     path('auth/change-password/', change_password, name='change-password'),
     
+    # Analytics API
+    path('api/analytics/overview/', analytics_overview, name='analytics-overview'),
+    
     # Admin API endpoints
-    path('api/admin/users/', admin_users_list, name='admin-users-list'),
+    path('api/admin/users/', AdminUserListView.as_view(), name='admin-users-list'),
     path('api/admin/users/<int:user_id>/toggle-status/', admin_toggle_user_status, name='admin-toggle-user'),
-    path('api/admin/audit-logs/', admin_audit_logs, name='admin-audit-logs'),
+    path('api/admin/audit-logs/', AdminAuditLogListView.as_view(), name='admin-audit-logs'),
     path('api/admin/alumni/bulk-action/', admin_alumni_bulk_action, name='admin-alumni-bulk'),
     path('api/admin/alumni/<int:alumni_id>/status/', admin_update_alumni_status, name='admin-update-alumni-status'),
     path('api/admin/partners/bulk-action/', admin_partner_bulk_action, name='admin-partner-bulk'),
     path('api/admin/export/<str:data_type>/', admin_export_data, name='admin-export-data'),
+    path('api/admin/cache-stats/', admin_cache_stats, name='admin-cache-stats'),
     
     # API endpoints
     path('api/', include(router.urls)),
@@ -1,231 +1,57 @@
-from rest_framework import viewsets, status, filters
-from rest_framework.decorators import action
+from rest_framework import generics, viewsets, status, filters
+from rest_framework.decorators import action, api_view, permission_classes
+from rest_framework.parsers import JSONParser
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
 from django.shortcuts import render, redirect
-from django.http import HttpResponseForbidden
+from django.http import HttpResponseBadRequest, HttpResponseForbidden
 from django.contrib.auth.decorators import login_required
-from django.db.models import Count
-from .models import Alumni, Partner, Engagement, Report
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Prefetch, Q
+from django.db.models.functions import TruncMonth
+from .models import Alumni, Partner, Engagement, Report, ReportJob, AuditEvent
+from .authentication import alumni_profile, user_from_header
+from .ingest import ingest_engagements
+from .pagination import KeysetListPagination, KeysetPagination, StandardPagination
+from .parsers import NDJSONParser
+from .search import FullTextSearchFilter, filter_company
+from . import artifacts, audit, filterspec, jobs, pdf, reports, response_cache, stats
+from .response_cache import cached_response
 from .serializers import (
     AlumniSerializer, AlumniDetailSerializer,
     PartnerSerializer, PartnerDetailSerializer,
-    EngagementSerializer, ReportSerializer,
-    AlumniStatsSerializer, PartnerStatsSerializer
+    EngagementSerializer, ReportSerializer, ReportListSerializer, ReportJobSerializer,
+    AlumniStatsSerializer, PartnerStatsSerializer, AdminUserSerializer, AuditEventSerializer,
+    DETAIL_ENGAGEMENT_LIMIT
 )
-import io
-from django.http import HttpResponse
+import tempfile
+from itertools import islice
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.utils.http import parse_etags
 from django.utils import timezone
 
-try:
-    from reportlab.pdfgen import canvas
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib import colors
-    from reportlab.lib.styles import getSampleStyleSheet
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-    REPORTLAB_AVAILABLE = True
-except Exception:
-    REPORTLAB_AVAILABLE = False
 
+# Rows shown in the HTML report preview; the PDF contains all of them
+PREVIEW_ROW_LIMIT = 500
 
-def _create_pdf_bytes(title, data_lines):
-    """Create a simple PDF in-memory from title and list of text lines.
 
-    Returns bytes of PDF. Requires reportlab.
-    """
-    if not REPORTLAB_AVAILABLE:
-        return None
-
-    buffer = io.BytesIO()
-    c = canvas.Canvas(buffer, pagesize=letter)
-    width, height = letter
-    y = height - 72
-    c.setFont('Helvetica-Bold', 16)
-    c.drawString(72, y, title)
-    y -= 28
-    c.setFont('Helvetica', 10)
-    for line in data_lines:
-        if y < 72:
-            c.showPage()
-            y = height - 72
-            c.setFont('Helvetica', 10)
-        c.drawString(72, y, line)
-        y -= 14
-
-    c.showPage()
-    c.save()
-    pdf = buffer.getvalue()
-    buffer.close()
-    return pdf
-
-
-def _create_custom_filtered_pdf(report):
-    """Create a PDF with a table for custom filtered reports."""
-    if not REPORTLAB_AVAILABLE:
-        return None
-
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=36, bottomMargin=36)
-    styles = getSampleStyleSheet()
-    elements = []
-
-    title = report.title or "Filtered Report"
-    elements.append(Paragraph(f"<b>{title}</b>", styles['Title']))
-    elements.append(Spacer(1, 12))
-
-    # Add timestamp
-    if report.created_at:
-        timestamp = report.created_at.strftime("%B %d, %Y at %I:%M %p")
-        elements.append(Paragraph(f"<i>Generated: {timestamp}</i>", styles['Normal']))
-        elements.append(Spacer(1, 8))
-
-    # Add summary section
-    rows = (report.data or {}).get('rows') or []
-    summary_text = f"<b>Summary:</b> {len(rows)} alumni found"
-    elements.append(Paragraph(summary_text, styles['Normal']))
-    elements.append(Spacer(1, 12))
-
-    filters = (report.data or {}).get('filters') or {}
-    filter_lines = []
-    for key, value in filters.items():
-        if value not in [None, '', []]:
-            filter_lines.append(f"{key}: {value}")
-    if not filter_lines:
-        filter_lines.append("No filters applied")
-
-    elements.append(Paragraph("<b>Filters</b>", styles['Heading4']))
-    for line in filter_lines:
-        elements.append(Paragraph(line, styles['BodyText']))
-    elements.append(Spacer(1, 12))
-
-    table_data = [["Name", "Email", "Graduation Year", "Phone"]]
-    for row in rows:
-        name = f"{row.get('first_name', '')} {row.get('last_name', '')}".strip()
-        table_data.append([
-            name or "-",
-            row.get('email') or "-",
-            row.get('graduation_year') or "-",
-            row.get('phone') or "-",
-        ])
-
-    table = Table(table_data, colWidths=[160, 200, 90, 90])
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#0056b3')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
-        ('FONTSIZE', (0, 1), (-1, -1), 9),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
-
-    elements.append(table)
-    doc.build(elements)
-    pdf = buffer.getvalue()
-    buffer.close()
-    return pdf
-
-
-def _report_lines(report):
-    """Convert a Report object into a list of text lines for PDF output."""
-    data = report.data or {}
-
-    if report.report_type == 'alumni_summary':
-        lines = [
-            f"Total alumni: {data.get('total_alumni', 0)}",
-            f"Active alumni: {data.get('active_alumni', 0)}",
-            f"Inactive alumni: {data.get('inactive_alumni', 0)}",
-            "",
-            "By degree:",
-        ]
-        for deg, cnt in (data.get('by_degree') or {}).items():
-            lines.append(f"- {deg}: {cnt}")
-        return lines
-
-    if report.report_type == 'partner_summary':
-        lines = [
-            f"Total partners: {data.get('total_partners', 0)}",
-            "",
-            "By type:",
-        ]
-        for t, cnt in (data.get('by_type') or {}).items():
-            lines.append(f"- {t}: {cnt}")
-        lines.append("")
-        lines.append("By engagement level:")
-        for lvl, cnt in (data.get('by_engagement_level') or {}).items():
-            lines.append(f"- {lvl}: {cnt}")
-        return lines
-
-    if report.report_type == 'engagement_analytics':
-        lines = [
-            f"Total engagements: {data.get('total_engagements', 0)}",
-            "",
-            "By type:",
-        ]
-        for t, cnt in (data.get('by_type') or {}).items():
-            lines.append(f"- {t}: {cnt}")
-        lines.append("")
-        lines.append("Top partners:")
-        for p in (data.get('top_partners') or []):
-            lines.append(f"- {p.get('name')}: {p.get('count')}")
-        return lines
-
-    if report.report_type == 'custom_filtered':
-        scope = data.get('scope') or 'alumni'
-        filters = data.get('filters') or {}
-        lines = [
-            f"Scope: {scope}",
-            "",
-            "Filters:",
-        ]
-        if filters:
-            for key, value in filters.items():
-                if value not in [None, '', []]:
-                    lines.append(f"- {key}: {value}")
-        else:
-            lines.append("- None")
-
-        lines.append("")
-        if scope == 'partners':
-            lines.append(f"Total partners: {data.get('total_partners', 0)}")
-            lines.append("By type:")
-            for t, cnt in (data.get('by_type') or {}).items():
-                lines.append(f"- {t}: {cnt}")
-            lines.append("By engagement level:")
-            for lvl, cnt in (data.get('by_engagement_level') or {}).items():
-                lines.append(f"- {lvl}: {cnt}")
-            return lines
-
-        lines.append(f"Total alumni: {data.get('total_alumni', 0)}")
-        lines.append("By status:")
-        for s, cnt in (data.get('by_status') or {}).items():
-            lines.append(f"- {s}: {cnt}")
-        lines.append("By degree:")
-        for deg, cnt in (data.get('by_degree') or {}).items():
-            lines.append(f"- {deg}: {cnt}")
-        lines.append("By graduation year:")
-        for yr, cnt in (data.get('by_graduation_year') or {}).items():
-            lines.append(f"- {yr}: {cnt}")
-        return lines
-
-    # Fallback
-    return ["Report data:", str(data)]
+def _site_counts():
+    """Alumni/partner/engagement totals for the landing page and dashboard"""
+    def compute():
+        snapshot = stats.read('alumni_total', 'partner_total', 'engagement_total')
+        return {
+            'alumni_count': stats.total(snapshot, 'alumni'),
+            'partner_count': stats.total(snapshot, 'partner'),
+            'engagement_count': stats.total(snapshot, 'engagement'),
+        }
+    return response_cache.cached_value('site_counts', ('alumni', 'partner', 'engagement'), compute)
 
 
 def landing_page(request):
     """Landing page view - common landing page for all users (no redirects)"""
     # Show landing page for all users - they can choose to login, register, or continue browsing
-    alumni_count = Alumni.objects.count()
-    partner_count = Partner.objects.count()
-    engagement_count = Engagement.objects.count()
-    
-    context = {
-        'alumni_count': alumni_count,
-        'partner_count': partner_count,
-        'engagement_count': engagement_count,
-    }
+    context = _site_counts()
     return render(request, 'index.html', context)
 
 
@@ -234,47 +60,70 @@ def dashboard_view(request):
     from django.shortcuts import redirect
     
     # Resolve user with token auth taking priority over session
-    user = request.user
-    from rest_framework.authtoken.models import Token
-    auth_header = request.META.get('HTTP_AUTHORIZATION', '')
-    if auth_header.startswith('Token '):
-        token_key = auth_header.split(' ')[1]
-        try:
-            token = Token.objects.get(key=token_key)
-            user = token.user
-        except Token.DoesNotExist:
-            pass
+    user = user_from_header(request) or request.user
     
     # Redirect ONLY admin users to admin dashboard
     if user.is_authenticated and (user.is_staff or user.is_superuser):
-        print(f"DEBUG: Admin user {user.username} detected in dashboard_view, redirecting to admin-dashboard")
         return redirect('/admin-dashboard/')
     
     # For regular users, continue to render dashboard
-    print(f"DEBUG: Regular user {user.username if user.is_authenticated else 'anonymous'} accessing dashboard_view")
-    
-    alumni = None
-    if user.is_authenticated:
-        alumni = Alumni.objects.filter(user=user).first()
-    
-    alumni_count = Alumni.objects.count()
-    partner_count = Partner.objects.count()
-    engagement_count = Engagement.objects.count()
+    alumni = alumni_profile(user)
     
     context = {
         'user': user,
         'alumni': alumni,
-        'alumni_count': alumni_count,
-        'partner_count': partner_count,
-        'engagement_count': engagement_count,
+        **_site_counts(),
     }
     return render(request, 'dashboard.html', context)
 
 
-class StandardPagination(PageNumberPagination):
-    page_size = 20
-    page_size_query_param = 'page_size'
-    max_page_size = 100
+PARTNER_STATISTICS_KEYS = {
+    'partner_type': 'by_type',
+    'engagement_level': 'by_engagement_level',
+    'industry': 'by_industry',
+}
+
+
+def _filters_requested(view, request):
+    """Whether the request has a non-blank filterset or search parameter of the list endpoint"""
+    names = set()
+    for backend in view.filter_backends:
+        if issubclass(backend, DjangoFilterBackend):
+            filterset_class = backend().get_filterset_class(view, view.get_queryset())
+            if filterset_class is not None:
+                names.update(filterset_class.base_filters)
+        elif issubclass(backend, filters.SearchFilter):
+            names.add(backend.search_param)
+    return any(request.query_params.get(name, '') != '' for name in names)
+
+
+def _statistics_facets(view, request, scope):
+    """Return (total, {facet: counts}) for a statistics endpoint.
+
+    `?facets=` picks the breakdowns (default: all). Requests without list
+    filters or search are answered from the materialized statistics, whatever
+    other parameters (page, ordering, cursor, ...) they carry; otherwise the
+    list endpoint's filters and search are applied and all facets come from
+    one query. Raises ValidationError for unknown facets.
+    """
+    allowed = filterspec.FACET_FIELDS[scope]
+    facets = allowed
+    if 'facets' in request.query_params:
+        facets = [name.strip() for name in request.query_params['facets'].split(',') if name.strip()]
+        unknown = [name for name in facets if name not in allowed]
+        if unknown:
+            raise ValidationError(f"Unknown facets: {', '.join(unknown)} (choose from {', '.join(allowed)})")
+
+    if _filters_requested(view, request):
+        return filterspec.facet_counts(view.filter_queryset(view.get_queryset()), facets)
+
+    model = view.get_queryset().model
+    dimensions = {field: dimension for dimension, field in stats.DIMENSIONS[model._meta.model_name].items()}
+    snapshot = stats.read(stats.total_dimension(model), *[dimensions[facet] for facet in facets])
+    return (
+        stats.total(snapshot, model._meta.model_name),
+        {facet: snapshot[dimensions[facet]] for facet in facets},
+    )
 
 
 class AlumniViewSet(viewsets.ModelViewSet):
@@ -282,64 +131,58 @@ class AlumniViewSet(viewsets.ModelViewSet):
     queryset = Alumni.objects.all()
     serializer_class = AlumniSerializer
     pagination_class = StandardPagination
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, FullTextSearchFilter]
     filterset_fields = ['status', 'degree', 'graduation_year', 'industry']
     search_fields = ['first_name', 'last_name', 'email', 'current_company']
-    ordering_fields = ['created_at', 'graduation_year', 'last_engagement']
+    search_index = {'pk': 'alumni'}
+    ordering_fields = ['created_at', 'graduation_year', 'last_engagement', 'engagement_count']
     ordering = ['-created_at']
     
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'retrieve':
+            recent = Engagement.objects.select_related('partner').order_by('-engagement_date')
+            queryset = queryset.prefetch_related(
+                Prefetch('engagements', queryset=recent[:DETAIL_ENGAGEMENT_LIMIT], to_attr='recent_engagements')
+            )
+        return queryset
+    
     def get_serializer_class(self):
         if self.action == 'retrieve':
             return AlumniDetailSerializer
         return AlumniSerializer
     
     @action(detail=False, methods=['get'])
+    @cached_response('alumni_statistics', depends_on=('alumni',))
     def statistics(self, request):
-        """Get alumni statistics and analytics"""
-        total = Alumni.objects.count()
-        active = Alumni.objects.filter(status='active').count()
-        
-        # By degree
-        by_degree = dict(
-            Alumni.objects.values_list('degree').annotate(
-                count=Count('id')
-            )
-        )
-        
-        # By graduation year
-        by_year = dict(
-            Alumni.objects.values_list('graduation_year').annotate(
-                count=Count('id')
-            )
-        )
+        """Get alumni statistics; `?facets=degree,graduation_year` limits the breakdowns"""
+        try:
+            total, facets = _statistics_facets(self, request, 'alumni')
+        except ValidationError as exc:
+            return Response({'error': exc.messages[0]}, status=status.HTTP_400_BAD_REQUEST)
         
-        # By industry
-        by_industry = dict(
-            Alumni.objects.filter(industry__isnull=False).exclude(industry='')
-            .values_list('industry').annotate(count=Count('id'))
-        )
-        
-        data = {
-            'total_alumni': total,
-            'active_alumni': active,
-            'by_degree': by_degree,
-            'by_graduation_year': by_year,
-            'by_industry': by_industry,
-        }
+        data = {'total_alumni': total}
+        if 'status' in facets:
+            data['active_alumni'] = facets['status'].get('active', 0)
+        for facet, counts in facets.items():
+            data[f'by_{facet}'] = counts
         
         serializer = AlumniStatsSerializer(data)
         return Response(serializer.data)
     
     @action(detail=False, methods=['get'])
     def search_by_company(self, request):
-        """Search alumni by company"""
-        company = request.query_params.get('company', '')
-        if not company:
-            return Response({'error': 'company parameter required'}, status=status.HTTP_400_BAD_REQUEST)
+        """Search alumni by company (substring via ?company=, typeahead via ?prefix=)"""
+        company = request.query_params.get('company', '').strip()
+        prefix = request.query_params.get('prefix', '').strip()
+        if not (company or prefix):
+            return Response({'error': 'company or prefix parameter required'}, status=status.HTTP_400_BAD_REQUEST)
         
-        queryset = Alumni.objects.filter(current_company__icontains=company)
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        queryset = filter_company(Alumni.objects.all(), company=company, prefix=prefix)
+        queryset = queryset.order_by('company_normalized', 'last_name', 'pk')
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
     
     @action(detail=True, methods=['post'])
     def record_engagement(self, request, pk=None):
@@ -362,7 +205,8 @@ class AlumniViewSet(viewsets.ModelViewSet):
                 partner=partner,
                 engagement_type=engagement_type,
                 engagement_date=engagement_date,
-                description=request.data.get('description', '')
+                description=request.data.get('description', ''),
+                created_by=request.user
             )
             serializer = EngagementSerializer(engagement)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -375,59 +219,49 @@ class PartnerViewSet(viewsets.ModelViewSet):
     queryset = Partner.objects.all()
     serializer_class = PartnerSerializer
     pagination_class = StandardPagination
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, FullTextSearchFilter]
     filterset_fields = ['partner_type', 'engagement_level', 'industry']
     search_fields = ['name', 'email', 'primary_contact_name', 'industry']
-    ordering_fields = ['created_at', 'engagement_level', 'last_engagement']
+    search_index = {'pk': 'partner'}
+    ordering_fields = ['created_at', 'engagement_level', 'last_engagement', 'engagement_count']
     ordering = ['-created_at']
     
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'retrieve':
+            recent = Engagement.objects.select_related('alumni').order_by('-engagement_date')
+            queryset = queryset.prefetch_related(
+                Prefetch('engagements', queryset=recent[:DETAIL_ENGAGEMENT_LIMIT], to_attr='recent_engagements')
+            )
+        return queryset
+    
     def get_serializer_class(self):
         if self.action == 'retrieve':
             return PartnerDetailSerializer
         return PartnerSerializer
     
     @action(detail=False, methods=['get'])
+    @cached_response('partner_statistics', depends_on=('partner',))
     def statistics(self, request):
-        """Get partner statistics and analytics"""
-        total = Partner.objects.count()
-        
-        # By partner type
-        by_type = dict(
-            Partner.objects.values_list('partner_type').annotate(
-                count=Count('id')
-            )
-        )
-        
-        # By engagement level
-        by_level = dict(
-            Partner.objects.values_list('engagement_level').annotate(
-                count=Count('id')
-            )
-        )
-        
-        # By industry
-        by_industry = dict(
-            Partner.objects.filter(industry__isnull=False).exclude(industry='')
-            .values_list('industry').annotate(count=Count('id'))
-        )
+        """Get partner statistics; `?facets=partner_type,industry` limits the breakdowns"""
+        try:
+            total, facets = _statistics_facets(self, request, 'partners')
+        except ValidationError as exc:
+            return Response({'error': exc.messages[0]}, status=status.HTTP_400_BAD_REQUEST)
         
-        data = {
-            'total_partners': total,
-            'by_type': by_type,
-            'by_engagement_level': by_level,
-            'by_industry': by_industry,
-        }
+        data = {'total_partners': total}
+        for facet, counts in facets.items():
+            data[PARTNER_STATISTICS_KEYS[facet]] = counts
         
         serializer = PartnerStatsSerializer(data)
         return Response(serializer.data)
     
     @action(detail=False, methods=['get'])
+    @cached_response('partner_top_engaged', depends_on=('partner', 'engagement'))
     def top_engaged(self, request):
         """Get top engaged partners"""
         limit = int(request.query_params.get('limit', 10))
-        partners = Partner.objects.annotate(
-            engagement_count=Count('engagements')
-        ).order_by('-engagement_count')[:limit]
+        partners = Partner.objects.order_by('-engagement_count', 'name')[:limit]
         
         serializer = self.get_serializer(partners, many=True)
         return Response(serializer.data)
@@ -453,7 +287,8 @@ class PartnerViewSet(viewsets.ModelViewSet):
                 partner=partner,
                 engagement_type=engagement_type,
                 engagement_date=engagement_date,
-                description=request.data.get('description', '')
+                description=request.data.get('description', ''),
+                created_by=request.user
             )
             serializer = EngagementSerializer(engagement)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -463,15 +298,20 @@ class PartnerViewSet(viewsets.ModelViewSet):
 
 class EngagementViewSet(viewsets.ModelViewSet):
     """ViewSet for Engagement management"""
-    queryset = Engagement.objects.all()
+    queryset = Engagement.objects.select_related('alumni', 'partner')
     serializer_class = EngagementSerializer
     pagination_class = StandardPagination
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, FullTextSearchFilter]
     filterset_fields = ['alumni', 'partner', 'engagement_type']
     search_fields = ['alumni__first_name', 'alumni__last_name', 'partner__name']
+    search_index = {'alumni': ('alumni', ['first_name', 'last_name']), 'partner': ('partner', ['name'])}
     ordering_fields = ['engagement_date', 'created_at']
     ordering = ['-engagement_date']
     
+    def perform_create(self, serializer):
+        """Record the requesting user as the engagement's creator"""
+        serializer.save(created_by=self.request.user)
+    
     @action(detail=False, methods=['get'])
     def by_type(self, request):
         """Get engagements by type"""
@@ -479,7 +319,7 @@ class EngagementViewSet(viewsets.ModelViewSet):
         if not engagement_type:
             return Response({'error': 'type parameter required'}, status=status.HTTP_400_BAD_REQUEST)
         
-        engagements = Engagement.objects.filter(engagement_type=engagement_type)
+        engagements = self.get_queryset().filter(engagement_type=engagement_type)
         serializer = self.get_serializer(engagements, many=True)
         return Response(serializer.data)
     
@@ -487,14 +327,30 @@ class EngagementViewSet(viewsets.ModelViewSet):
     def recent(self, request):
         """Get recent engagements"""
         limit = int(request.query_params.get('limit', 20))
-        recent = Engagement.objects.all()[:limit]
+        recent = self.get_queryset()[:limit]
         serializer = self.get_serializer(recent, many=True)
         return Response(serializer.data)
+    
+    @action(detail=False, methods=['post'], parser_classes=[JSONParser, NDJSONParser])
+    def bulk(self, request):
+        """Create engagements from a JSON array or an NDJSON stream"""
+        rows = request.data
+        if isinstance(rows, (dict, str)) or not hasattr(rows, '__iter__'):
+            return Response({'error': 'Expected a JSON array or NDJSON body'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        created, errors = ingest_engagements(rows, request.user)
+        if created:
+            response_status = status.HTTP_201_CREATED
+        elif errors:
+            response_status = status.HTTP_400_BAD_REQUEST
+        else:
+            response_status = status.HTTP_200_OK
+        return Response({'created': created, 'failed': len(errors), 'errors': errors}, status=response_status)
 
 
 class ReportViewSet(viewsets.ModelViewSet):
     """ViewSet for Report management"""
-    queryset = Report.objects.all()
+    queryset = Report.objects.select_related('generated_by')
     serializer_class = ReportSerializer
     pagination_class = StandardPagination
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
@@ -502,349 +358,146 @@ class ReportViewSet(viewsets.ModelViewSet):
     ordering_fields = ['created_at']
     ordering = ['-created_at']
     
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            queryset = queryset.defer('data')
+        return queryset
+    
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return ReportListSerializer
+        return ReportSerializer
+    
     def perform_create(self, serializer):
         """Set the generated_by user when creating a report"""
         serializer.save(generated_by=self.request.user)
     
+    def _enqueue(self, request, report_type, params=None, output='json'):
+        """Queue report generation and answer 202 with the job"""
+        job = jobs.enqueue(report_type, params, request.user, output)
+        serializer = ReportJobSerializer(job, context=self.get_serializer_context())
+        response = Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+        response['Location'] = serializer.data['status_url']
+        return response
+    
     @action(detail=False, methods=['post'])
     def generate_alumni_summary(self, request):
-        """Generate alumni summary report"""
-        total = Alumni.objects.count()
-        active = Alumni.objects.filter(status='active').count()
-        by_degree = dict(
-            Alumni.objects.values_list('degree').annotate(count=Count('id'))
-        )
-        
-        data = {
-            'total_alumni': total,
-            'active_alumni': active,
-            'inactive_alumni': total - active,
-            'by_degree': by_degree,
-        }
-        
-        report = Report.objects.create(
-            title='Alumni Summary Report',
-            report_type='alumni_summary',
-            data=data,
-            generated_by=request.user
-        )
-        serializer = self.get_serializer(report)
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        """Queue an alumni summary report"""
+        return self._enqueue(request, 'alumni_summary')
     
     @action(detail=False, methods=['post'])
     def generate_partner_summary(self, request):
-        """Generate partner summary report"""
-        total = Partner.objects.count()
-        by_type = dict(
-            Partner.objects.values_list('partner_type').annotate(count=Count('id'))
-        )
-        by_level = dict(
-            Partner.objects.values_list('engagement_level').annotate(count=Count('id'))
-        )
-        
-        data = {
-            'total_partners': total,
-            'by_type': by_type,
-            'by_engagement_level': by_level,
-        }
-        
-        report = Report.objects.create(
-            title='Partner Summary Report',
-            report_type='partner_summary',
-            data=data,
-            generated_by=request.user
-        )
-        serializer = self.get_serializer(report)
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        """Queue a partner summary report"""
+        return self._enqueue(request, 'partner_summary')
 
     @action(detail=False, methods=['post'])
     def generate_engagement_analytics(self, request):
-        """Generate engagement analytics report"""
-        total_engagements = Engagement.objects.count()
-        by_type = dict(
-            Engagement.objects.values_list('engagement_type').annotate(count=Count('id'))
-        )
-
-        # Top partners by engagements
-        top_partners_qs = Partner.objects.annotate(engagement_count=Count('engagements')).order_by('-engagement_count')[:10]
-        top_partners = [{ 'name': p.name, 'count': p.engagement_count } for p in top_partners_qs]
-
-        data = {
-            'total_engagements': total_engagements,
-            'by_type': by_type,
-            'top_partners': top_partners,
-        }
-
-        report = Report.objects.create(
-            title='Engagement Analytics Report',
-            report_type='engagement_analytics',
-            data=data,
-            generated_by=request.user
-        )
-        serializer = self.get_serializer(report)
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        """Queue an engagement analytics report"""
+        return self._enqueue(request, 'engagement_analytics')
 
     @action(detail=False, methods=['post'])
     def generate_filtered_report(self, request):
-        """Generate a filtered report for alumni or partners"""
+        """Queue a filtered report for alumni or partners"""
         scope = request.data.get('scope', 'alumni')
         filters = request.data.get('filters', {}) or {}
 
         if scope not in ['alumni', 'partners']:
             return Response({'error': 'Invalid scope'}, status=status.HTTP_400_BAD_REQUEST)
+        if not isinstance(filters, dict):
+            return Response({'error': 'filters must be an object'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            filterspec.compile_filters(scope, filters)
+        except ValidationError as exc:
+            return Response({'error': exc.messages[0]}, status=status.HTTP_400_BAD_REQUEST)
 
-        if scope == 'partners':
-            queryset = Partner.objects.all()
-            partner_type = filters.get('partner_type')
-            engagement_level = filters.get('engagement_level')
-            industry = filters.get('industry')
-
-            if partner_type:
-                queryset = queryset.filter(partner_type=partner_type)
-            if engagement_level:
-                queryset = queryset.filter(engagement_level=engagement_level)
-            if industry:
-                queryset = queryset.filter(industry__icontains=industry)
-
-            data = {
-                'scope': 'partners',
-                'filters': {
-                    'partner_type': partner_type,
-                    'engagement_level': engagement_level,
-                    'industry': industry,
-                },
-                'total_partners': queryset.count(),
-                'by_type': dict(queryset.values_list('partner_type').annotate(count=Count('id'))),
-                'by_engagement_level': dict(queryset.values_list('engagement_level').annotate(count=Count('id'))),
-            }
-
-            report = Report.objects.create(
-                title='Filtered Partner Report',
-                report_type='custom_filtered',
-                data=data,
-                generated_by=request.user
-            )
-            serializer = self.get_serializer(report)
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
-
-        queryset = Alumni.objects.all()
-        degree = filters.get('degree')
-        field_of_study = filters.get('field_of_study')
-        status_value = filters.get('status')
-        graduation_year = filters.get('graduation_year')
-        current_company = filters.get('current_company')
-        job_title = filters.get('job_title')
-        industry = filters.get('industry')
-
-        if degree:
-            queryset = queryset.filter(degree=degree)
-        if field_of_study:
-            queryset = queryset.filter(field_of_study__icontains=field_of_study)
-        if status_value:
-            queryset = queryset.filter(status=status_value)
-        if graduation_year:
-            queryset = queryset.filter(graduation_year=graduation_year)
-        if current_company:
-            queryset = queryset.filter(current_company__icontains=current_company)
-        if job_title:
-            queryset = queryset.filter(job_title__icontains=job_title)
-        if industry:
-            queryset = queryset.filter(industry__icontains=industry)
-
-        rows = list(
-            queryset.values(
-                'first_name',
-                'last_name',
-                'email',
-                'graduation_year',
-                'phone'
-            ).order_by('last_name', 'first_name')[:500]
-        )
+        return self._enqueue(request, 'custom_filtered', {'scope': scope, 'filters': filters})
 
-        data = {
-            'scope': 'alumni',
-            'filters': {
-                'degree': degree,
-                'field_of_study': field_of_study,
-                'status': status_value,
-                'graduation_year': graduation_year,
-                'current_company': current_company,
-                'job_title': job_title,
-                'industry': industry,
-            },
-            'total_alumni': queryset.count(),
-            'by_status': dict(queryset.values_list('status').annotate(count=Count('id'))),
-            'by_degree': dict(queryset.values_list('degree').annotate(count=Count('id'))),
-            'by_graduation_year': dict(queryset.values_list('graduation_year').annotate(count=Count('id'))),
-            'rows': rows,
-        }
-
-        report = Report.objects.create(
-            title='Filtered Alumni Report',
-            report_type='custom_filtered',
-            data=data,
-            generated_by=request.user
-        )
-        serializer = self.get_serializer(report)
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+    @action(detail=True, methods=['get'])
+    def rows(self, request, pk=None):
+        """Paginated result rows of a report, as objects keyed by the report's columns"""
+        report = self.get_object()
+        columns = (report.data or {}).get('columns') or []
+        # Paginate on ReportRow's own ordering (position), not the report list's
+        paginator = StandardPagination()
+        page = paginator.paginate_queryset(report.rows.only('pk', 'position', 'values'), request)
+        return paginator.get_paginated_response([dict(zip(columns, row.values)) for row in page])
 
     @action(detail=True, methods=['get'])
     def preview(self, request, pk=None):
         """Render a simple HTML preview for a report"""
         report = self.get_object()
+        rows = list(islice(reports.report_rows(report), PREVIEW_ROW_LIMIT))
         context = {
             'report': report,
             'generated_at': report.created_at or timezone.now(),
+            'preview_rows': rows,
+            'preview_truncated': (report.data or {}).get('row_count', 0) > len(rows),
         }
         return render(request, 'report_preview.html', context)
 
     @action(detail=True, methods=['get'])
     def download_pdf(self, request, pk=None):
-        """Download a PDF for an existing report"""
+        """Download a PDF for an existing report, rendered once and cached on disk"""
         report = self.get_object()
 
-        if not REPORTLAB_AVAILABLE:
+        digest = artifacts.fingerprint(report)
+        etag = f'"{digest}"'
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            resp = HttpResponseNotModified()
+            resp['ETag'] = etag
+            return resp
+
+        if not pdf.REPORTLAB_AVAILABLE:
             return Response({'error': 'reportlab not installed on server'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-        # Use table-based PDF for custom filtered reports
-        if report.report_type == 'custom_filtered':
-            pdf = _create_custom_filtered_pdf(report)
-        else:
-            lines = _report_lines(report)
-            pdf = _create_pdf_bytes(report.title, lines)
-        
-        if pdf is None:
+        handle = artifacts.open_pdf(report, digest)
+        if handle is None:
             return Response({'error': 'PDF generation failed'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-        resp = HttpResponse(pdf, content_type='application/pdf')
-        resp['Content-Disposition'] = f'attachment; filename="report_{report.id}.pdf"'
+        # FileResponse lets the WSGI server send the file with sendfile()
+        resp = FileResponse(
+            handle,
+            as_attachment=True,
+            filename=f"report_{report.id}.pdf",
+            content_type='application/pdf',
+        )
+        resp['ETag'] = etag
+        resp['Cache-Control'] = 'private, no-cache'
         return resp
 
     @action(detail=False, methods=['post'])
     def generate_alumni_summary_pdf(self, request):
-        """Generate alumni summary report and return PDF"""
-        # Build same data
-        total = Alumni.objects.count()
-        active = Alumni.objects.filter(status='active').count()
-        by_degree = dict(
-            Alumni.objects.values_list('degree').annotate(count=Count('id'))
-        )
-
-        data = {
-            'total_alumni': total,
-            'active_alumni': active,
-            'inactive_alumni': total - active,
-            'by_degree': by_degree,
-        }
-
-        report = Report.objects.create(
-            title='Alumni Summary Report',
-            report_type='alumni_summary',
-            data=data,
-            generated_by=request.user
-        )
-
-        # Create PDF
-        if not REPORTLAB_AVAILABLE:
-            return Response({'error': 'reportlab not installed on server'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        lines = [f"Total alumni: {data['total_alumni']}", f"Active alumni: {data['active_alumni']}", f"Inactive alumni: {data['inactive_alumni']}", "", 'By degree:']
-        for deg, cnt in data['by_degree'].items():
-            lines.append(f"- {deg}: {cnt}")
-
-        pdf = _create_pdf_bytes(report.title, lines)
-        if pdf is None:
-            return Response({'error': 'PDF generation failed'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        resp = HttpResponse(pdf, content_type='application/pdf')
-        resp['Content-Disposition'] = f'attachment; filename="report_{report.id}_alumni.pdf"'
-        return resp
+        """Queue an alumni summary report; the job links to its PDF when done"""
+        return self._enqueue(request, 'alumni_summary', output='pdf')
 
     @action(detail=False, methods=['post'])
     def generate_partner_summary_pdf(self, request):
-        """Generate partner summary report and return PDF"""
-        total = Partner.objects.count()
-        by_type = dict(
-            Partner.objects.values_list('partner_type').annotate(count=Count('id'))
-        )
-        by_level = dict(
-            Partner.objects.values_list('engagement_level').annotate(count=Count('id'))
-        )
-
-        data = {
-            'total_partners': total,
-            'by_type': by_type,
-            'by_engagement_level': by_level,
-        }
-
-        report = Report.objects.create(
-            title='Partner Summary Report',
-            report_type='partner_summary',
-            data=data,
-            generated_by=request.user
-        )
-
-        if not REPORTLAB_AVAILABLE:
-            return Response({'error': 'reportlab not installed on server'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        lines = [f"Total partners: {data['total_partners']}", "", 'By type:']
-        for t, cnt in data['by_type'].items():
-            lines.append(f"- {t}: {cnt}")
-        lines.append('')
-        lines.append('By engagement level:')
-        for lvl, cnt in data['by_engagement_level'].items():
-            lines.append(f"- {lvl}: {cnt}")
-
-        pdf = _create_pdf_bytes(report.title, lines)
-        if pdf is None:
-            return Response({'error': 'PDF generation failed'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        resp = HttpResponse(pdf, content_type='application/pdf')
-        resp['Content-Disposition'] = f'attachment; filename="report_{report.id}_partners.pdf"'
-        return resp
+        """Queue a partner summary report; the job links to its PDF when done"""
+        return self._enqueue(request, 'partner_summary', output='pdf')
 
     @action(detail=False, methods=['post'])
     def generate_engagement_analytics_pdf(self, request):
-        """Generate engagement analytics report and return PDF"""
-        total_engagements = Engagement.objects.count()
-        by_type = dict(
-            Engagement.objects.values_list('engagement_type').annotate(count=Count('id'))
-        )
-
-        top_partners_qs = Partner.objects.annotate(engagement_count=Count('engagements')).order_by('-engagement_count')[:10]
-        top_partners = [{ 'name': p.name, 'count': p.engagement_count } for p in top_partners_qs]
+        """Queue an engagement analytics report; the job links to its PDF when done"""
+        return self._enqueue(request, 'engagement_analytics', output='pdf')
 
-        data = {
-            'total_engagements': total_engagements,
-            'by_type': by_type,
-            'top_partners': top_partners,
-        }
-
-        report = Report.objects.create(
-            title='Engagement Analytics Report',
-            report_type='engagement_analytics',
-            data=data,
-            generated_by=request.user
-        )
 
-        if not REPORTLAB_AVAILABLE:
-            return Response({'error': 'reportlab not installed on server'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        lines = [f"Total engagements: {data['total_engagements']}", '', 'By type:']
-        for t, cnt in data['by_type'].items():
-            lines.append(f"- {t}: {cnt}")
-        lines.append('')
-        lines.append('Top partners:')
-        for p in data['top_partners']:
-            lines.append(f"- {p['name']}: {p['count']}")
-
-        pdf = _create_pdf_bytes(report.title, lines)
-        if pdf is None:
-            return Response({'error': 'PDF generation failed'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        resp = HttpResponse(pdf, content_type='application/pdf')
-        resp['Content-Disposition'] = f'attachment; filename="report_{report.id}_engagements.pdf"'
-        return resp
+class ReportJobViewSet(viewsets.ReadOnlyModelViewSet):
+    """Status of queued report jobs; clients poll a job until it has finished"""
+    serializer_class = ReportJobSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = StandardPagination
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
+    filterset_fields = ['status', 'report_type']
+    ordering_fields = ['created_at']
+    ordering = ['-created_at']
+    
+    def get_queryset(self):
+        queryset = ReportJob.objects.all()
+        user = self.request.user
+        if not (user.is_staff or user.is_superuser):
+            queryset = queryset.filter(requested_by=user)
+        return queryset
 
 
 @login_required
@@ -855,22 +508,21 @@ def alumni_summary_report(request):
         from django.http import HttpResponseForbidden
         return HttpResponseForbidden("You do not have permission to access this report.")
     
-    alumni_queryset = Alumni.objects.all()
-    
-    # Apply filters
     degree_filter = request.GET.get('degree', '')
     status_filter = request.GET.get('status', '')
     graduation_year_min = request.GET.get('graduation_year_min', '')
     graduation_year_max = request.GET.get('graduation_year_max', '')
     
-    if degree_filter:
-        alumni_queryset = alumni_queryset.filter(degree=degree_filter)
-    if status_filter:
-        alumni_queryset = alumni_queryset.filter(status=status_filter)
-    if graduation_year_min:
-        alumni_queryset = alumni_queryset.filter(graduation_year__gte=graduation_year_min)
-    if graduation_year_max:
-        alumni_queryset = alumni_queryset.filter(graduation_year__lte=graduation_year_max)
+    # Apply filters
+    try:
+        alumni_queryset = filterspec.compile_filters('alumni', {
+            'degree': degree_filter,
+            'status': status_filter,
+            'graduation_year_min': graduation_year_min,
+            'graduation_year_max': graduation_year_max,
+        })
+    except ValidationError as exc:
+        return HttpResponseBadRequest(exc.messages[0])
     
     # Get unique values for filter dropdowns
     degree_choices = Alumni.DEGREE_CHOICES
@@ -900,6 +552,47 @@ def analytics_view(request):
     return render(request, 'analytics.html', context)
 
 
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+@cached_response('analytics_overview', depends_on=('alumni', 'partner', 'engagement'))
+def analytics_overview(request):
+    """Grouped counts for the analytics dashboards, computed in the database"""
+    by_month = (
+        Engagement.objects.annotate(month=TruncMonth('engagement_date'))
+        .values_list('month').annotate(count=Count('id')).order_by('month')
+    )
+    top_partners = (
+        Partner.objects.filter(engagement_count__gt=0)
+        .order_by('-engagement_count', 'name')
+        .values('id', 'name', 'engagement_count')[:10]
+    )
+
+    snapshot = stats.read(
+        'alumni_total', 'partner_total', 'engagement_total',
+        'alumni_status', 'alumni_degree', 'alumni_graduation_year', 'alumni_industry',
+        'engagement_type',
+    )
+
+    data = {
+        'total_alumni': stats.total(snapshot, 'alumni'),
+        'total_partners': stats.total(snapshot, 'partner'),
+        'total_engagements': stats.total(snapshot, 'engagement'),
+        'alumni_by_status': snapshot['alumni_status'],
+        'alumni_by_degree': snapshot['alumni_degree'],
+        'alumni_by_graduation_year': snapshot['alumni_graduation_year'],
+        'alumni_by_industry': snapshot['alumni_industry'],
+        'engagements_by_type': snapshot['engagement_type'],
+        'engagements_by_month': {
+            month.strftime('%Y-%m'): count for month, count in by_month if month
+        },
+        'top_partners': [
+            {'id': p['id'], 'name': p['name'], 'count': p['engagement_count']}
+            for p in top_partners
+        ],
+    }
+    return Response(data)
+
+
 @login_required
 def alumni_summary_report_pdf(request):
     """Generate PDF for Alumni Summary Report with filters"""
@@ -908,117 +601,77 @@ def alumni_summary_report_pdf(request):
         from django.http import HttpResponseForbidden
         return HttpResponseForbidden("You do not have permission to access this report.")
     
-    alumni_queryset = Alumni.objects.all()
-    
-    # Apply filters
     degree_filter = request.GET.get('degree', '')
     status_filter = request.GET.get('status', '')
     graduation_year_min = request.GET.get('graduation_year_min', '')
     graduation_year_max = request.GET.get('graduation_year_max', '')
     
-    if degree_filter:
-        alumni_queryset = alumni_queryset.filter(degree=degree_filter)
-    if status_filter:
-        alumni_queryset = alumni_queryset.filter(status=status_filter)
-    if graduation_year_min:
-        alumni_queryset = alumni_queryset.filter(graduation_year__gte=graduation_year_min)
-    if graduation_year_max:
-        alumni_queryset = alumni_queryset.filter(graduation_year__lte=graduation_year_max)
-    
-    # Create PDF
-    buffer = io.BytesIO()
-    c = canvas.Canvas(buffer, pagesize=letter)
-    width, height = letter
-    y = height - 72
-    
-    # Title
-    c.setFont('Helvetica-Bold', 20)
-    c.drawString(72, y, 'Alumni Summary Report')
-    y -= 28
-    
-    # Generate timestamp
-    c.setFont('Helvetica', 10)
-    c.drawString(72, y, f'Generated on: {timezone.now().strftime("%B %d, %Y at %H:%M:%S")}')
-    y -= 14
-    
-    # Summary
-    c.setFont('Helvetica-Bold', 12)
-    c.drawString(72, y, 'Report Summary')
-    y -= 16
-    c.setFont('Helvetica', 10)
-    
-    summary_lines = [
-        f"Total Alumni: {alumni_queryset.count()}",
-        f"Degree Filter: {degree_filter or 'All'}",
-        f"Status Filter: {status_filter or 'All'}",
-        f"Graduation Year: {graduation_year_min or 'Any'} - {graduation_year_max or 'Any'}",
+    # Apply filters
+    try:
+        alumni_queryset = filterspec.compile_filters('alumni', {
+            'degree': degree_filter,
+            'status': status_filter,
+            'graduation_year_min': graduation_year_min,
+            'graduation_year_max': graduation_year_max,
+        })
+    except ValidationError as exc:
+        return HttpResponseBadRequest(exc.messages[0])
+    
+    if not pdf.REPORTLAB_AVAILABLE:
+        return HttpResponse('reportlab not installed on server', status=500)
+    
+    preamble = [
+        (f'Generated on: {timezone.now().strftime("%B %d, %Y at %H:%M:%S")}', 'Normal'),
+        ('<b>Report Summary</b>', 'Heading4'),
+        (f"Total Alumni: {alumni_queryset.count()}", 'Normal'),
+        (f"Degree Filter: {degree_filter or 'All'}", 'Normal'),
+        (f"Status Filter: {status_filter or 'All'}", 'Normal'),
+        (f"Graduation Year: {graduation_year_min or 'Any'} - {graduation_year_max or 'Any'}", 'Normal'),
     ]
     
-    for line in summary_lines:
-        if y < 72:
-            c.showPage()
-            y = height - 72
-        c.drawString(72, y, line)
-        y -= 14
-    
-    y -= 14
-    
-    # Table header
-    c.setFont('Helvetica-Bold', 9)
-    col_widths = [80, 100, 60, 80, 60, 120]
-    cols = ['Name', 'Email', 'Degree', 'Field of Study', 'Grad Year', 'Company']
-    x = 72
-    for col, width in zip(cols, col_widths):
-        c.drawString(x, y, col)
-        x += width
-    y -= 14
-    
-    # Table data
-    c.setFont('Helvetica', 8)
-    for alumnus in alumni_queryset[:50]:  # Limit to first 50 for PDF
-        if y < 72:
-            c.showPage()
-            y = height - 72
-        
-        name = f"{alumnus.first_name} {alumnus.last_name}"[:15]
-        email = (alumnus.email or '')[:20]
-        degree = alumnus.get_degree_display()[:10]
-        field = alumnus.field_of_study[:15]
-        year = str(alumnus.graduation_year)
-        company = (alumnus.current_company or '')[:15]
-        
-        x = 72
-        for col, width in zip([name, email, degree, field, year, company], col_widths):
-            c.drawString(x, y, col)
-            x += width
-        y -= 12
-    
-    c.showPage()
-    c.save()
+    degree_labels = dict(Alumni.DEGREE_CHOICES)
+    rows = (
+        [
+            f"{first_name} {last_name}"[:25],
+            (email or '')[:30],
+            degree_labels.get(degree, degree)[:12],
+            (field_of_study or '')[:20],
+            str(graduation_year),
+            (company or '')[:25],
+        ]
+        for first_name, last_name, email, degree, field_of_study, graduation_year, company in (
+            alumni_queryset.order_by('last_name', 'first_name', 'pk').values_list(
+                'first_name', 'last_name', 'email', 'degree', 'field_of_study',
+                'graduation_year', 'current_company',
+            ).iterator(chunk_size=2000)
+        )
+    )
     
-    pdf = buffer.getvalue()
-    buffer.close()
+    # Rendered to a temporary file so large reports are not held in memory twice
+    output = tempfile.TemporaryFile()
+    pdf.render_table(
+        output,
+        'Alumni Summary Report',
+        preamble,
+        ['Name', 'Email', 'Degree', 'Field of Study', 'Grad Year', 'Company'],
+        [100, 130, 60, 90, 50, 110],
+        rows,
+    )
+    output.seek(0)
     
-    resp = HttpResponse(pdf, content_type='application/pdf')
-    resp['Content-Disposition'] = 'attachment; filename="alumni_summary_report.pdf"'
-    return resp
+    return FileResponse(
+        output,
+        as_attachment=True,
+        filename='alumni_summary_report.pdf',
+        content_type='application/pdf',
+    )
 
 
 # Admin Dashboard Views
 def admin_dashboard_view(request):
     """Render the admin dashboard template - admin users only"""
-    from rest_framework.authtoken.models import Token
-
     # Resolve user with token auth taking priority over session
-    user = request.user
-    auth_header = request.META.get('HTTP_AUTHORIZATION', '')
-    if auth_header.startswith('Token '):
-        token_key = auth_header.split(' ')[1]
-        try:
-            token = Token.objects.get(key=token_key)
-            user = token.user
-        except Token.DoesNotExist:
-            pass
+    user = user_from_header(request) or request.user
     
     # Redirect to login if not authenticated
     if not user.is_authenticated:
@@ -1039,24 +692,39 @@ import csv
 
 @api_view(['GET'])
 @permission_classes([IsAdminUser])
-def admin_users_list(request):
-    """List all users for admin management"""
-    users = User.objects.all().order_by('-date_joined')
-    data = [{
-        'alumni_status': user.alumni_profile.status if hasattr(user, 'alumni_profile') and user.alumni_profile else None,
-        'alumni_status_display': user.alumni_profile.get_status_display() if hasattr(user, 'alumni_profile') and user.alumni_profile else None,
-        'id': user.id,
-        'username': user.username,
-        'email': user.email,
-        'first_name': user.first_name,
-        'last_name': user.last_name,
-        'is_staff': user.is_staff,
-        'is_superuser': user.is_superuser,
-        'is_active': user.is_active,
-        'date_joined': user.date_joined,
-        'last_login': user.last_login
-    } for user in users]
-    return Response(data)
+def admin_cache_stats(request):
+    """Hit/miss counters for cached read endpoints - admin only"""
+    return Response(response_cache.cache_stats())
+
+
+class AdminUserListView(generics.ListAPIView):
+    """Users for admin management, keyset-paginated with their alumni status joined in.
+
+    The first page (no cursor) also carries `count` and `active_count` for
+    the filtered list, computed in one aggregate query.
+    """
+    queryset = User.objects.select_related('alumni_profile').only(
+        'id', 'username', 'email', 'first_name', 'last_name', 'is_staff', 'is_superuser',
+        'is_active', 'date_joined', 'last_login', 'alumni_profile__id', 'alumni_profile__status',
+    )
+    serializer_class = AdminUserSerializer
+    permission_classes = [IsAdminUser]
+    pagination_class = KeysetListPagination
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filterset_fields = ['is_active', 'is_staff', 'is_superuser', 'alumni_profile__status']
+    search_fields = ['username', 'email', 'first_name', 'last_name']
+    ordering_fields = ['date_joined', 'last_login', 'username']
+    # Ids follow join order and walk the primary key index
+    ordering = ['-id']
+    
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        if KeysetPagination.cursor_query_param not in request.query_params:
+            counts = self.filter_queryset(self.get_queryset()).aggregate(
+                count=Count('pk'), active_count=Count('pk', filter=Q(is_active=True)),
+            )
+            response.data = {**counts, **response.data}
+        return response
 
 
 @api_view(['POST'])
@@ -1069,11 +737,11 @@ def admin_toggle_user_status(request, user_id):
         user.save()
         
         # Create audit log
-        Report.objects.create(
-            title=f"User {'Activated' if user.is_active else 'Deactivated'}: {user.username}",
-            report_type='audit',
-            description=f"Status changed by {request.user.username}",
-            generated_by=request.user
+        audit.record(
+            request.user, 'update', f"User {'Activated' if user.is_active else 'Deactivated'}: {user.username}",
+            obj=user,
+            detail=f"Status changed by {request.user.username}",
+            changes={'is_active': [not user.is_active, user.is_active]},
         )
         
         return Response({'success': True, 'is_active': user.is_active})
@@ -1081,19 +749,17 @@ def admin_toggle_user_status(request, user_id):
         return Response({'error': 'User not found'}, status=404)
 
 
-@api_view(['GET'])
-@permission_classes([IsAdminUser])
-def admin_audit_logs(request):
-    """Get audit logs from Report model"""
-    logs = Report.objects.filter(report_type='audit').order_by('-created_at')[:100]
-    data = [{
-        'id': log.id,
-        'title': log.title,
-        'description': log.description,
-        'generated_by_username': log.generated_by.username if log.generated_by else 'System',
-        'created_at': log.created_at
-    } for log in logs]
-    return Response(data)
+class AdminAuditLogListView(generics.ListAPIView):
+    """Audit events, newest first, keyset-paginated"""
+    queryset = AuditEvent.objects.all()
+    serializer_class = AuditEventSerializer
+    permission_classes = [IsAdminUser]
+    pagination_class = KeysetListPagination
+    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filterset_fields = ['action', 'object_type', 'object_id', 'actor']
+    search_fields = ['summary', 'actor_username']
+    ordering_fields = ['created_at']
+    ordering = ['-created_at']
 
 
 @api_view(['POST'])
@@ -1103,9 +769,10 @@ def admin_alumni_bulk_action(request):
     status_filter = request.data.get('status_filter', '')
     action = request.data.get('action', '')
     
-    queryset = Alumni.objects.all()
-    if status_filter:
-        queryset = queryset.filter(status=status_filter)
+    try:
+        queryset = filterspec.compile_filters('alumni', {'status': status_filter})
+    except ValidationError as exc:
+        return Response({'error': exc.messages[0]}, status=400)
     
     updated = 0
     if action == 'mark_active':
@@ -1116,11 +783,10 @@ def admin_alumni_bulk_action(request):
         updated = queryset.update(status='lost_contact')
     
     # Create audit log
-    Report.objects.create(
-        title=f"Alumni Bulk Action: {action}",
-        report_type='audit',
-        description=f"Applied to {updated} alumni by {request.user.username}. Filter: {status_filter or 'all'}",
-        generated_by=request.user
+    audit.record(
+        request.user, 'bulk_update', f"Alumni Bulk Action: {action}",
+        object_type='alumni',
+        detail=f"Applied to {updated} alumni by {request.user.username}. Filter: {status_filter or 'all'}",
     )
     
     return Response({'success': True, 'updated': updated})
@@ -1139,14 +805,15 @@ def admin_update_alumni_status(request, alumni_id):
     except Alumni.DoesNotExist:
         return Response({'error': 'Alumni not found'}, status=404)
 
+    previous = alumni.status
     alumni.status = status_value
     alumni.save(update_fields=['status', 'updated_at'])
 
-    Report.objects.create(
-        title=f"Alumni Status Updated: {alumni.first_name} {alumni.last_name}",
-        report_type='audit',
-        description=f"Status set to {status_value} by {request.user.username}",
-        generated_by=request.user
+    audit.record(
+        request.user, 'status_change', f"Alumni Status Updated: {alumni.first_name} {alumni.last_name}",
+        obj=alumni,
+        detail=f"Status set to {status_value} by {request.user.username}",
+        changes={'status': [previous, status_value]},
     )
 
     return Response({'success': True, 'status': alumni.status})
@@ -1174,63 +841,85 @@ def admin_partner_bulk_action(request):
         updated = queryset.update(engagement_level='prospective')
     
     # Create audit log
-    Report.objects.create(
-        title=f"Partner Bulk Action: {action}",
-        report_type='audit',
-        description=f"Applied to {updated} partners by {request.user.username}. Filter: {level_filter or 'all'}",
-        generated_by=request.user
+    audit.record(
+        request.user, 'bulk_update', f"Partner Bulk Action: {action}",
+        object_type='partner',
+        detail=f"Applied to {updated} partners by {request.user.username}. Filter: {level_filter or 'all'}",
     )
     
     return Response({'success': True, 'updated': updated})
 
 
+class _Echo:
+    """Pseudo-buffer for csv.writer that hands each formatted row straight back"""
+
+    def write(self, value):
+        return value
+
+
+EXPORT_CHUNK_SIZE = 2000
+
+
+def _stream_csv(header, rows):
+    """Yield CSV-formatted lines for a header and an iterable of row tuples"""
+    writer = csv.writer(_Echo())
+    yield writer.writerow(header)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def _export_rows(data_type):
+    """Return (header, row iterator) for an export, streamed from a single query"""
+    if data_type == 'alumni':
+        header = ['First Name', 'Last Name', 'Email', 'Phone', 'Degree', 'Field of Study',
+                  'Graduation Year', 'Current Company', 'Job Title', 'Industry', 'Status']
+        rows = Alumni.objects.order_by('pk').values_list(
+            'first_name', 'last_name', 'email', 'phone', 'degree', 'field_of_study',
+            'graduation_year', 'current_company', 'job_title', 'industry', 'status'
+        ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        return header, (
+            (first, last, email, phone or '', *rest)
+            for first, last, email, phone, *rest in rows
+        )
+
+    if data_type == 'partners':
+        header = ['Name', 'Type', 'Engagement Level', 'Industry', 'Email', 'Phone',
+                  'Primary Contact', 'City', 'Country', 'Partnership Start Date']
+        rows = Partner.objects.order_by('pk').values_list(
+            'name', 'partner_type', 'engagement_level', 'industry', 'email', 'phone',
+            'primary_contact_name', 'city', 'country', 'partnership_start_date'
+        ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        return header, (
+            (name, partner_type, level, *(value or '' for value in rest))
+            for name, partner_type, level, *rest in rows
+        )
+
+    if data_type == 'engagements':
+        header = ['Alumni', 'Partner', 'Type', 'Date', 'Description', 'Notes']
+        type_labels = dict(Engagement.ENGAGEMENT_TYPE_CHOICES)
+        rows = Engagement.objects.order_by('pk').values_list(
+            'alumni__first_name', 'alumni__last_name', 'partner__name',
+            'engagement_type', 'engagement_date', 'description', 'notes'
+        ).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        return header, (
+            (f"{first} {last}", partner, type_labels.get(kind, kind), date, description, notes)
+            for first, last, partner, kind, date, description, notes in rows
+        )
+
+    return None, ()
+
+
 @api_view(['GET'])
 @permission_classes([IsAdminUser])
 def admin_export_data(request, data_type):
-    """Export data as CSV"""
-    response = HttpResponse(content_type='text/csv')
-    response['Content-Disposition'] = f'attachment; filename="{data_type}_export.csv"'
-    
-    writer = csv.writer(response)
-    
-    if data_type == 'alumni':
-        writer.writerow(['First Name', 'Last Name', 'Email', 'Phone', 'Degree', 'Field of Study', 
-                        'Graduation Year', 'Current Company', 'Job Title', 'Industry', 'Status'])
-        for alumni in Alumni.objects.all():
-            writer.writerow([
-                alumni.first_name, alumni.last_name, alumni.email, alumni.phone or '',
-                alumni.degree, alumni.field_of_study, alumni.graduation_year,
-                alumni.current_company, alumni.job_title, alumni.industry, alumni.status
-            ])
-    
-    elif data_type == 'partners':
-        writer.writerow(['Name', 'Type', 'Engagement Level', 'Industry', 'Email', 'Phone', 
-                        'Primary Contact', 'City', 'Country', 'Partnership Start Date'])
-        for partner in Partner.objects.all():
-            writer.writerow([
-                partner.name, partner.partner_type, partner.engagement_level, partner.industry or '',
-                partner.email or '', partner.phone or '', partner.primary_contact_name or '',
-                partner.city or '', partner.country or '', partner.partnership_start_date or ''
-            ])
-    
-    elif data_type == 'engagements':
-        writer.writerow(['Alumni', 'Partner', 'Type', 'Date', 'Description', 'Notes'])
-        for engagement in Engagement.objects.all():
-            writer.writerow([
-                f"{engagement.alumni.first_name} {engagement.alumni.last_name}",
-                engagement.partner.name,
-                engagement.get_engagement_type_display(),
-                engagement.engagement_date,
-                engagement.description,
-                engagement.notes
-            ])
+    """Export data as CSV, streamed row by row with bounded memory"""
+    header, rows = _export_rows(data_type)
     
     # Create audit log
-    Report.objects.create(
-        title=f"Data Export: {data_type}",
-        report_type='audit',
-        description=f"Exported by {request.user.username}",
-        generated_by=request.user
-    )
+    audit.record(request.user, 'export', f"Data Export: {data_type}", object_type=data_type,
+                 detail=f"Exported by {request.user.username}")
     
+    content = _stream_csv(header, rows) if header else iter(())
+    response = StreamingHttpResponse(content, content_type='text/csv')
+    response['Content-Disposition'] = f'attachment; filename="{data_type}_export.csv"'
     return response